@@ -2,7 +2,7 @@ __doc__ = '''
 Program to show data structure visualizations in a single application.
 '''
 
-import sys, os
+import sys, os, argparse, subprocess
 
 try:
     if not hasattr(sys, 'path'): sys.path = []
@@ -18,10 +18,45 @@ except:
 
 from PythonVisualizations import runAllVisualizationsMenu
 
+# Program run in a fresh interpreter to time finding the visualizations
+TIMING_PROGRAM = '''
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {parent!r})
+from PythonVisualizations.allVisualizationsCommon import *
+classes = findVisualizations([{dirname!r}], manifest=MANIFEST)
+print(time.perf_counter() - start, len(classes))
+'''
+
+def timeStartup(dirname):
+    '''Time finding the visualizations in new processes, first after
+    removing the manifest and then with the manifest it wrote.'''
+    program = TIMING_PROGRAM.format(
+        dirname=dirname, parent=os.path.dirname(dirname))
+    manifest = runAllVisualizationsMenu.MANIFEST
+    if os.path.exists(manifest):
+        os.remove(manifest)
+    for start in ('Cold', 'Warm'):
+        elapsed, count = subprocess.run(
+            [sys.executable, '-c', program], check=True, capture_output=True,
+            text=True).stdout.split()
+        print('{} start found {} visualizations in {:.3f} seconds'.format(
+            start, count, float(elapsed)))
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--timing', default=False, action='store_true',
+        help='Report the time to find the visualizations on a cold start '
+        'and on a warm start using the manifest, then exit.')
+    args = parser.parse_args()
     dirname = None
     for path in sys.path:
         if os.path.isdir(os.path.join(path, 'PythonVisualizations')):
             dirname = os.path.join(path, 'PythonVisualizations')
-    runAllVisualizationsMenu.showVisualizations(
-        runAllVisualizationsMenu.findVisualizations([dirname]))
+    if args.timing:
+        timeStartup(dirname)
+    else:
+        runAllVisualizationsMenu.showVisualizations(
+            runAllVisualizationsMenu.findVisualizations(
+                [dirname], manifest=runAllVisualizationsMenu.MANIFEST))
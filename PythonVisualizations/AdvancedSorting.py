@@ -759,7 +759,7 @@ def shellSort(self):
         quicksortButton = self.addOperation(
             "Quicksort", lambda: self.clickQuicksort(), maxRows=maxRows,
             helpText='Sort items using quicksort algorithm')
-        self.useMedianOf3 = IntVar()
+        self.useMedianOf3 = IntVar(self.window)
         self.useMedianOf3.set(1)
         useMedianOf3Button = self.addOperation(
             "Use median of 3", self.clickUseMedianOf3, buttonType=Checkbutton,
@@ -455,8 +455,8 @@ class BinaryTreeBase(VisualizationApp):
             radius=radius)
         delta = (highlightWidth, highlightWidth)
         highlightCoords = (V(nCoords[:2]) - delta) + (V(nCoords[2:]) + delta)
-        return self.canvas.create_oval(
-            *highlightCoords, fill=None, outline=color, width=highlightWidth)
+        return self.createPooledItem(
+            'oval', *highlightCoords, outline=color, width=highlightWidth)
         
     # calculate the coordinates for the line from a node to its parent
     def lineCoordinates(self, node, parent=None):
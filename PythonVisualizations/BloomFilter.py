@@ -366,13 +366,13 @@ class BloomFilter(HashBase):
             helpText='Create new filter for #keys, #hashes, & false positive%',
             argHelpText=['number of keys', 'number of hashes',
                          'false positive probability'])
-        self.showHashing = IntVar()
+        self.showHashing = IntVar(self.window)
         self.showHashing.set(1)
         showHashingButton = self.addOperation(
             "Animate hashing", self.clickShowHashing, buttonType=Checkbutton,
             variable=self.showHashing, cleanUpBefore=False,
             helpText='Show/hide animation during hashing')
-        self.showInserts = IntVar()
+        self.showInserts = IntVar(self.window)
         self.showInserts.set(1)
         self.showInsertsButton = self.addOperation(
             "Show inserted", self.clickShowInserts, buttonType=Checkbutton,
@@ -101,15 +101,15 @@ class GraphBase(VisualizationApp):
     def createAdjacencyMatrixPanel(
             self, suffix=' Adjacency Matrix', anchor=SE):
         newTitle = self.title + suffix
-        self.adjacencyMatrixPanel = Toplevel()
+        self.adjacencyMatrixPanel = self.backend.Toplevel(self.window)
         self.adjacencyMatrixPanel.title(newTitle)
-        self.adjMatControlBar = Frame(self.adjacencyMatrixPanel)
+        self.adjMatControlBar = self.backend.Frame(self.adjacencyMatrixPanel)
         self.adjMatControlBar.pack(side=TOP)
-        panelTitle = Label(self.adjMatControlBar, text='Adjacency\nMatrix',
-                           font=self.ADJACENCY_MATRIX_FONT)
+        panelTitle = self.backend.Label(
+            self.adjMatControlBar, text='Adjacency\nMatrix', font=self.ADJACENCY_MATRIX_FONT)
         panelTitle.pack(side=LEFT)
         self.createAdjacencyMatrixControlImages()
-        self.matrixExpose = Button(
+        self.matrixExpose = self.backend.Button(
             self.adjMatControlBar, image=self.adjMatControlImages['collapse'],
             command=self.toggleAdjacencyMatrixDisplay, takefocus=False,
             width=20)
@@ -117,7 +117,7 @@ class GraphBase(VisualizationApp):
         self.matrixExpose.pack(side=LEFT, expand=False, fill=Y)
         self.buttonPadX = int(self.window.winfo_fpixels(
             self.matrixExpose['padx']))
-        self.adjMatrixFrame = Frame(
+        self.adjMatrixFrame = self.backend.Frame(
             self.adjacencyMatrixPanel, bg=self.ADJACENCY_MATRIX_BG)
         self.adjMatrixFrame.pack(side=TOP, expand=FALSE, fill=None)
 
@@ -141,7 +141,8 @@ class GraphBase(VisualizationApp):
         targetSize = (height, height)
         names = ('collapse', 'uncollapse')
         self.adjMatControlImages = dict(
-            (name, getPhotoImage(name + '-symbol.png', targetSize))
+            (name,
+             self.backend.photoImage(name + '-symbol.png', targetSize))
             for name in names)
         return self.adjMatControlImages
             
@@ -215,7 +216,7 @@ class GraphBase(VisualizationApp):
                     '<{}>'.format(event), genericEventHandler(), '+')
         for cell in self.adjMatrixFrame.grid_slaves():
             cell.grid_forget()
-        self.adjMatrix00 = Frame(self.adjMatrixFrame, bg='white')
+        self.adjMatrix00 = self.backend.Frame(self.adjMatrixFrame, bg='white')
         self.adjMatrix00.grid(row=0, column=0, sticky=(N, E, S, W))
         self.selectedVertices = [None for _ in range(self.selectableVertices)]
         self.dragItems = None
@@ -772,11 +773,11 @@ class GraphBase(VisualizationApp):
             self.canvas.tag_bind(item, '<Button-1>',
                                  lambda e: self.setArgument(label))
 
-        columnLabel = Label(
+        columnLabel = self.backend.Label(
             self.adjMatrixFrame, text=label, bg=vertColor,
             font=self.ADJACENCY_MATRIX_FONT)
         columnLabel.grid(row=0, column=self.nextID, sticky=(N, E, S, W))
-        rowLabel = Label(
+        rowLabel = self.backend.Label(
             self.adjMatrixFrame, text=label, bg=vertColor,
             font=self.ADJACENCY_MATRIX_FONT)
         rowLabel.grid(row=self.nextID, column=0, sticky=(N, E, S, W))
@@ -784,7 +785,7 @@ class GraphBase(VisualizationApp):
         columnIDs = [vert.val[1]]
         for otherVert in self.vertices.values():
             if vert == otherVert:
-                frame = Frame(self.adjMatrixFrame, bg=vertColor)
+                frame = self.backend.Frame(self.adjMatrixFrame, bg=vertColor)
                 frame.grid(row=self.nextID, column=self.nextID, 
                                sticky=(N, E, S, W))
             else:
@@ -857,11 +858,11 @@ class GraphBase(VisualizationApp):
 
     def createEdgeWeightEntry(self, color, edge, weight=None, parent=None):
         if self.weighted:
-            entry = Entry(parent or self.adjMatrixFrame, bg=color,
-                          font=self.ADJACENCY_MATRIX_FONT, width=2,
-                          state=NORMAL,
-                          takefocus=False, validate='key', 
-                          validatecommand=self.weightValidate)
+            entry = self.backend.Entry(
+                parent or self.adjMatrixFrame, bg=color,
+                font=self.ADJACENCY_MATRIX_FONT, width=2, state=NORMAL,
+                takefocus=False, validate='key', 
+                validatecommand=self.weightValidate)
             self.weight(entry, weight)
             def edgeWeightChange(event):
                 if not (isinstance(edge, tuple) and len(edge) == 2):
@@ -894,9 +895,9 @@ class GraphBase(VisualizationApp):
                        self.weight(event.widget, self.edgeWeight(*edge)) or
                        event.widget.configure(bg=color), '+')
         else:
-            entry = Button(self.adjMatrixFrame, bg=color,
-                           text='', font=self.ADJACENCY_MATRIX_FONT,
-                           state=NORMAL, takefocus=False)
+            entry = self.backend.Button(
+                self.adjMatrixFrame, bg=color, text='',
+                font=self.ADJACENCY_MATRIX_FONT, state=NORMAL, takefocus=False)
             def toggleEdge():
                 if not self.operationMutex.acquire(blocking=False):
                     self.setMessage('Cannot change edge during other operation')
@@ -1074,7 +1075,7 @@ class GraphBase(VisualizationApp):
         self.newGraphButton = self.addOperation(
             "New Graph", self.clickNewGraph,
             helpText='Create new, empty graph')
-        self.bidirectionalEdges = IntVar()
+        self.bidirectionalEdges = IntVar(self.window)
         self.bidirectionalEdges.set(
             1 if bidirectional is None or bidirectional else 0)
         self.bidirectionalEdgesButton = self.addOperation(
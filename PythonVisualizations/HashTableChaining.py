@@ -1210,7 +1210,7 @@ def traverse(self):
             "Random fill", self.clickRandomFill, numArguments=1,
             validationCmd=vcmd, helpText='Fill with N random items',
             argHelpText=['number of items'])
-        self.showHashing = IntVar()
+        self.showHashing = IntVar(self.window)
         self.showHashing.set(1)
         showHashingButton = self.addOperation(
             "Animate hashing", self.clickShowHashing, buttonType=Checkbutton,
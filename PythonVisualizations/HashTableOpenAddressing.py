@@ -882,13 +882,13 @@ def traverse(self):
             "Random fill", self.clickRandomFill, numArguments=1,
             validationCmd=vcmd, helpText='Fill with N random items',
             argHelpText=['number of items'])
-        self.showHashing = IntVar()
+        self.showHashing = IntVar(self.window)
         self.showHashing.set(1)
         showHashingButton = self.addOperation(
             "Animate hashing", self.clickShowHashing, buttonType=Checkbutton,
             variable=self.showHashing, 
             helpText='Show/hide animation during hashing')
-        self.probeChoice = StringVar()
+        self.probeChoice = StringVar(self.window)
         self.probeChoice.set(self.probe.__name__)
         self.probeChoiceButtons = [
             self.addOperation(
@@ -1,5 +1,20 @@
 import sys
+import math
 import random
+from array import array
+
+_np = None                  # NumPy is optional.  When present, it is
+__numpyChecked = False      # imported to hash the first batch of keys
+
+def __importNumPy():        # Import NumPy the first time it's needed
+   global _np, __numpyChecked # and return it, or None if it's missing
+   if not __numpyChecked:
+      __numpyChecked = True
+      try:
+         import numpy as _np
+      except ModuleNotFoundError:
+         pass
+   return _np
 
 def encode_letter(letter):  # Encode letters a thru z as 1 thru 26
    letter = letter.lower()  # Treat uppercase as lower case
@@ -38,24 +53,42 @@ def hashString3(key, size): # Use Horner's method to hash a string
       total = ((total << 8) + ord(key[i])) % size # and use modulo
    return total             # Return sum
 
-# Set up an empty array of random 64-bit values to be used by bitHash
-# There will be a 64 bit field for every Unicode character
+# Set up arrays of random 64-bit values to be used by bitHash
+# There will be a 64 bit field for every Unicode character, kept in pages
+# of 2**16 characters, one page per Unicode plane.  The random bits are
+# generated in order, so the pages must be made in order, but only the
+# first page, the Basic Multilingual Plane, is made before it is needed
 __maxUnicode = 0x10FFFF
-__bitArray = [0] * (__maxUnicode + 1)
+__pageBits = 16
 __64bits = (1 << 64) - 1
 __16bits = (1 << 16) - 1
 
-# Seed the random number generator to produce repeatable results
-random.seed("bitHash random numbers") 
+# Seed a random number generator to produce repeatable results
+__bitRandom = random.Random("bitHash random numbers")
+__bitPages = []
+
+def __makeBitPages(page):   # Make pages of random bits through page
+   while len(__bitPages) <= page: # Fill the next page with 64-bit
+      bits = array('Q')     # sequences from one call to the generator
+      bits.frombytes(__bitRandom.getrandbits(64 << __pageBits).to_bytes(
+         8 << __pageBits, 'little')) # Split into 64-bit values
+      if sys.byteorder != 'little': # in the order they were made
+         bits.byteswap()
+      __bitPages.append(bits)
+   return __bitPages[page]
+
+__bitArray = __makeBitPages(0)
 
-for i in range(len(__bitArray)): # Fill the bit array with random
-    __bitArray[i] = random.getrandbits(64) # 64-bit sequences
+def __bitsFor(code):        # Get the random bits for a character code
+   return __makeBitPages(code >> __pageBits)[code & __16bits]
 
 def bitHash(key, h=0):      # Hash an arbitrary key into 64 bits
    if isinstance(key, str): # by rotating and xor'ing bits
       for c in key:         # Exclusive-or rotated hash with bits
+         code = ord(c)
          h = (((h << 1) | (h >> 63)) ^ # from string character
-               __bitArray[ord(c)]) & __64bits # keeping 64 bits
+               (__bitArray[code] if code <= __16bits else
+                __bitsFor(code))) & __64bits # keeping 64 bits
    elif isinstance(key, int): # Exclusive-or bits of integers
       h = (((h << 1) | (h >> 63)) ^ # by hashing 16-bit fields 
            __bitArray[key & __16bits])
@@ -92,9 +125,209 @@ def multiplicativeHash(key, h=0): # Hash an arbitrary key into 64 bits
          h = multiplicativeHash(elem, h)
    return h
 
+# Batch hashing: each function hashes a sequence of keys, or a NumPy array
+# of integers or fixed-width strings, and returns the same values as the
+# hash function applied to each key.  With NumPy, the rotate, xor, and
+# multiply steps are done for all the keys at once, one character or
+# 16-bit field at a time, and the result is an array of unsigned 64-bit
+# integers.  When some hash values need more bits, or the keys can't be
+# put in such arrays, or NumPy is missing, the result is a list of Python
+# ints.  Like NumPy, the batches ignore null characters at the end of
+# strings in NumPy arrays.
+#
+# The batches are faster than hashing one key at a time when they return
+# arrays: hashString3, bitHash, and multiplicativeHash on strings, and
+# bitHash on integers.  hashString1 and hashString2 only fit in 64 bits
+# for strings of up to 8 characters, and multiplicativeHash on integers
+# makes 128-bit values, so those batches usually return lists and run at
+# about the speed of hashing one key at a time.
+
+def hashStrings1(keys):     # Hash a batch of strings with hashString1
+   codes = __hornerCodes(keys)
+   if codes is None:
+      return __hashEach(hashString1, keys)
+   codes, lengths = codes   # Padding after strings adds leading zeros
+   total = _np.zeros(len(codes), dtype=_np.uint64)
+   for j in range(codes.shape[1] - 1, -1, -1): # Go in reverse order
+      total = total * _np.uint64(256) + codes[:, j]
+   return total
+
+def hashStrings2(keys):     # Hash a batch of strings with hashString2
+   codes = __hornerCodes(keys)
+   if codes is None:
+      return __hashEach(hashString2, keys)
+   codes, lengths = codes
+   total = _np.zeros(len(codes), dtype=_np.uint64)
+   for j in range(codes.shape[1]): # Shift and add characters in each key
+      total = _np.where(j < lengths, (total << _np.uint64(8)) + codes[:, j],
+                        total)
+   return total
+
+def hashStrings3(keys, size): # Hash a batch of strings with hashString3
+   codes = __stringCodes(keys)
+   if codes is None or not (isinstance(size, int) and 0 < size < 1 << 43):
+      return __hashEach(hashString3, keys, size)
+   codes, lengths = codes
+   total, size = _np.zeros(len(codes), dtype=_np.uint64), _np.uint64(size)
+   for j in range(codes.shape[1]):
+      total = _np.where(j < lengths,
+                        ((total << _np.uint64(8)) + codes[:, j]) % size, total)
+   return total
+
+def bitHashes(keys, h=0):   # Hash a batch of strings or ints with bitHash
+   if not (isinstance(h, int) and 0 <= h <= __64bits):
+      return __hashEach(bitHash, keys, h)
+   codes = __stringCodes(keys)
+   if codes is not None:    # Strings rotate and xor bits for each
+      codes, lengths = codes # character, keeping 64 bits
+      bits = __bitTableArray(int(codes.max(initial=0)))
+      return __rotateXor(h, codes, lengths,
+                         lambda c: bits[c.astype(_np.intp)], True)[1]
+   ints = __intKeys(keys)
+   if ints is None:
+      return __hashEach(bitHash, keys, h)
+   bits = __bitTableArray(__16bits) # Integers rotate and xor bits for
+   high = _np.zeros(len(ints), dtype=_np.uint64) # each 16-bit field
+   low = _np.full(len(ints), h, dtype=_np.uint64)
+   more = _np.ones(len(ints), dtype=bool)
+   while more.any():        # Continue while keys have more fields
+      newHigh, newLow = __rotate(high, low)
+      newLow ^= bits[(ints & __16bits).astype(_np.intp)]
+      high, low = _np.where(more, newHigh, high), _np.where(more, newLow, low)
+      more &= ints > __16bits
+      ints = ints >> 16
+   return __combine(high, low)
+
+def multiplicativeHashes(keys, h=0): # Hash a batch with multiplicativeHash
+   if not (isinstance(h, int) and 0 <= h <= __64bits):
+      return __hashEach(multiplicativeHash, keys, h)
+   codes = __stringCodes(keys)
+   if codes is not None and codes[0].shape[1] < 63: # Strings rotate and xor
+      codes, lengths = codes # with each character times a prime plus bits
+      return __combine(*__rotateXor(
+         h, codes, lengths,
+         lambda c: c * _np.uint64(__bigPrime) + _np.uint64(__salt)))
+   ints = __intKeys(keys)
+   if ints is None or (ints < 0).any():
+      return __hashEach(multiplicativeHash, keys, h)
+   ints = ints.astype(_np.uint64) # Multiply integers by the prime in
+   lowKey, highKey = ints & __32bits, ints >> _np.uint64(32) # 32-bit
+   lowPrime, highPrime = (_np.uint64(__bigPrime & __32bits), # parts to
+                          _np.uint64(__bigPrime >> 32)) # get 128-bit
+   lowLow, lowHigh = lowKey * lowPrime, lowKey * highPrime # products
+   highLow, highHigh = highKey * lowPrime, highKey * highPrime
+   middle = ((lowLow >> _np.uint64(32)) + (lowHigh & __32bits) +
+             (highLow & __32bits))
+   productLow = (lowLow & __32bits) | (middle << _np.uint64(32))
+   productHigh = (highHigh + (lowHigh >> _np.uint64(32)) +
+                  (highLow >> _np.uint64(32)) + (middle >> _np.uint64(32)))
+   withSalt = productLow + _np.uint64(__salt) # Add bits and carry
+   productHigh += (withSalt < productLow).astype(_np.uint64)
+   high, low = __rotate(_np.zeros(len(ints), dtype=_np.uint64),
+                        _np.full(len(ints), h, dtype=_np.uint64))
+   return __combine(high ^ productHigh, low ^ withSalt)
+
+__32bits = (1 << 32) - 1
+
+def __hashEach(function, keys, *args): # Hash keys one at a time into
+   if __importNumPy() is not None and isinstance(keys, _np.ndarray): # a
+      keys = keys.tolist()  # list, converting NumPy values to Python ones
+   return [function(key, *args) for key in keys]
+
+def __combine(high, low):   # Make an array of 64-bit hashes from their
+   if not high.any():       # low words, or a list of Python ints if some
+      return low            # need the high words too
+   return [(h << 64) | l for h, l in zip(high.tolist(), low.tolist())]
+
+def __stringCodes(keys):    # Get a matrix of character codes for a batch
+   if __importNumPy() is None: # of strings and an array of their lengths
+      return None
+   if isinstance(keys, _np.ndarray):
+      if keys.dtype.kind != 'U' or keys.ndim != 1:
+         return None
+      lengths = _np.char.str_len(keys)
+   elif len(keys) > 0 and all(isinstance(key, str) for key in keys):
+      lengths = _np.array([len(key) for key in keys])
+      keys = _np.array(keys, dtype='U{}'.format(max(1, lengths.max())))
+   else:
+      return None
+   codes = _np.ascontiguousarray(keys).view(_np.uint32).reshape(len(keys), -1)
+   return codes.astype(_np.uint64), lengths
+
+def __hornerCodes(keys):    # Get the character codes for a batch of
+   if __importNumPy() is None: # strings if their Horner's method hash
+      return None           # values fit in 64 bits, which needs strings
+   if not isinstance(keys, _np.ndarray) and any( # of 8 characters or less
+         isinstance(key, str) and len(key) > 8 for key in keys):
+      return None
+   codes = __stringCodes(keys)
+   return codes if codes is not None and __fitsHorner(*codes) else None
+
+def __fitsHorner(codes, lengths): # Test if Horner's method hash values
+   return (int(codes.max(initial=0)) * # fit in 64 bits
+           ((1 << (8 * codes.shape[1])) - 1) // 255 <= __64bits)
+
+def __intKeys(keys):        # Get an int64 array for a batch of integers
+   if __importNumPy() is None:
+      return None
+   if isinstance(keys, _np.ndarray):
+      if keys.dtype.kind not in 'biu' or keys.ndim != 1 or (
+            keys.dtype.kind == 'u' and keys.size and keys.max() >= 1 << 63):
+         return None
+      return keys.astype(_np.int64)
+   if not all(isinstance(key, int) and -(1 << 63) <= key < 1 << 63
+              for key in keys):
+      return None
+   return _np.array(keys, dtype=_np.int64)
+
+def __bitTableArray(code):  # Get the random bits for character codes up
+   pages = __bitPages[:(code >> __pageBits) + 1] # to code as a NumPy array
+   if len(pages) <= code >> __pageBits:
+      __makeBitPages(code >> __pageBits)
+      pages = __bitPages[:(code >> __pageBits) + 1]
+   return (_np.frombuffer(pages[0], dtype=_np.uint64) if len(pages) == 1 else
+           _np.concatenate([_np.frombuffer(page, dtype=_np.uint64)
+                            for page in pages]))
+
+def __rotate(high, low):    # Rotate hashes left 1 bit the way the hash
+   carry = (high << _np.uint64(1)) | (low >> _np.uint64(63)) # functions
+   return carry, (low << _np.uint64(1)) | carry # do, split in 2 words
+
+def __rotateXor(h, codes, lengths, bitsFor, keep64bits=False):
+   high = _np.zeros(len(codes), dtype=_np.uint64) # Rotate and xor the bits
+   low = _np.full(len(codes), h, dtype=_np.uint64) # for each character
+   for j in range(codes.shape[1]): # of the strings
+      newHigh, newLow = __rotate(high, low)
+      newLow ^= bitsFor(codes[:, j])
+      more = j < lengths
+      low = _np.where(more, newLow, low)
+      if not keep64bits:
+         high = _np.where(more, newHigh, high)
+   return high, low
+
+# A sieve of Eratosthenes marking the prime numbers, grown as needed up to
+# a maximum size.  Larger numbers are tested by trial division
+__primeSieve = bytearray()
+__maxSieve = 1 << 24
+
+def primeSieve(N):          # Get a sieve that marks the primes up to N
+   global __primeSieve      # with a 1 at each prime's index
+   if len(__primeSieve) <= N:
+      size = min(max(N + 1, 2 * len(__primeSieve), 1024), __maxSieve)
+      sieve = bytearray([1]) * size # Start with all numbers marked
+      sieve[:2] = bytes(2)  # except 0 and 1, then clear the multiples
+      for factor in range(2, math.isqrt(size - 1) + 1): # of each prime
+         if sieve[factor]:  # starting from its square
+            sieve[factor * factor::factor] = bytes(
+               len(range(factor * factor, size, factor)))
+      __primeSieve = sieve
+   return __primeSieve
+
 def is_prime(N):            # Determine if an integer is prime
    if N < 2 or (N > 2 and N % 2 == 0): # If N is small or even
       return False          # then it's not prime
+   if isinstance(N, int) and N < __maxSieve: # Look up smaller integers
+      return primeSieve(N)[N] == 1 # in the sieve
    # The upper bound of possible factors is the square root of N
    top = int(pow(N, 0.5) + 1)
    factor = 3               # Start factor testing at 3
@@ -110,6 +343,41 @@ def quadraticProbeCoverage(maxArraySize=555, minArraySize=5, step=1):
    for every array size within a range.
    Returns a 3-tuple for each array size: (size, ratio_visited, is_prime)
    """
-   return [(size, len({i ** 2 % size for i in range(5 * size)}) / size,
+   sizes = range(minArraySize, maxArraySize + 1, step)
+   if len(sizes) == 0 or min(sizes) < 1:
+      return [(size, len({i ** 2 % size for i in range(5 * size)}) / size,
+               is_prime(size)) for size in sizes]
+   squares = squaresModulo(max(sizes))
+   return [(size, int(squares[size]) / size, is_prime(size))
+           if squares is not None else
+           (size, len({i ** 2 % size for i in range(size // 2 + 1)}) / size,
             is_prime(size))
-           for size in range(minArraySize, maxArraySize + 1, step)]
+           for size in sizes]
+
+def squaresModulo(N):       # Count the distinct squares modulo each size
+   if __importNumPy() is None: # up to N, or return None without NumPy
+      return None
+   factor = _np.arange(N + 1) # Find the smallest prime factor of each
+   for p in range(2, math.isqrt(N) + 1): # size by marking multiples of
+      if factor[p] == p:    # each prime that aren't already marked
+         multiples = factor[p * p::p]
+         multiples[multiples == _np.arange(p * p, N + 1, p)] = p
+   squares = _np.ones(N + 1, dtype=_np.int64) # The count is multiplicative
+   rest = _np.arange(N + 1) # so multiply the counts for the prime powers
+   sizes = _np.nonzero(rest > 1)[0] # of each size, dividing them from rest
+   while len(sizes) > 0:
+      p = factor[rest[sizes]]
+      power, rest[sizes] = p.copy(), rest[sizes] // p
+      more = rest[sizes] % p == 0
+      exponents = _np.ones(len(sizes), dtype=_np.int64)
+      while more.any():     # Divide out the rest of each prime's power
+         power[more] *= p[more]
+         rest[sizes[more]] //= p[more]
+         exponents[more] += 1
+         more[more] = rest[sizes[more]] % p[more] == 0
+      squares[sizes] *= _np.where( # Count the squares modulo the power
+         p == 2, power // 6 + 2,
+         _np.where(exponents % 2 == 0, power * p + p + 2,
+                   power * p + 2 * p + 1) // (2 * (p + 1)))
+      sizes = sizes[rest[sizes] > 1]
+   return squares
@@ -95,12 +95,12 @@ class InfixCalculator(VisualizationApp):
         if font is None:
             font = self.VARIABLE_FONT
         arrowCoords = self.indexCoords(index, arrayID, level)
-        arrow = self.canvas.create_line(
-            *arrowCoords, arrow="last", fill=color, tags=tags)
+        arrow = self.createPooledItem(
+            'line', *arrowCoords, arrow="last", fill=color, tags=tags)
         if name:
-            label = self.canvas.create_text(
-                *arrowCoords[:2], text=name, anchor=NE, font=font, fill=color, 
-                tags=tags)
+            label = self.createPooledItem(
+                'text', *arrowCoords[:2], text=name, anchor=NE, font=font,
+                fill=color, tags=tags)
             return (arrow, label)
 
         return (arrow,)
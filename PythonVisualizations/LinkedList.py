@@ -64,7 +64,7 @@ class LinkedList(VisualizationApp):
         self.prev_id = -1
         self.buttons = self.makeButtons()
         self.display()
-        self.canvas.bind('<Configure>', self.resizeCanvas)
+        self.canvas.bind('<Configure>', self.resizeCanvas, '+')
 
     def __len__(self):
         return len(self.list)
@@ -241,12 +241,12 @@ class LinkedList(VisualizationApp):
         
     ### ANIMATION METHODS###
     def createIndex(self, pos, name=None, level=0):
-        arrow = self.canvas.create_line(
-            *self.indexCoords(pos, level), arrow=LAST,
+        arrow = self.createPooledItem(
+            'line', *self.indexCoords(pos, level), arrow=LAST,
             fill=self.VARIABLE_COLOR)
         if name:
-            name = self.canvas.create_text(
-                *self.indexLabelCoords(pos, level), text=name,
+            name = self.createPooledItem(
+                'text', *self.indexLabelCoords(pos, level), text=name,
                 font=self.VARIABLE_FONT, fill=self.VARIABLE_COLOR,
                 anchor=SW if pos >= 0 else E)
         return (arrow, name) if name else (arrow,)
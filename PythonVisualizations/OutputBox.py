@@ -194,7 +194,7 @@ class OutputBox(object):
                 endFont=self.outputFont, see=see, expand=expand)
         self.app.canvas_itemConfig(self.outputText, text='\n'.join(lines))
         if animate and deleteItem:
-            self.app.canvas.delete(textOrItem)
+            self.app.canvas.release(textOrItem)
 
     def setToText(
             self, items, coords=None, sleepTime=0, deleteItems=True,
@@ -272,7 +272,7 @@ class OutputBox(object):
             self.app.canvas_itemConfig(self.outputBox, fill=self.background)
         if deleteItems:
             for item in items:
-                self.app.canvas.delete(item)
+                self.app.canvas.release(item)
                     
     def center(self):
         return BBoxCenter(self.bbox)
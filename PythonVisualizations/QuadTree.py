@@ -191,7 +191,7 @@ class PointQuadtree(VisualizationApp):
         if pointRegion is None:
             pointRegion = V((0, 0, 800, 400)) - V(self.BUFFER_ZONE)
         self.pointRegion = pointRegion
-        self.showBoundaries = IntVar()
+        self.showBoundaries = IntVar(self.window)
         self.showBoundaries.set(1)
         self.makeButtons()
         self.new()
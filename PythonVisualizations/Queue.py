@@ -80,11 +80,11 @@ class Queue(VisualizationApp):
         elif color is None:
             color = self.variableColor
         arrow_coords = self.arrowCoords(index, level)
-        arrow = self.canvas.create_line(
-            *arrow_coords, arrow="last", fill=color)
+        arrow = self.createPooledItem(
+            'line', *arrow_coords, arrow="last", fill=color)
         if name:
-            label = self.canvas.create_text(
-                arrow_coords[0], arrow_coords[1], text=name, 
+            label = self.createPooledItem(
+                'text', arrow_coords[0], arrow_coords[1], text=name, 
                 anchor=self.labelAnchor(arrow_coords, level),
                 font=self.variableFont, fill=color)
         return (arrow, label) if name else (arrow,)
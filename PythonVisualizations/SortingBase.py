@@ -116,8 +116,8 @@ class SortingBase(VisualizationApp):
         else:
             tempLabelPos = tempCoords if tempCoords else self.tempLabelCoords(
                 index)
-            tempLabel = self.canvas.create_text(
-                *tempLabelPos, text=varName, font=self.VARIABLE_FONT,
+            tempLabel = self.createPooledItem(
+                'text', *tempLabelPos, text=varName, font=self.VARIABLE_FONT,
                 fill=self.VARIABLE_COLOR)
             callEnviron.add(tempLabel)
 
@@ -205,10 +205,11 @@ class SortingBase(VisualizationApp):
         if not color: color = self.VARIABLE_COLOR
 
         x0, y0, x1, y1 = self.indexCoords(index, level)
-        arrow = self.canvas.create_line(x0, y0, x0, y1, arrow=LAST, fill=color)
+        arrow = self.createPooledItem(
+            'line', x0, y0, x0, y1, arrow=LAST, fill=color)
         if name:
-            label = self.canvas.create_text(
-                x0, y0, text=name, anchor=SW if level > 0 else NW,
+            label = self.createPooledItem(
+                'text', x0, y0, text=name, anchor=SW if level > 0 else NW,
                 font=self.VARIABLE_FONT, fill=color)
         return (arrow, label) if name else (arrow,)  
 
@@ -59,12 +59,12 @@ class Stack(VisualizationApp):
     # Create an index arrow pointing at a cell with an optional name label
     def createIndex(self, index, name="__top"):
         arrowCoords = self.indexCoords(index)
-        arrow = self.canvas.create_line(
-            *arrowCoords, arrow="last", fill=self.VARIABLE_COLOR)
+        arrow = self.createPooledItem(
+            'line', *arrowCoords, arrow="last", fill=self.VARIABLE_COLOR)
         if name:
-            label = self.canvas.create_text(
-                arrowCoords[0] - abs(self.VARIABLE_FONT[1]), arrowCoords[1],
-                text=name, anchor=E, font=self.VARIABLE_FONT,
+            label = self.createPooledItem(
+                'text', arrowCoords[0] - abs(self.VARIABLE_FONT[1]),
+                arrowCoords[1], text=name, anchor=E, font=self.VARIABLE_FONT,
                 fill=self.VARIABLE_COLOR)
             return (arrow, label)
 
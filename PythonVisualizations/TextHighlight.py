@@ -1,10 +1,64 @@
 # Utilities for managing highlights on Tk text widgets corresponding
 # to source code
 
-import re
+import re, functools
+from bisect import bisect_right
 
 declarationPattern = re.compile(r'^\s*(def|class)\s+(\w+)(\W|$)')
 
+class CodeIndex(object):
+    '''Index of where fragments are found in a code text.  Spans are found
+    once and shared by all the CodeHighlightBlocks for the same code, such
+    as those of recursive calls.'''
+    
+    def __init__(self, code):
+        self.code = code
+        self.lineStarts = [0] # Character offset of the start of each line
+        j = code.find('\n')
+        while j >= 0:
+            self.lineStarts.append(j + 1)
+            j = code.find('\n', j + 1)
+        self.spans = {}       # (fragment, copy) -> ((line, char), (line, char))
+
+    def span(self, fragment, copy=1):
+        '''Find the nth copy of a code fragment string or pattern.  Return
+        the 0-relative (line, char) positions of its start and end, or None
+        if not found.'''
+        key = (fragment, copy)
+        if key not in self.spans:
+            start, end = self.find(fragment, copy)
+            self.spans[key] = None if start is None else (
+                self.position(start), self.position(end))
+        return self.spans[key]
+
+    def find(self, fragment, copy):
+        'Find the start and end offset of the nth copy of a fragment'
+        if isinstance(fragment, type(declarationPattern)):
+            matches = [match for match in fragment.finditer(self.code)]
+            if len(matches) < copy:
+                return None, None
+            match = matches[copy - 1]
+            lastGroup = 0
+            for i in range(1, len(match.groups()) + 1):
+                if match.group(i):
+                    lastGroup = i
+            return match.start(lastGroup), match.end(lastGroup)
+        start = self.code.find(fragment)
+        while start >= 0 and copy > 1:
+            copy -= 1
+            start = self.code.find(fragment, start + len(fragment))
+        return (None, None) if start < 0 else (start, start + len(fragment))
+
+    def position(self, offset):
+        'Convert a character offset to a (line, char) position'
+        line = bisect_right(self.lineStarts, offset) - 1
+        return line, offset - self.lineStarts[line]
+
+@functools.lru_cache(maxsize=256)
+def codeIndex(code):
+    'Get the shared CodeIndex for a code text'
+    return CodeIndex(code)
+
 class CodeHighlightBlock(object):
     '''Class to hold information about visualizing the code during animation
     of a particular call on the call stack.  After creating a block,
@@ -20,6 +74,7 @@ class CodeHighlightBlock(object):
        self.lines = self.code.split('\n') if len(code) > 0 else []
        declaration = self.lines and declarationPattern.match(self.lines[0])
        self.blockName = declaration and declaration.group(2)
+       self.index = codeIndex(self.code)
        self.cache = {}
        self.textWidget = textWidget
        self.prefix = '{:04d}-'.format(self._counter)
@@ -34,13 +89,13 @@ class CodeHighlightBlock(object):
            return self.cache[fragment]
        if self.startMark is None:
            raise KeyError('Missing start mark for CodeHighlightBlock')
-       span = self.findFragment(*fragment)
+       span = self.index.span(*fragment)
        if span:
            if self.startMark in self.textWidget.mark_names():
                startLine = int(
                    self.textWidget.index(self.startMark).split('.')[0])
-               newspan = ['{}.{}'.format(startLine + int(line), char)
-                          for line, char in [ind.split('.') for ind in span]]
+               newspan = ['{}.{}'.format(startLine + line, char)
+                          for line, char in span]
                tag = self.tag(*fragment)
                self.textWidget.tag_add(tag, *newspan)
                self.cache[fragment] = tag
@@ -63,49 +118,11 @@ class CodeHighlightBlock(object):
         '''Find a code fragment within the code block.  Look for the nth copy
         when there are multiple copies.  Return the line.char position of the
         start and end of the fragment, similar to the indices used by the
-        Tk text widget, but use 0-relative line numbers.
+        Tk text widget, but use 0-relative line numbers.  The search is
+        done once per code text and fragment in the shared code index.
         '''
-        j = 0
-        if isinstance(fragment, type(declarationPattern)):
-            matches = [match for match in fragment.finditer(self.code)]
-            if len(matches) >= copy:
-                match = matches[copy - 1]
-                lastGroup = 0
-                for i in range(1, len(match.groups()) + 1):
-                    if match.group(i):
-                        lastGroup = i
-                start = match.start(lastGroup)
-                fragment = match.group(lastGroup)
-            else:
-                start = None
-        else:
-            start = self.code.index(fragment) if fragment in self.code else None
-            while start is not None and copy > 1:
-                j = start + len(fragment)
-                copy -= 1
-                start = (j + self.code[j:].index(fragment)
-                         if fragment in self.code[j:] else None)
-        if start is None:
-            return None
-        chars, line = 0, 0
-        while (line < len(self.lines) and
-               chars + len(self.lines[line]) < start):
-            chars += len(self.lines[line]) + 1
-            line += 1
-        if line >= len(self.lines) or chars >= len(self.code):
-            raise IndexError(
-                'Internal error.  No more lines or characters when finding '
-                'fragment "{}"'.format(fragment))
-        first = '{}.{}'.format(line, start - chars)
-        while (line < len(self.lines) and
-               chars + len(self.lines[line]) < start + len(fragment)):
-            chars += len(self.lines[line]) + 1
-            line += 1
-        if line >= len(self.lines) or chars >= len(self.code):
-            raise IndexError(
-                'Internal error.  No more lines or characters when finding '
-                'fragment "{}"'.format(fragment))
-        return first, '{}.{}'.format(line, start + len(fragment) - chars)
+        span = self.index.span(fragment, copy)
+        return span and tuple('{}.{}'.format(*pos) for pos in span)
         
     def markStart(self, ind='1.0', resetCache=True):
         '''Mark the start of this code block inside the Tk text widget'''
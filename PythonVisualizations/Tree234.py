@@ -1518,7 +1518,8 @@ def __traverse(self, node={nodeStr}, traverseType="{traverseType}"):
                         self.canvas.canvasy(event.y))
             zoomOut = event.state & SHIFT or (
                 isinstance(event.num, int) and event.num != 1)
-            self.zoom((1 / zoomBy) if zoomOut else zoomBy, fixPoint=fixPoint)
+            self.zoomWhenIdle(
+                self.zoom, (1 / zoomBy) if zoomOut else zoomBy, fixPoint)
         for button in range(1, 4):
             self.canvas.bind('<Double-Button-{}>'.format(button),
                              clickZoomHandler)
@@ -1531,7 +1532,7 @@ def __traverse(self, node={nodeStr}, traverseType="{traverseType}"):
                           if event.type is EventType.MouseWheel else
                           (event.num == 4))
                 scaleBy = zoomBy if zoomIn else (1 / zoomBy)
-                self.zoom(scaleBy, fixPoint=fixPoint)
+                self.zoomWhenIdle(self.zoom, scaleBy, fixPoint)
         for eventType in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
             self.canvas.bind(eventType, scrollWheelZoomHandler)
             
@@ -12,9 +12,11 @@ from enum import Enum
 try:
     from coordinates import *
     from tkUtilities import *
+    from profiler import *
 except ModuleNotFoundError:
     from .coordinates import *
     from .tkUtilities import *
+    from .profiler import *
     
 # Utilities for vector math; used for canvas item coordinates
 V = vector
@@ -49,54 +51,87 @@ class Visualization(object):  # Base class for Python visualizations
             title=None,
             canvasWidth=None,  # Canvas portal size
             canvasHeight=None,
-            canvasBounds=None): # Canvas extent (behind portal)
+            canvasBounds=None, # Canvas extent (behind portal)
+            backend=None,      # Display backend, default is TkBackend
+            adaptiveAnimation=False, # Drop frames to keep animation time
+            profile=False):    # Profile canvas calls and waits of operations
         self.title = title
+        self.adaptiveAnimation = adaptiveAnimation
+        self.instantMode = False # Skip animations, showing only final states
+        self.frameOverhead = 0 # Estimated time beyond sleep to show a frame
+        self.framesDropped = 0
+        self.backend = backend if backend else TkBackend()
         # Set up Tk windows for canvas and operational controls
         if window:
             self.window = window
         else:
-            self.window = Tk()
-            if title:
-                self.window.title(title)
+            self.window = self.backend.makeWindow(title)
         self.destroyed = False
-        self.window.bind('<Destroy>', self.setDestroyFlag)
+        self.window.bind('<Destroy>', self.setDestroyFlag, '+')
 
         if canvasWidth is None: canvasWidth = self.DEFAULT_CANVAS_WIDTH
         if canvasHeight is None: canvasHeight = self.DEFAULT_CANVAS_HEIGHT
         self.targetCanvasWidth = canvasWidth
         self.targetCanvasHeight = canvasHeight
-        self.canvasFrame = Frame(self.window)
+        self.canvasFrame = self.backend.Frame(self.window)
         self.canvasFrame.pack(side=TOP, expand=True, fill=BOTH)
         if canvasBounds:
-            self.canvasVScroll = Scrollbar(self.canvasFrame, orient=VERTICAL)
+            self.canvasVScroll = self.backend.Scrollbar(
+                self.canvasFrame, orient=VERTICAL)
             self.canvasVScroll.pack(side=RIGHT, expand=False, fill=Y)
             if canvasWidth == 800:  # Shrink canvas width to show scrollbar
                 self.targetCanvasWidth, canvasWidth = 785, 785
         else:
             self.canvasVScroll = None
-        self.canvas = Scrim(
+        self.canvas = self.backend.Scrim(
             self.canvasFrame, width=canvasWidth, height=canvasHeight,
             bg=self.DEFAULT_BG)
         self.canvas.pack(side=TOP, expand=True, fill=BOTH)
+        self.visibleRegion = None # Cached visible canvas coordinates
+        self.pendingTextScale = {} # Font scales not yet applied to items
+        self.pendingLineScale = {} # Arrow scales not yet applied to items
+        self.pendingZoom = None    # Zoom waiting for event queue to empty
+        self.canvas.bind('<Configure>', self.forgetVisibleCanvas, '+')
         self.__createCanvasText = self.canvas.create_text
         self.canvas.create_text = self.createCanvasText
         self.setCanvasBounds(canvasBounds)
         if canvasBounds:
-            self.canvasHScroll = Scrollbar(self.canvasFrame, orient=HORIZONTAL)
+            self.canvasHScroll = self.backend.Scrollbar(
+                self.canvasFrame, orient=HORIZONTAL)
             self.canvasHScroll.pack(side=TOP, expand=False, fill=X)
-            self.canvasVScroll['command'] = self.canvas.yview
-            self.canvasHScroll['command'] = self.canvas.xview
-            self.canvas['xscrollcommand'] = self.canvasHScroll.set
-            self.canvas['yscrollcommand'] = self.canvasVScroll.set
+            self.canvasVScroll['command'] = self.canvasScroller(
+                self.canvas.yview)
+            self.canvasHScroll['command'] = self.canvasScroller(
+                self.canvas.xview)
+            self.canvas['xscrollcommand'] = self.canvasScroller(
+                self.canvasHScroll.set)
+            self.canvas['yscrollcommand'] = self.canvasScroller(
+                self.canvasVScroll.set)
         else:
             self.canvasHScroll = None
 
-        # Set up animation state variable
+        # Set up animation state variable and a Tk variable that changes
+        # with it to wake up waits in the event loop
+        self.animationWakeUp = IntVar(self.window)
         self.animationState = Animation.STOPPED
+        self.profiler = Profiler(self) if profile else None
 
     def setDestroyFlag(self, event=None): # Capture destruction of top window
         if event and event.widget == self.window:
             self.destroyed = True
+            self.wakeUpAnimation()
+
+    def canvasScroller(self, scroll):
+        'Make a scroll command that clears the cached visible canvas region'
+        def scrollCommand(*args):
+            self.visibleRegion = None
+            if self.pendingTextScale or self.pendingLineScale:
+                self.canvas.after_idle(self.applyPendingScaling, True)
+            return scroll(*args)
+        return scrollCommand
+
+    def forgetVisibleCanvas(self, event=None):
+        self.visibleRegion = None
 
     def expandCanvasFor(self, *itemOrBBox):
         '''Expand canvas scroll region if needed to view given canvas items
@@ -111,6 +146,7 @@ class Visualization(object):  # Base class for Python visualizations
             self.setCanvasBounds(BBoxUnion(bounds, bbox))
         
     def setCanvasBounds(self, canvasBounds, expandOnly=True):
+        self.visibleRegion = None
         if canvasBounds is None:
             self.canvasBounds = None
             return
@@ -148,11 +184,12 @@ class Visualization(object):  # Base class for Python visualizations
         return self.canvas.itemsColor(items, colors)
 
     def dispose(self, callEnviron, *items):
-        'Delete items from the canvas and call environment, if it is a set'
+        '''Delete items from the canvas and call environment, if it is a set.
+        Pooled items are released for reuse.'''
         for item in items:
             if isinstance(callEnviron, set):
                 callEnviron.discard(item)
-            self.canvas.delete(item)
+        self.canvas.release(*items)
 
     def getItemFont(self, item):
         return self.canvas.getItemFont(item)
@@ -162,26 +199,42 @@ class Visualization(object):  # Base class for Python visualizations
         Record the font at initialization as a tag for use in scaling text
         items.
         '''
-        font = kwargs.get('font', self.DEFAULT_FONT)
-        tags = kwargs.get('tags', ())
-        if not isinstance(tags, tuple): 
-            tags = tuple(tags.split()) if isinstance(tags, str) else tuple(tags)
-        tags += ('font={}'.format('|'.join(str(c) for c in font)), )
         options = dict(kwargs)
-        options['tags'] = tags
+        options['tags'] = self.textTags(kwargs)
         return self.__createCanvasText(x, y, **options)
+
+    def textTags(self, options):
+        'Get the tags for text item options, adding one for the font'
+        font = options.get('font', self.DEFAULT_FONT)
+        tags = options.get('tags', ())
+        if not isinstance(tags, tuple): 
+            tags = tuple(tags.split()) if isinstance(tags, str) else tuple(tags)
+        if not any(tag.startswith('font=') for tag in tags):
+            tags += ('font={}'.format('|'.join(str(c) for c in font)), )
+        return tags
+
+    def createPooledItem(self, itemType, *coords, **options):
+        '''Create a canvas item that reuses a released item of the same type,
+        if possible.  Use dispose or canvas.release to return it to the
+        pool.  Suited for temporary items like index arrows and highlights.'''
+        if itemType == 'text':
+            options['tags'] = self.textTags(options)
+        return self.canvas.create_pooled(itemType, *coords, **options)
         
     def scaleItems(
             self, x0, y0, scaleBy, fontScale, updateBounds='simple',
             fixPoint=(), items='all'):
+        '''Scale the coordinates of canvas items around x0, y0.  Text
+        fonts are set to fontScale times the font in their font tag and
+        line arrows are scaled by scaleBy, but only for items near the
+        visible canvas.  The rest are rescaled later by
+        applyPendingScaling.'''
         if fixPoint:
             screenFixPoint = V(fixPoint) - V(self.visibleCanvas())
-        for item in (i for i in self.canvas.find_withtag(items)):
-            itemType = self.canvas.type(item)
-            if itemType == 'text':
-                self.scaleTextItem(item, fontScale)
-            elif itemType == 'line':
-                self.scaleLineItem(item, scaleBy)
+        for item in self.canvas.find_withtag(items):
+            self.pendingTextScale[item] = fontScale
+            self.pendingLineScale[item] = (
+                self.pendingLineScale.get(item, 1) * scaleBy)
         self.canvas.scale(items, x0, y0, scaleBy, scaleBy)
         if updateBounds:
             if updateBounds == 'simple':
@@ -189,9 +242,9 @@ class Visualization(object):  # Base class for Python visualizations
                          for d, origin in zip(self.canvasBounds,
                                               (x0, y0, x0, y0))]
             else:
-                newBB = BBoxUnion(*(self.canvas.bbox(i) 
-                                    for i in self.canvas.find_withtag('all')))
-            self.setCanvasBounds(newBB, expandOnly=scaleBy > 1)
+                newBB = self.canvas.bbox('all')
+            if newBB:
+                self.setCanvasBounds(newBB, expandOnly=scaleBy > 1)
         if fixPoint:
             self.window.update() # Need this to get adjusted scroll positions
             afterScale = V(V(fixPoint) - V(x0, y0)) * scaleBy
@@ -204,6 +257,29 @@ class Visualization(object):  # Base class for Python visualizations
                         for XorY in range(2))
             self.canvas.xview_moveto(pos[0])
             self.canvas.yview_moveto(pos[1])
+            self.visibleRegion = None
+        self.applyPendingScaling(nearView=True)
+
+    def applyPendingScaling(self, nearView=False):
+        '''Apply the font and arrow scaling left pending by scaleItems to
+        all items or only those within half a view of the visible canvas'''
+        if not (self.pendingTextScale or self.pendingLineScale):
+            return
+        if nearView:
+            visible = self.visibleCanvas()
+            margin = V(BBoxSize(visible)) / 2
+            items = self.canvas.find_overlapping(
+                *(V(visible[:2]) - margin), *(V(visible[2:]) + margin))
+        else:
+            items = set(self.pendingTextScale) | set(self.pendingLineScale)
+        for item in items:
+            fontScale = self.pendingTextScale.pop(item, None)
+            scaleBy = self.pendingLineScale.pop(item, None)
+            itemType = self.canvas.type(item)
+            if itemType == 'text' and fontScale is not None:
+                self.scaleTextItem(item, fontScale)
+            elif itemType == 'line' and scaleBy is not None:
+                self.scaleLineItem(item, scaleBy)
 
     def scaleTextItem(self, item, scale):
         if self.canvas.type(item) != 'text':
@@ -235,10 +311,27 @@ class Visualization(object):  # Base class for Python visualizations
             fixPoint = (self.canvas.canvasx(event.x), 
                         self.canvas.canvasy(event.y))
             scaleBy = (1 / zoomBy) if event.state & SHIFT else zoomBy
-            self.scaleItems(
-                x0, y0, scaleBy, scaleBy, fixPoint=fixPoint,
-                updateBounds=updateBounds)
+            self.zoomWhenIdle(
+                lambda scaleBy, fixPoint: self.scaleItems(
+                    x0, y0, scaleBy, scaleBy, fixPoint=fixPoint,
+                    updateBounds=updateBounds),
+                scaleBy, fixPoint)
         self.canvas.bind(eventType, zoomHandler)
+
+    def zoomWhenIdle(self, zoom, scaleBy, fixPoint):
+        '''Combine the zoom requests from a burst of events, like mouse wheel
+        ticks, into one call of zoom(scaleBy, fixPoint) made when the event
+        queue is empty'''
+        if self.pendingZoom:
+            self.pendingZoom[1] *= scaleBy
+            self.pendingZoom[2] = fixPoint
+            return
+        self.pendingZoom = [zoom, scaleBy, fixPoint]
+        def zoomNow():
+            zoom, scaleBy, fixPoint = self.pendingZoom
+            self.pendingZoom = None
+            zoom(scaleBy, fixPoint)
+        self.canvas.after_idle(zoomNow)
         
     #####################################################################
     #                                                                   #
@@ -272,6 +365,38 @@ class Visualization(object):  # Base class for Python visualizations
     # Most moveItems method take optional see and expand keyword
     # parameters that control scrolling the canvas to see the moved items
     # and expanding the canvas bounds to accommodate the new positions
+    #
+    # In instant mode, the moveItems methods move items to their final
+    # positions in a single step without waiting.
+    #
+    # In adaptive animation mode, the moveItems methods drop frames,
+    # i.e. merge the changes of a step with the next ones without
+    # rendering, when showing the frame would make the animation finish
+    # later than its time budget, steps * speed(sleepTime).
+
+    def animateSequence(   # Step through an animation sequence, waiting
+            self, sequence,  # sleepTime after each (step, steps) it yields
+            sleepTime=0.1):
+        if not self.adaptiveAnimation or sleepTime <= 0:
+            for step, steps in sequence:
+                self.wait(sleepTime)
+            return
+        frameTime = self.speed(sleepTime)
+        due = self.backend.now()   # Time when current step should end
+        for step, steps in sequence:
+            due += frameTime
+            now = self.backend.now()
+            drop = step + 1 < steps and due - now < self.frameOverhead
+            pause = 0 if drop else max(0.001, due - now - self.frameOverhead)
+            self.wait(sleepTime * pause / frameTime) # Dropped frames still
+            overhead = self.backend.now() - now - pause # check for stops
+            if overhead > frameTime: # Waited for user to play or step, so
+                due += overhead      # shift the schedule
+            elif drop:
+                self.framesDropped += 1
+            else:                    # Smooth the measured frame overhead
+                self.frameOverhead = (
+                    0.8 * self.frameOverhead + 0.2 * max(0, overhead))
 
     def moveItemsOffCanvas(  # Animate the removal of canvas items by sliding
             self, items,     # them off one of the canvas edges
@@ -279,8 +404,11 @@ class Visualization(object):  # Base class for Python visualizations
             steps=10,        # Number of intermediate steps along line
             sleepTime=0.1):  # Base time between steps (adjusted by user)
         self.wait(0)
-        for step, _ in self.moveItemsOffCanvasSequence(items, edge, steps):
-            self.wait(sleepTime)
+        if self.instantMode:
+            steps = 1
+        self.animateSequence(
+            self.moveItemsOffCanvasSequence(items, edge, steps),
+            sleepTime)
 
     def moveItemsOffCanvasSequence(  # Iterator for moveItemsOffCanvas
             self, items, edge=N, steps=10):
@@ -324,10 +452,13 @@ class Visualization(object):  # Base class for Python visualizations
             see=(),          # Scroll to view moved items plus any items in see
             expand=True):    # Expand canvas bounds before scrolling if needed
         self.wait(0)
-        for step, _ in self.moveItemsBySequence(
+        if self.instantMode:
+            steps = 1
+        self.animateSequence(
+            self.moveItemsBySequence(
                 items, delta, steps, startFont=startFont, endFont=endFont,
-                see=see, expand=expand):
-            self.wait(sleepTime)
+                see=see, expand=expand),
+            sleepTime)
 
     def moveItemsBySequence( # Iterator for moveItemsBy
             self, items, delta, steps=10, startFont=None, endFont=None,
@@ -344,28 +475,32 @@ class Visualization(object):  # Base class for Python visualizations
 
             # move the items in steps along vector
             moveBy = V(delta) / steps
+            items = [item for item in items if item is not None]
+            textItems = self.textItems(items) if changeFont else []
+            bboxes = {}      # Bounding boxes of items to see across steps
             for step in range(steps):
                 font = changeFont and (endFont[0], 
                                        (startFont[1] * (steps - (step + 1)) +
                                         endFont[1] * (step + 1)) // steps)
-                for item in items:
-                    if item is not None:
-                        self.canvas.move(item, *moveBy)
-                        if changeFont and self.canvas.type(item) == 'text':
-                            self.canvas.itemconfigure(item, font=font)
+                with self.canvas.batch() as batch: # Make changes in 1 call
+                    for item in items:
+                        batch.move(item, *moveBy)
+                    for item in textItems:
+                        batch.itemconfigure(item, font=font)
                 if see:
+                    self.shiftBBoxes(
+                        bboxes, [(item, moveBy) for item in items], textItems)
                     self.scrollToSee(
                         tuple(items) + 
                         (tuple(see) if isinstance(see, (list, tuple, set))
                          else ()),
-                        sleepTime=0, expand=expand)
+                        sleepTime=0, expand=expand, bboxCache=bboxes)
                 yield (step, steps) # Yield step in sequence
                 
             # Force end font if provided
-            if changeFont:
-                for item in items:
-                    if self.canvas.type(item) == 'text':
-                        self.canvas.itemconfigure(item, font=endFont)
+            with self.canvas.batch() as batch:
+                for item in textItems:
+                    batch.itemconfigure(item, font=endFont)
                 
     def moveItemsTo(         # Animate canvas items moving rigidly 
             self, items,     # to destination locations along line(s)
@@ -377,10 +512,13 @@ class Visualization(object):  # Base class for Python visualizations
             see=(),          # Scroll to view moved items plus any items in see
             expand=True):    # Expand canvas bounds before scrolling if needed
         self.wait(0)
-        for step, _ in self.moveItemsToSequence(
-                items, toPositions, steps, startFont=startFont, endFont=endFont,
-                see=see, expand=expand):
-            self.wait(sleepTime)
+        if self.instantMode:
+            steps = 1
+        self.animateSequence(
+            self.moveItemsToSequence(
+                items, toPositions, steps, startFont=startFont,
+                endFont=endFont, see=see, expand=expand),
+            sleepTime)
 
     def moveItemsToSequence( # Iterator for moveItemsTo
             self, items,     # to destination locations along line(s)
@@ -398,34 +536,38 @@ class Visualization(object):  # Base class for Python visualizations
                               toPositions,
                               [self.canvas.coords(item)[:2] for item in items])]
             changeFont = startFont and endFont and startFont != endFont
+            textItems = self.textItems(items) if changeFont else []
+            moving = [(item, delta) for item, delta in zip(items, moveBy)
+                      if len(delta) == 2]
+            moved = [item for item, delta in moving
+                     if see and V(delta).len2() >= 1]
 
             # move the items until they reach the toPositions
-            moved = []
+            bboxes = {}      # Bounding boxes of items to see across steps
             for step in range(steps):
                 font = changeFont and (endFont[0], 
                                        (startFont[1] * (steps - (step + 1)) +
                                         endFont[1] * (step + 1)) // steps)
-                moved = []
-                for i, item in enumerate(items):
-                    if len(moveBy[i]) == 2:  # Unneeded test?
-                        self.canvas.move(item, *moveBy[i])
-                        if changeFont and self.canvas.type(item) == 'text':
-                            self.canvas.itemconfigure(item, font=font)
-                        if see and V(moveBy[i]).len2() >= 1:
-                            moved.append(item)
+                with self.canvas.batch() as batch: # Make changes in 1 call
+                    for item, delta in moving:
+                        batch.move(item, *delta)
+                    for item in textItems:
+                        batch.itemconfigure(item, font=font)
                 if see and moved:
+                    self.shiftBBoxes(bboxes, moving, textItems)
                     self.scrollToSee(
                         moved + 
                         (list(see) if isinstance(see, (list, tuple, set))
                          else []),
-                        sleepTime=0, expand=expand)
+                        sleepTime=0, expand=expand, bboxCache=bboxes)
                 yield (step, steps) # Yield step in sequence
             
             # Force position of new objects to their exact destinations
-            for pos, item in zip(toPositions, items):
-                self.canvas.coords(item, *pos)
-                if changeFont and self.canvas.type(item) == 'text':
-                    self.canvas.itemconfigure(item, font=endFont)
+            with self.canvas.batch() as batch:
+                for pos, item in zip(toPositions, items):
+                    batch.coords(item, *pos)
+                for item in textItems:
+                    batch.itemconfigure(item, font=endFont)
             if see and moved:
                 self.scrollToSee(
                     moved + 
@@ -448,10 +590,13 @@ class Visualization(object):  # Base class for Python visualizations
             see=(),          # Scroll to view moved items plus any items in see
             expand=True):    # Expand canvas bounds before scrolling if needed
         self.wait(0)
-        for step, _ in self.moveItemsLinearlySequence(
-                items, toPositions, steps, startFont=startFont, endFont=endFont,
-                see=see, expand=expand):
-            self.wait(sleepTime)
+        if self.instantMode:
+            steps = 1
+        self.animateSequence(
+            self.moveItemsLinearlySequence(
+                items, toPositions, steps, startFont=startFont,
+                endFont=endFont, see=see, expand=expand),
+            sleepTime)
 
     def moveItemsLinearlySequence( # Iterator for moveItemsLinearly
             self, items, toPositions, steps=10, startFont=None, endFont=None,
@@ -465,35 +610,41 @@ class Visualization(object):  # Base class for Python visualizations
                               toPositions,
                               [self.canvas.coords(item) for item in items])]
             changeFont = startFont and endFont and startFont != endFont
+            textItems = self.textItems(items) if changeFont else []
+            moving = [(item, self.canvas.coords(item), delta)
+                      for item, delta in zip(items, moveBy) if len(delta) >= 2]
+            moved = [item for item, coords, delta in moving
+                     if see and V(delta).len2() >= 1]
 
             # move the items until they reach the toPositions
-            moved = []
-            for step in range(steps):
+            trajectory = linearTrajectory(
+                [coords for item, coords, delta in moving],
+                [delta for item, coords, delta in moving], steps)
+            bboxes = {}      # Bounding boxes of items to see across steps
+            for step, allCoords in enumerate(trajectory):
                 font = changeFont and (endFont[0], 
                                        (startFont[1] * (steps - (step + 1)) +
                                         endFont[1] * (step + 1)) // steps)
-                moved = []
-                for i, item in enumerate(items):
-                    if len(moveBy[i]) >= 2:
-                        self.canvas.coords(
-                            item, V(self.canvas.coords(item)) + V(moveBy[i]))
-                        if changeFont and self.canvas.type(item) == 'text':
-                            self.canvas.itemconfigure(item, font=font)
-                        if see and V(moveBy[i]).len2() >= 1:
-                            moved.append(item)
+                with self.canvas.batch() as batch: # Make changes in 1 call
+                    for (item, _, _), coords in zip(moving, allCoords):
+                        batch.coords(item, coords)
+                    for item in textItems:
+                        batch.itemconfigure(item, font=font)
                 if see and moved:
+                    self.forgetBBoxes(bboxes, [item for item, _, _ in moving])
                     self.scrollToSee(
                         moved + 
                         (list(see) if isinstance(see, (list, tuple, set))
                          else []),
-                        sleepTime=0, expand=expand)
+                        sleepTime=0, expand=expand, bboxCache=bboxes)
                 yield (step, steps) # Yield step in sequence
             
             # Force position of new objects to their exact destinations
-            for pos, item in zip(toPositions, items):
-                self.canvas.coords(item, *pos)
-                if changeFont and self.canvas.type(item) == 'text':
-                    self.canvas.itemconfigure(item, font=endFont)
+            with self.canvas.batch() as batch:
+                for pos, item in zip(toPositions, items):
+                    batch.coords(item, *pos)
+                for item in textItems:
+                    batch.itemconfigure(item, font=endFont)
             if see and moved:
                 self.scrollToSee(
                     moved + 
@@ -511,10 +662,13 @@ class Visualization(object):  # Base class for Python visualizations
             see=(),          # Scroll to view moved items plus any items in see
             expand=True):    # Expand canvas bounds before scrolling if needed
         self.wait(0)
-        for step, _ in self.moveItemsOnCurveSequence(
+        if self.instantMode:
+            steps = 1
+        self.animateSequence(
+            self.moveItemsOnCurveSequence(
                 items, toPositions, startAngle, steps, startFont=startFont,
-                endFont=endFont, see=see, expand=expand):
-            self.wait(sleepTime)
+                endFont=endFont, see=see, expand=expand),
+            sleepTime)
             
     def moveItemsOnCurveSequence( # Iterator for moveItemsOnCurve
             self, items, toPositions, startAngle=90, steps=10, startFont=None,
@@ -525,46 +679,58 @@ class Visualization(object):  # Base class for Python visualizations
         if items and toPositions:
             steps = max(1, steps) # Must use at least 1 step
             changeFont = startFont and endFont and startFont != endFont
+            textItems = self.textItems(items) if changeFont else []
+            moving = [(item, coords, toPos[:2]) for item, coords, toPos in zip(
+                items, [self.canvas.coords(item)[:2] for item in items],
+                toPositions) if len(coords) == 2]
 
-            # move the items until they reach the toPositions
+            # move the items until they reach the toPositions along curves
+            # whose angle decreases on each step
             moved = []
-            for step in range(steps):  # Go through all steps of the annimation
+            trajectory = curveTrajectory(
+                [start for item, start, end in moving],
+                [end for item, start, end in moving], startAngle, steps)
+            bboxes = {}      # Bounding boxes of items to see across steps
+            for step, moves in enumerate(trajectory):
                 toGo = steps - 1 - step  # remaining steps to go
                 font = changeFont and (endFont[0], 
                                        (startFont[1] * toGo +
                                         endFont[1] * (step + 1)) // steps)
-                ang = startAngle * toGo / steps  # angle decreases on each step
-                scale = 1 + abs(ang) / 180  # scale is larger for higher angles
                 moved = []
-                for i, item in enumerate(items):
-                    coords = self.canvas.coords(item)[:2]
-                    if len(coords) == 2:
-                        moveBy = V(V(V(toPositions[i]) - V(coords)) /
-                                   ((toGo + 1) / scale)).rotate(ang)
-                        self.canvas.move(item, *moveBy)
-                        if changeFont and self.canvas.type(item) == 'text':
-                            self.canvas.itemconfigure(item, font=font)
+                with self.canvas.batch() as batch: # Make changes in 1 call
+                    for (item, _, _), moveBy in zip(moving, moves):
+                        batch.move(item, *moveBy)
                         if see and V(moveBy).len2() >= 1:
                             moved.append(item)
+                    for item in textItems:
+                        batch.itemconfigure(item, font=font)
                 if see and moved:
+                    self.shiftBBoxes(
+                        bboxes, [(item, moveBy) for (item, _, _), moveBy in
+                                 zip(moving, moves)], textItems)
                     self.scrollToSee(
                         moved + 
                         (list(see) if isinstance(see, (list, tuple, set))
                          else []),
-                        sleepTime=0, expand=expand)
+                        sleepTime=0, expand=expand, bboxCache=bboxes)
                 yield (step, steps) # Yield step in sequence
             
             # Force position of new objects to their exact destinations
-            for pos, item in zip(toPositions, items):
-                self.canvas.coords(item, *pos)
-                if changeFont and self.canvas.type(item) == 'text':
-                    self.canvas.itemconfigure(item, font=endFont)
+            with self.canvas.batch() as batch:
+                for pos, item in zip(toPositions, items):
+                    batch.coords(item, *pos)
+                for item in textItems:
+                    batch.itemconfigure(item, font=endFont)
             if see and moved:
                 self.scrollToSee(
                     moved + 
                     (list(see) if isinstance(see, (list, tuple, set)) else []),
                     sleepTime=0, expand=expand)
 
+    def textItems(self, items):
+        'Get the text items among a list of canvas items'
+        return [item for item in items if self.canvas.type(item) == 'text']
+
     def withinCanvas(self, point, visible=False):
         '''Determine if the given point lies within the canvas bounds, or
         optionally, the part of the canvas that's visible based on scrolling'''
@@ -576,8 +742,14 @@ class Visualization(object):  # Base class for Python visualizations
     def visibleCanvas(self):
         '''Return bounding box of visible canvas coordinates.
         When canvasBounds are smaller than canvas, the 'visible' bounds can
-        exceed the canvasBounds bounding box.
+        exceed the canvasBounds bounding box.  The result is cached until
+        the canvas scrolls, changes size, or its bounds change.
         '''
+        if self.visibleRegion is None:
+            self.visibleRegion = self.computeVisibleCanvas()
+        return self.visibleRegion
+
+    def computeVisibleCanvas(self):
         canvasDims = widgetDimensions(self.canvas)
         if any(x is None for x in 
                (self.canvasBounds, self.canvasHScroll, self.canvasVScroll)):
@@ -586,12 +758,12 @@ class Visualization(object):  # Base class for Python visualizations
         yPos = self.canvasVScroll.get()
         Xbounds = (self.canvasBounds[0], self.canvasBounds[2])
         Ybounds = (self.canvasBounds[1], self.canvasBounds[3])
-        return [
+        return tuple(
             int(bounds[0] + pos * max(dim, bounds[1] - bounds[0]))
             for bounds, dim, pos in zip((Xbounds, Ybounds) * 2,
                                         canvasDims * 2,
                                         (max(0, xPos[0]), max(0, yPos[0]), 
-                                         min(1, xPos[1]), min(1, yPos[1])))]
+                                         min(1, xPos[1]), min(1, yPos[1]))))
     
     def visibleCanvasFraction(self):
         'Return the ratio of the visible canvas to the canvas bounds in X, Y'
@@ -621,13 +793,16 @@ class Visualization(object):  # Base class for Python visualizations
                     (xPos[0] * (steps - step) + newX[0] * step) / steps)
                 self.canvas.yview_moveto(
                     (yPos[0] * (steps - step) + newY[0] * step) / steps)
+                self.visibleRegion = None
                 if self.animationsRunning():
                     self.wait(sleepTime)
         self.canvas.xview_moveto(newX[0])
         self.canvas.yview_moveto(newY[0])
+        self.visibleRegion = None
 
     def scrollSettingsToSee(
-            self, itemsOrBBoxes, expand=True, firstPriority=True, debug=False):
+            self, itemsOrBBoxes, expand=True, firstPriority=True,
+            bboxCache=None, debug=False):
         '''Find the scroll settings needed to see the given canvas items (int
         or string) or bounding boxes (sequence of 4 coordinates) or
         coordinate list.  The union of the bounding boxes of the items
@@ -638,15 +813,19 @@ class Visualization(object):  # Base class for Python visualizations
         (adjusted) visible region, a binary search is done to find the
         largest subset of items that could fit.  The subset is either
         the first items in the sequence or the latter items depending
-        on the firstPriority flag.
+        on the firstPriority flag.  A bboxCache dictionary can be provided
+        to reuse item bounding boxes from earlier calls, when the items
+        that moved since then are updated with shiftBBoxes or forgetBBoxes.
         '''
         if self.canvasHScroll is None or self.canvasVScroll is None:
             return
-        BBoxes = [self.canvas.bbox(item) if isinstance(item, (int, str)) 
-                  else BBoxEnclosing(*item)
+        if bboxCache is None:
+            bboxCache = {}
+        BBoxes = [self.itemBBox(item, bboxCache)
+                  if isinstance(item, (int, str)) else BBoxEnclosing(*item)
                   for item in itemsOrBBoxes
-                  if (isinstance(item, (int, str)) and self.canvas.type(item))
-                  or isinstance(item, (list, tuple))]
+                  if isinstance(item, (int, str, list, tuple))]
+        BBoxes = [bbox for bbox in BBoxes if bbox is not False]
         BBox = BBoxUnion(*BBoxes)
         visibleCanvas = self.visibleCanvas()
         if debug:
@@ -708,6 +887,40 @@ class Visualization(object):  # Base class for Python visualizations
         
         return tuple(xPos), tuple(yPos)
         
+    def itemBBox(self, item, bboxCache):
+        '''Get the bounding box of a canvas item or tag, or False if it
+        doesn't exist, using and updating a cache of bounding boxes'''
+        if item not in bboxCache:
+            bboxCache[item] = (self.canvas.bbox(item) if self.canvas.type(item)
+                               else False)
+        return bboxCache[item]
+
+    def shiftBBoxes(self, bboxCache, moves, changed=()):
+        '''Shift cached bounding boxes of items or tags moved by (item,
+        delta) pairs, and forget items whose shape changed.  Other tags
+        might include moved items, so they are forgotten, as are other
+        items when tags were moved.'''
+        if bboxCache:
+            moved = set()
+            for item, delta in moves:
+                if bboxCache.get(item):
+                    bboxCache[item] = V(bboxCache[item]) + (
+                        (delta[0], delta[1]) * 2)
+                moved.add(item)
+            movedTags = any(isinstance(item, str) for item in moved)
+            for item in list(changed) + [
+                    key for key in bboxCache if key not in moved and
+                    (movedTags or isinstance(key, str))]:
+                bboxCache.pop(item, None)
+
+    def forgetBBoxes(self, bboxCache, items):
+        '''Remove items that moved from a bounding box cache along with any
+        tags, whose items might have moved'''
+        if bboxCache:
+            for item in list(items) + [
+                    key for key in bboxCache if isinstance(key, str)]:
+                bboxCache.pop(item, None)
+
     def reconcileItemPositions(self, items, positions):
         'Standardize items paired with positions for moveItems routines'
         if not isinstance(items, (list, tuple, set)):
@@ -724,12 +937,35 @@ class Visualization(object):  # Base class for Python visualizations
         
     # ANIMATION CONTROLS
 
+    @property
+    def animationState(self):
+        return self.__animationState
+
+    @animationState.setter
+    def animationState(self, state): # Changing the state wakes up waits
+        self.__animationState = state
+        self.wakeUpAnimation()
+
+    def wakeUpAnimation(self):
+        self.animationWakeUp.set(self.animationWakeUp.get() + 1)
+
+    def sleep(self, seconds):
+        '''Run the Tk event loop for a number of seconds instead of blocking
+        in time.sleep.  Returns early if the animation state changes.'''
+        self.backend.waitForVariable(self.window, self.animationWakeUp, seconds)
+
+    def waitForStateChange(self):
+        'Run the Tk event loop, without polling, until animation state changes'
+        self.backend.waitForVariable(self.window, self.animationWakeUp)
+
+    def speed(self, sleepTime): # Time to wait for a given base sleepTime
+        return sleepTime
+
     def wait(self, sleepTime): # Sleep for a period of time and handle user stop
+        if self.instantMode:
+            return
         if sleepTime > 0:
-            self.window.update()
-            if self.destroyed:
-                sys.exit()
-            time.sleep(sleepTime)
+            self.sleep(sleepTime)
         if self.destroyed:
             sys.exit()
         if self.animationState == Animation.STOPPED: # If user requested to stop
@@ -20,10 +20,12 @@ try:
     from TextHighlight import *
     from tkUtilities import *
     from Visualization import *
+    from timeline import *
 except ModuleNotFoundError:
     from .TextHighlight import *
     from .tkUtilities import *
     from .Visualization import *
+    from .timeline import *
     
 def gridDict(frame):    # Get all widget's within a frame's grid indexed by
     slaves = frame.grid_slaves() # their grid cooordinates (col, row)
@@ -80,66 +82,88 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             self,
             maxArgWidth=3,    # Maximum length/width of text arguments
             hoverDelay=500,   # Milliseconds to wait before showing hints
+            replay=False,     # Record operations so they can be replayed
             **kwargs):
         super().__init__(**kwargs)
 
         self.maxArgWidth = maxArgWidth
         self.HOVER_DELAY = hoverDelay
+        self.replay = replay
 
         # Set up instance variables for managing animations and operations
         self.callStack = []    # Stack of local environments for visualziation
 
         self.operationMutex = threading.Lock()
         self.pauseButton, self.stopButton, self.stepButton = None, None, None
+        # Incremented when the call stack or its highlights change
+        self.highlightsVersion = 0
         self.lastHighlights = self.callStackHighlights()
+        self.lastHighlightsVersion = self.highlightsVersion
         self.modifierKeyState = 0
         self.debugRequested = False
         self.tw, self.entryHint = None, None
         self.createPlayControlImages()
         self.setUpControlPanel()
+        self.timeline = Timeline(   # Record of canvas changes in last
+            self.canvas, onInvalidate=self.updateReplayControl # operation
+        ) if self.replay else None
         self.window.bind('<Unmap>', self.clearHintHandler(), '+')
  
     def setUpControlPanel(self):  # Set up control panel structure
-        self.controlPanel = Frame(self.window, bg=self.DEFAULT_BG)
+        self.controlPanel = self.backend.Frame(self.window, bg=self.DEFAULT_BG)
         self.controlPanel.pack(side=BOTTOM, expand=False, fill=X)
-        self.operationsUpper = LabelFrame(
+        self.operationsUpper = self.backend.LabelFrame(
             self.controlPanel, text="Operations", bg=self.DEFAULT_BG)
         self.operationsUpper.grid(row=0, column=0)
         self.opButtons = []
-        self.operationsPadding = Frame(
+        self.operationsPadding = self.backend.Frame(
             self.operationsUpper, padx=2, pady=2, bg=self.OPERATIONS_BORDER)
         self.operationsPadding.pack(side=TOP)
-        self.operations = Frame(self.operationsPadding, bg=self.OPERATIONS_BG)
+        self.operations = self.backend.Frame(
+            self.operationsPadding, bg=self.OPERATIONS_BG)
         self.opSeparator = None
         self.operations.pack(side=LEFT)
-        self.operationsLower = Frame(self.controlPanel, bg=self.DEFAULT_BG)
+        self.operationsLower = self.backend.Frame(
+            self.controlPanel, bg=self.DEFAULT_BG)
         self.operationsLower.grid(row=1, column=0)
-        self.operationsLowerCenter = Frame(
+        self.operationsLowerCenter = self.backend.Frame(
             self.operationsLower, padx=2, pady=5, bg=self.DEFAULT_BG)
         self.operationsLowerCenter.pack(side=TOP)
-        self.codeFrame = Frame(self.controlPanel, bg=self.DEFAULT_BG)
+        self.codeFrame = self.backend.Frame(
+            self.controlPanel, bg=self.DEFAULT_BG)
         self.codeFrame.grid(row=0, column=1, rowspan=2, sticky=(N, E, S, W))
         self.codeText = None
 
         self.speedControl = None
-        self.speedScale = Scale(
+        self.speedScale = self.backend.Scale(
             self.operationsLowerCenter, orient=HORIZONTAL,
             from_=self.SPEED_SCALE_MIN, to=self.SPEED_SCALE_MAX,
             showvalue=False, sliderlength=20)
         self.speedScale.grid(row=0, column=1, sticky=W)
         self.speedScale.set(self.SPEED_SCALE_DEFAULT)
-        self.slowLabel = Label(
+        self.slowLabel = self.backend.Label(
             self.operationsLowerCenter, text="Animation speed:  slow",
             font=self.CONTROLS_FONT, bg=self.DEFAULT_BG)
         self.slowLabel.grid(row=0, column=0, sticky=W)
-        self.fastLabel = Label(
+        self.fastLabel = self.backend.Label(
             self.operationsLowerCenter, text="fast", font=self.CONTROLS_FONT,
             bg=self.DEFAULT_BG)
         self.fastLabel.grid(row=0, column=2, sticky=W)
+        self.replayLabel, self.replayScale = None, None
+        if self.replay:
+            self.replayLabel = self.backend.Label(
+                self.operationsLowerCenter, text="Replay:",
+                font=self.CONTROLS_FONT, bg=self.DEFAULT_BG)
+            self.replayLabel.grid(row=1, column=0, sticky=E)
+            self.replayScale = self.backend.Scale(
+                self.operationsLowerCenter, orient=HORIZONTAL, from_=0, to=0,
+                showvalue=False, sliderlength=10, state=DISABLED,
+                command=self.scrubTimeline)
+            self.replayScale.grid(row=1, column=1, sticky=(E, W))
         self.textEntries, self.entryHint = [], None
-        self.messageText = StringVar()
+        self.messageText = StringVar(self.window)
         self.messageText.set('')
-        self.message = Label(
+        self.message = self.backend.Label(
             self.operationsLowerCenter, textvariable=self.messageText,
             font=self.CONTROLS_FONT + ('italic',), fg="blue",
             bg=self.DEFAULT_BG)
@@ -212,12 +236,13 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             raise ValueError('Unknown button type: {}'.format(buttonType))
         if bg is None:
             bg = self.OPERATIONS_BG
+        makeButton = self.backend.widgetClass(buttonType)
         if buttonType in (ttk.Button,):
-            ttk.Style().configure('TButton', font=self.CONTROLS_FONT, 
-                                  background=bg)
-            button = buttonType(self.operations, text=label, **kwargs)
+            self.backend.ttkStyle().configure(
+                'TButton', font=self.CONTROLS_FONT, background=bg)
+            button = makeButton(self.operations, text=label, **kwargs)
         else:
-            button = buttonType( # Create button based on type
+            button = makeButton( # Create button based on type
                 self.operations, text=label, font=self.CONTROLS_FONT, bg=bg,
                 **kwargs)
         button['command'] = self.runOperation(
@@ -284,7 +309,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
     def configureOperationsSeparator(self, withArgs, withoutArgs):
         'Add separator if both kinds of buttons are present and none built'
         if withArgs and withoutArgs and not self.opSeparator:
-            self.opSeparator = Frame(
+            self.opSeparator = self.backend.Frame(
                 self.operations, width=2, bg=self.OPERATIONS_BORDER)
             self.opSeparator.grid(
                 column=self.separatorColumn, row=1, sticky=(N, E, W, S))
@@ -294,7 +319,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
                 rowspan=max(nRows, self.entryHintRow if self.entryHint else 1))
         
     def createArgumentEntry(self, validationCmd):
-        entry = Entry(
+        entry = self.backend.Entry(
             self.operations, width=self.maxArgWidth * 5 // 4, bg=self.ENTRY_BG,
             validate='key', validatecommand=validationCmd, 
             font=self.CONTROLS_FONT)
@@ -316,7 +341,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         # creates a toplevel window
         if not self.tw:
             # Make floating window in front of this app without window controls
-            self.tw = Toplevel()
+            self.tw = self.backend.Toplevel(self.window)
             self.entryHint = None
             if not sys.platform.startswith('win'):
                 self.tw.transient(self.controlPanel)
@@ -337,7 +362,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         self.tw.geometry("+%d+%d" % (x, y))
 
         if self.entryHint is None: # Create hint if not present
-            self.entryHint = Label(
+            self.entryHint = self.backend.Label(
                 self.tw, text=hintText,
                 font=self.HINT_FONT, fg=self.HINT_FG, bg=self.HINT_BG)
             self.entryHint.pack()
@@ -406,8 +431,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         if widgetState(button) == NORMAL:
             widgetState(    # Simulate button press
                 button, PRESSED if isinstance(button, ttk.Button) else ACTIVE)
-            self.window.update()
-            time.sleep(0.05)
+            self.sleep(0.05)
             widgetState(
                 button, 
                 '!' + PRESSED if isinstance(button, ttk.Button) else NORMAL)
@@ -422,7 +446,8 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         has been defined, that operation will be the default when Enter is
         pressed.
         '''
-        self.playControlsFrame = Frame(self.operations, bg=self.OPERATIONS_BG)
+        self.playControlsFrame = self.backend.Frame(
+            self.operations, bg=self.OPERATIONS_BG)
         withArgs, withoutArgs = self.getOperations()
         lastRow, lastColumn = self.getOperationGridLocation(
             withoutArgs[0]) if withoutArgs else (1, self.withoutArgsColumn)
@@ -430,8 +455,9 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             column=lastColumn + lastRow // maxRows, row=lastRow % maxRows + 1)
 
         self.pauseButton, self.stepButton, self.stopButton = (
-            Button(self.playControlsFrame, image=self.playControlImages[name],
-                   state=DISABLED)
+            self.backend.Button(
+                self.playControlsFrame, image=self.playControlImages[name],
+                state=DISABLED)
             for name in ('pause', 'skip-next', 'stop'))
         for btn, name, func, column in zip(
                 (self.pauseButton, self.stepButton, self.stopButton),
@@ -461,7 +487,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         targetSize = (height, height)
         names = ('play', 'pause', 'skip-next', 'stop')
         self.playControlImages = dict(
-            (name, getPhotoImage(name + '-symbol.png', targetSize))
+            (name, self.backend.photoImage(name + '-symbol.png', targetSize))
             for name in names)
         return self.playControlImages
         
@@ -484,10 +510,24 @@ class VisualizationApp(Visualization): # Base class for visualization apps
                     if not self.operationMutex.acquire(blocking=False):
                         self.setMessage('Cannot run more than one operation')
                         return
+                    if self.replay:
+                        self.timeline.start()
+                        self.updateReplayControl()
+                if self.profiler:
+                    self.profiler.start(
+                        button['text'] if button else command.__name__)
+                self.applyPendingScaling()
                 command()
             except UserStop as e:
                 self.cleanUp(self.callStack[0] if self.callStack else None,
                              ignoreStops=True)
+            finally:
+                if self.profiler:
+                    self.profiler.stop()
+                if mutex and self.timeline is not None and (
+                        self.timeline.recording):
+                    self.timeline.stop()
+                    self.updateReplayControl()
             if mutex and self.operationMutex.locked():
                 self.operationMutex.release()
             self.enableButtons()
@@ -503,6 +543,33 @@ class VisualizationApp(Visualization): # Base class for visualization apps
                 button.focus_set()     # Set focust back to operation button
         return animatedOperation
                 
+    def runInstantly(self, operation, *args, **kwargs):
+        '''Run an operation in instant mode where animations, code display
+        and highlighting, and waits are skipped.  The canvas is redrawn once
+        with the final state.  Returns the operation's result.'''
+        wasInstant, self.instantMode = self.instantMode, True
+        try:
+            return operation(*args, **kwargs)
+        finally:
+            self.instantMode = wasInstant
+            if not wasInstant:
+                self.window.update()
+
+    def updateReplayControl(self):
+        'Set the replay scale to the end of the timeline'
+        if self.replayScale is None:
+            return
+        frames = len(self.timeline)
+        self.replayScale.configure(to=frames, state=NORMAL)
+        self.replayScale.set(frames)   # Disabled scales can't be set
+        if frames == 0 or self.timeline.recording:
+            self.replayScale.configure(state=DISABLED)
+
+    def scrubTimeline(self, value):
+        'Show the canvas at a frame of the last operation\'s timeline'
+        if not self.timeline.recording:
+            self.timeline.seek(int(float(value)))
+
     def getArgument(self, index=0, clear=False):
         if 0 <= index and index < len(self.textEntries):
             val = self.textEntries[index].get()
@@ -571,11 +638,12 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             padX, padY = 10, 10
             self.codeTextCharWidth = textWidth( 
                 self.CODE_FONT, '0123456789') // 10
-            self.codeVScroll = Scrollbar(self.codeFrame, orient=VERTICAL)
+            self.codeVScroll = self.backend.Scrollbar(
+                self.codeFrame, orient=VERTICAL)
             self.vScrollWidth = max(
                 self.vScrollWidth, self.codeVScroll.winfo_width())
             width = self.codeTextWidth(padX, self.vScrollWidth)
-            self.codeText = Text(
+            self.codeText = self.backend.Text(
                 self.codeFrame, wrap=NONE, background=self.OPERATIONS_BG,
                 font=self.CODE_FONT, width=width,
                 height=self.MIN_CODE_CHARACTER_HEIGHT, padx=padX, pady=padY,
@@ -583,7 +651,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             self.codeText.grid(row=0, column=0, sticky=(N, E, S, W))
             self.codeVScroll['command'] = self.codeText.yview
             self.codeVScroll.grid(row=0, column=1, rowspan=2, sticky=(N, S))
-            self.codeHScroll = Scrollbar(
+            self.codeHScroll = self.backend.Scrollbar(
                 self.codeFrame, orient=HORIZONTAL, command=self.codeText.xview)
             self.codeHScroll.grid(row=1, column=0, sticky=(E, W))
             self.codeText['xscrollcommand'] = self.codeHScroll.set
@@ -721,6 +789,8 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         is 1 for the first instance of the string, 2 for the second, etc.
         Return's the given returnValue for use in Boolean expressions.
         '''
+        if self.instantMode:
+            return returnValue
         codeBlock = self.getCodeHighlightBlock(callEnviron)
         if self.codeText is None or codeBlock is None: 
             return returnValue   # This should only happen when code is hidden
@@ -738,7 +808,9 @@ class VisualizationApp(Visualization): # Base class for visualization apps
                     for frag in fragments]
         else:
             frags = [(fragments, 1)]
-        codeBlock.currentFragments = frags # Store standardized fragments
+        if frags != codeBlock.currentFragments:
+            codeBlock.currentFragments = frags # Store standardized fragments
+            self.highlightsVersion += 1
         tags = [codeBlock[frag] for frag in frags]
         found = False       # Assume tag not found
         for tagName in self.codeText.tag_names() if self.codeText else []:
@@ -779,6 +851,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         minStack = 1 if callEnviron else 0 # Don't clean beyond minimum, keep
         while len(self.callStack) > minStack: # 1st call unless cleaning all
             top = self.callStack.pop()
+            self.highlightsVersion += 1
             try:
                 self.cleanUpCallEnviron(top, sleepTime, allowSteps=allowSteps)
             except UserStop:
@@ -812,8 +885,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             inUserStop = self.removeCode(
                 codeBlock.code, sleepTime=sleepTime, allowSteps=allowSteps
             ) or inUserStop
-        for item in toDelete:
-            self.canvas.delete(item)
+        self.canvas.release(*toDelete)
         if inUserStop:
             raise UserStop()
 
@@ -830,7 +902,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         '''
         code = code.strip()
         callEnviron = set()
-        if len(code) > 0:
+        if len(code) > 0 and not self.instantMode:
             self.showCode(
                 code, addBoundary=True,
                 sleepTime=0 if (self.animationsStopped() and startAnimations
@@ -841,6 +913,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
             callEnviron.add(codeHighlightBlock)
             
         self.callStack.append(callEnviron) # Push environment on stack
+        self.highlightsVersion += 1
         if startAnimations:
             self.startAnimations(
                 state=startAnimations if isinstance(startAnimations, Animation)
@@ -853,7 +926,8 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         '''Remove the call environment from an iterator right before
         yielding its value.  The callEnviron must be on top of the
         call stack.  Returns a dictionary mapping item numbers to
-        coordinates for canvas items that are moved off canvas'''
+        coordinates and stacking positions for canvas items that are
+        moved off canvas.  They are all moved in one batch.'''
         if callEnviron is not self.callStack[-1]:
             raise Exception(
                 'Cannot yield from call environment that is not current')
@@ -861,32 +935,38 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         if codeBlock:
             self.removeCode(codeBlock.code, sleepTime=sleepTime)
         self.callStack.pop()
+        self.highlightsVersion += 1
         itemCoords = {}
         canvasDims = (V(self.canvasBounds[2:]) - self.canvasBounds[:2]
                       if self.canvasBounds else 
                       widgetDimensions(self.canvas))
         away = V(canvasDims) * 10
-        itemOrder = self.canvas.find_all()
-        for item in callEnviron:
-            if isinstance(item, int) and self.canvas.type(item):
-                coords = self.canvas.coords(item)
-                if any(self.withinCanvas((coords[j], coords[j + 1]))
-                       for j in range(0, len(coords), 2)):
-                    itemCoords[item] = (coords, itemOrder.index(item))
-                    self.canvas.coords(item, V(coords) +
-                                       V(away * (len(coords) // 2)))
+        position = dict(       # Stacking position of each item on the canvas
+            (item, j) for j, item in enumerate(self.canvas.find_all()))
+        with self.canvas.batch() as batch:
+            for item in callEnviron:
+                if isinstance(item, int) and item in position:
+                    coords = self.canvas.coords(item)
+                    if any(self.withinCanvas((coords[j], coords[j + 1]))
+                           for j in range(0, len(coords), 2)):
+                        itemCoords[item] = (coords, position[item])
+                        batch.move(item, *away)
         return itemCoords
 
     def resumeCallEnvironment(self, callEnviron, itemCoords, sleepTime=0):
         self.callStack.append(callEnviron)
+        self.highlightsVersion += 1
         codeBlock = self.getCodeHighlightBlock(callEnviron)
         if codeBlock:
             self.showCode(codeBlock.code, sleepTime=sleepTime,
                           addBoundary=True, allowStepping=False)
             codeBlock.markStart()
             self.highlightCode(codeBlock.currentFragments, callEnviron, wait=0)
-        for item in sorted(itemCoords.keys(), key=lambda x: itemCoords[x][1]):
-            self.canvas.coords(item, *itemCoords[item][0])
+        items = sorted(itemCoords.keys(), key=lambda x: itemCoords[x][1])
+        with self.canvas.batch() as batch:
+            for item in items:
+                batch.coords(item, *itemCoords[item][0])
+        for item in items:
             self.canvas.tag_raise(item)
 
     def callStackHighlights(self):
@@ -905,7 +985,13 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         and for user requested pauses.
         Stepping pauses when the current highlighted fragments on the call
         stack don't match those encountered in the last call to wait.
+        The fragments are only compared when the highlights version shows
+        that the highlights or call stack changed since then.
         '''
+        if self.timeline is not None:
+            self.timeline.endFrame()
+        if self.instantMode:
+            return
         if self.debugRequested:
             kwargs = {}
             if sys.version_info[:2] >= (3, 7):
@@ -919,35 +1005,29 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         if (self.animationsStepping() and
             buttonImage(self.pauseButton) != self.playControlImages['play']):
             buttonImage(self.pauseButton, self.playControlImages['play'])
-        highlights = self.callStackHighlights()
-        if (allowStepping and self.animationsStepping() and
-               self.lastHighlights != highlights):
-            if len(highlights) > 0 and highlights[-1]:
-                codeBlock = self.getCodeHighlightBlock(self.callStack[-1])
-                for fragment in reversed(highlights[-1]):
-                    for index in reversed(self.codeText.tag_ranges(
-                            codeBlock[fragment])):
-                        self.codeText.see(index)
-            while self.lastHighlights != highlights and self.animationsStepping():
-                self.window.update()
-                if self.destroyed:
-                    sys.exit()
-                time.sleep(0.02)
-                if self.destroyed:
-                    sys.exit()
-        self.lastHighlights = self.callStackHighlights()
+        if self.highlightsVersion != self.lastHighlightsVersion:
+            highlights = self.callStackHighlights()
+            if (allowStepping and self.animationsStepping() and
+                self.lastHighlights != highlights):
+                if len(highlights) > 0 and highlights[-1]:
+                    codeBlock = self.getCodeHighlightBlock(self.callStack[-1])
+                    for fragment in reversed(highlights[-1]):
+                        for index in reversed(self.codeText.tag_ranges(
+                                codeBlock[fragment])):
+                            self.codeText.see(index)
+                while (self.lastHighlights != highlights and
+                       self.animationsStepping()):
+                    self.waitForStateChange()
+                    if self.destroyed:
+                        sys.exit()
+            self.lastHighlights = self.callStackHighlights()
+            self.lastHighlightsVersion = self.highlightsVersion
         if sleepTime > 0:
-            self.window.update()
-            if self.destroyed:
-                sys.exit()
-            time.sleep(self.speed(sleepTime))
+            self.sleep(self.speed(sleepTime))
             if self.destroyed:
                 sys.exit()
         while self.animationsPaused():
-            self.window.update()
-            if self.destroyed:
-                sys.exit()
-            time.sleep(0.02)
+            self.waitForStateChange()
             if self.destroyed:
                 sys.exit()
             
@@ -1019,6 +1099,7 @@ class VisualizationApp(Visualization): # Base class for visualization apps
         change.
         '''
         self.lastHighlights = self.callStackHighlights()
+        self.lastHighlightsVersion = self.highlightsVersion
         self.startAnimations(state=Animation.STEP)
 
     def startAnimations(self, enableStops=True, state=None):
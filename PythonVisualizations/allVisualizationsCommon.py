@@ -3,7 +3,7 @@ __doc__ = """
 Common components of the runAllVisualization tools.
 """
 
-import sys, re, webbrowser, os, glob
+import sys, re, webbrowser, os, glob, inspect, json, queue, random, threading
 from importlib import *
 from tkinter import ttk
 
@@ -18,14 +18,26 @@ pathsep = re.compile(r'[/\\]')
 runVizCallPattern = re.compile(
     r'\n[^#]*\.runVisualization\(\)(?!.*#\s*runAllVisualizations ignore)')
 
-def findVisualizations(filesAndDirectories, verbose=0):
-    global VAPs
+# Cache of the visualization classes found in each file
+MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        '.visualizationManifest.json')
+MANIFEST_VERSION = 1
+
+def findVisualizations(filesAndDirectories, verbose=0, manifest=None):
+    '''Find the VisualizationApp subclasses defined in the files and the
+    python files of the directories.  If a manifest file is given, files
+    whose modification time and size match their entry in it are not read.
+    Their classes are returned as VisualizationClassProxy objects that
+    import the module when first called.  The manifest is updated with the
+    files that were read.'''
     classes = set()
     try:
         orig__path__ = sys.path
     except NameError:
         orig__path__ = None
         sys.path = []
+    entries = loadManifest(manifest) if manifest else {}
+    changed = False
     for fileOrDir in filesAndDirectories:
         isDir = os.path.isdir(fileOrDir)
         files = glob.glob(os.path.join(fileOrDir, '*.py')) if isDir else [
@@ -38,52 +50,136 @@ def findVisualizations(filesAndDirectories, verbose=0):
                 file=sys.stderr)
             if verbose > 2 and isDir:
                 print('Files:', '\n'.join(files), file=sys.stderr)
-        for filename in [f for f in files 
-                         if isPatternInFile(runVizCallPattern, f)]:
-            dirs = pathsep.split(os.path.normpath(os.path.dirname(filename)))
-            if dirs and dirs[0] == '.':
-                dirs.pop(0)
-            modulename, ext = os.path.splitext(os.path.basename(filename))
-            if modulename:
-                try:
-                    path = '/'.join(dirs)
-                    addPath = path and not path in sys.path
-                    if verbose > 1:
-                        if addPath:
-                            print('Adding {} to sys.path ...'.format(path),
-                                  file=sys.stderr)
-                        print('Attempting to import {} ... ' .format(
-                            modulename), file=sys.stderr, end='')
-                    if addPath:
-                        sys.path.append(path)
-                        try:
-                            vap = import_module('VisualizationApp')
-                            if not vap in VAPs:
-                                VAPs = (vap.VisualizationApp, *VAPs)
-                        except ModuleNotFoundError:
-                            pass
-                    module = import_module(modulename)
-                    if verbose > 1:
-                        print('Imported. Looking for VisualizationApp'
-                              .format(modulename), file=sys.stderr)
-                    newclasses = findVisualizationClasses(module, verbose)
-                    if verbose > 1:
-                        print('Found {} matching classes: {}'
-                              .format(len(newclasses), newclasses),
-                              file=sys.stderr)
-                        previouslyFound = set(newclasses) & classes
-                        if len(previouslyFound) > 0:
-                            print('Previously found:', previouslyFound,
-                                  file=sys.stderr)
-                    classes |= set(newclasses)
-                except ModuleNotFoundError:
-                    if verbose > 0:
-                        print('Unable to import module', modulename,
-                              file=sys.stderr)
+        for filename in files:
+            path = os.path.abspath(filename)
+            stat = os.stat(filename)
+            entry = entries.get(path)
+            if (entry and entry['mtime'] == stat.st_mtime and
+                entry['size'] == stat.st_size):
+                classes |= set(
+                    VisualizationClassProxy(
+                        name, entry['module'], os.path.dirname(path), title)
+                    for name, title in entry['classes'])
+                continue
+            newclasses = (importVisualizationClasses(filename, verbose)
+                          if isPatternInFile(runVizCallPattern, filename)
+                          else [])
+            if newclasses is None:
+                continue
+            if verbose > 1:
+                previouslyFound = set(newclasses) & classes
+                if len(previouslyFound) > 0:
+                    print('Previously found:', previouslyFound,
+                          file=sys.stderr)
+            classes |= set(newclasses)
+            if manifest:
+                entries[path] = {
+                    'mtime': stat.st_mtime, 'size': stat.st_size,
+                    'module': os.path.splitext(os.path.basename(path))[0],
+                    'classes': [[cls.__name__, appTitle(cls)]
+                                for cls in newclasses]}
+                changed = True
     if orig__path__ is not None:
         sys.path = orig__path__
+    if changed:
+        saveManifest(manifest, entries)
     return classes
 
+def importVisualizationClasses(filename, verbose=0):
+    '''Import a python file as a module and return the VisualizationApp
+    subclasses it defines, or None if it could not be imported'''
+    global VAPs
+    dirs = pathsep.split(os.path.normpath(os.path.dirname(filename)))
+    if dirs and dirs[0] == '.':
+        dirs.pop(0)
+    modulename, ext = os.path.splitext(os.path.basename(filename))
+    if not modulename:
+        return []
+    try:
+        path = '/'.join(dirs)
+        addPath = path and not path in sys.path
+        if verbose > 1:
+            if addPath:
+                print('Adding {} to sys.path ...'.format(path),
+                      file=sys.stderr)
+            print('Attempting to import {} ... ' .format(
+                modulename), file=sys.stderr, end='')
+        if addPath:
+            sys.path.append(path)
+            try:
+                vap = import_module('VisualizationApp')
+                if not vap in VAPs:
+                    VAPs = (vap.VisualizationApp, *VAPs)
+            except ModuleNotFoundError:
+                pass
+        module = import_module(modulename)
+        if verbose > 1:
+            print('Imported. Looking for VisualizationApp'
+                  .format(modulename), file=sys.stderr)
+        newclasses = findVisualizationClasses(module, verbose)
+        if verbose > 1:
+            print('Found {} matching classes: {}'
+                  .format(len(newclasses), newclasses),
+                  file=sys.stderr)
+        return newclasses
+    except ModuleNotFoundError:
+        if verbose > 0:
+            print('Unable to import module', modulename,
+                  file=sys.stderr)
+
+def loadManifest(manifest):
+    'Read the file entries of a manifest, or none if it is missing or stale'
+    try:
+        with open(manifest) as manifestFile:
+            contents = json.load(manifestFile)
+        if contents.get('version') == MANIFEST_VERSION:
+            return contents['files']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+def saveManifest(manifest, entries):
+    'Write the file entries to a manifest, if the file can be written'
+    try:
+        with open(manifest, 'w') as manifestFile:
+            json.dump({'version': MANIFEST_VERSION, 'files': entries},
+                      manifestFile, indent=1, sort_keys=True)
+    except OSError:
+        pass
+
+class VisualizationClassProxy(object):
+    '''Stand-in for a VisualizationApp subclass recorded in a manifest.
+    Calling it imports the class's module from its directory and constructs
+    the class.'''
+    def __init__(self, name, modulename, directory, title):
+        self.__name__ = name
+        self.__module__ = modulename
+        self.directory = directory
+        self.title = title
+        self.cls = None
+
+    def load(self):
+        'Import the module, if needed, and return the class'
+        if self.cls is None:
+            if self.directory not in sys.path:
+                sys.path.append(self.directory)
+            self.cls = getattr(import_module(self.__module__), self.__name__)
+        return self.cls
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __eq__(self, other):
+        return (isinstance(other, VisualizationClassProxy) and
+                (self.__module__, self.__name__) ==
+                (other.__module__, other.__name__))
+
+    def __hash__(self):
+        return hash((self.__module__, self.__name__))
+
+    def __repr__(self):
+        return '<proxy for class {}.{}>'.format(self.__module__, self.__name__)
+
 def isPatternInFile(textOrRegex, filename):
     with open(filename, 'r') as f:
         return (text in f.read()) if isinstance(textOrRegex, str) else (
@@ -177,4 +273,84 @@ def oneTimeShowHintHandler(visualizationApp, hintText=None, delay=500):
         visualizationApp.window.after(
             delay, lambda: visualizationApp.setHint(visualizationApp.textEntries[0], hintText)) and
         setattr(visualizationApp, 'initial_hint_shown', True))
-        
+
+def appTitle(appClass):
+    'Get the default title of a visualization class without constructing it'
+    if isinstance(appClass, VisualizationClassProxy):
+        return appClass.title
+    try:
+        title = inspect.signature(appClass).parameters.get('title')
+    except (TypeError, ValueError):
+        title = None
+    return (title.default if title and isinstance(title.default, str) else
+            appClass.__name__)
+
+def lazyAppMaker(appClass, pane, debug=False, verbose=0, manager='pack',
+                 seed=None, replay=False):
+    '''Make a function that constructs a visualization class in a pane the
+    first time it is called and returns the app, or None if the construction
+    failed.  The pane is bound to call it when first mapped, so the app is
+    only built when the user displays it.  Errors are shown in a label
+    placed in the pane with the named geometry manager.  If a seed is
+    given, the random number generator is seeded with it and the class name
+    before construction so the app starts the same whatever order the apps
+    are built in.  If replay is true, the app records its operations so
+    they can be replayed.'''
+    def makeApp(event=None):
+        if not hasattr(pane, 'vizApp'):
+            pane.vizApp = None
+            if verbose > 0:
+                print('Instantiating {}'.format(appClass.__name__),
+                      file=sys.stderr)
+            if seed:
+                random.seed('{} {}'.format(seed, appClass.__name__))
+            try:
+                pane.vizApp = appClass(window=pane, replay=replay)
+                pane.vizApp.DEBUG = debug
+            except Exception as e:
+                msg = 'Error instantiating {}:\n{}'.format(appClass.__name__, e)
+                label = ttk.Label(pane, text=msg, foreground='red')
+                getattr(label, manager)()
+                print(msg, file=sys.stderr)
+        if event and pane.vizApp:
+            oneTimeShowHintHandler(pane.vizApp)(event)
+        return pane.vizApp
+    pane.bind('<Map>', makeApp, '+')
+    return makeApp
+
+def preloadApps(widget, appClasses, appMakers, label=None, prewarm=False,
+                delay=20):
+    '''Import the modules of visualization classes on a worker thread
+    while the intro is shown.  The main thread polls a queue of the loaded
+    classes in after() callbacks, shows the progress in the label, and, if
+    prewarm is true, constructs each app with its maker, one per callback,
+    so the user interface stays interactive.'''
+    loaded = queue.Queue()
+    def load():
+        for index, appClass in enumerate(appClasses):
+            if isinstance(appClass, VisualizationClassProxy):
+                try:
+                    appClass.load()
+                except Exception as e:
+                    print('Unable to load {}: {}'.format(appClass.__name__, e),
+                          file=sys.stderr)
+            loaded.put(index)
+    def poll(count=0):
+        while count < len(appClasses):
+            try:
+                index = loaded.get_nowait()
+            except queue.Empty:
+                break
+            count += 1
+            if label is not None:
+                label['text'] = '\nLoading module {} of {} modules...'.format(
+                    count, len(appClasses))
+            if prewarm:
+                appMakers[index]()
+                break
+        if count < len(appClasses):
+            widget.after(delay, poll, count)
+        elif label is not None:
+            label['text'] = ''
+    threading.Thread(target=load, daemon=True).start()
+    widget.after(delay, poll)
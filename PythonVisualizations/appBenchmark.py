@@ -0,0 +1,330 @@
+#! /usr/bin/env python3
+__doc__ = """
+Benchmark of the visualization operations run without a display.
+Each VisualizationApp subclass is made with the recording backend, whose
+in-memory canvas stands in for Tk, and with its profiler enabled.  For
+each size, the data structure is filled with that many items and then
+every operation button is pressed once with random arguments.  The
+profiler's report on each operation gives the elapsed time, Tcl calls,
+and peak canvas items.  Operations that raise an error, find their button
+disabled, or make no canvas calls are failures.  The results can be saved
+as a baseline and later results compared with it.  The Tcl call and peak
+item counts do not depend on the machine, so any change in them is
+flagged.  Elapsed times are compared only when given a tolerance.
+With the replay option, each operation is recorded on the app's timeline
+instead, and replaying it to its start and end must reproduce the canvas
+items and their stacking order from before and after the operation.
+"""
+
+import argparse, json, os, random, sys, time
+
+try:
+    from recordingBackend import *
+    from allVisualizationsCommon import findVisualizations
+except ModuleNotFoundError:
+    from .recordingBackend import *
+    from .allVisualizationsCommon import findVisualizations
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'appBenchmarkBaseline.json')
+
+# Largest size to use for visualizations whose work grows very fast or
+# whose structures have room for only a few more items
+MAX_SIZES = {'TowerOfHanoi': 5, 'SkipList': 5, 'Graph': 10,
+             'WeightedGraph': 10, 'LinkedList': 10, 'OrderedList': 10,
+             'Queue': 10, 'PriorityQueue': 10}
+
+# Buttons that control the animation rather than run operations
+CONTROLS = ('Stop', 'Pause', 'Play', 'Step')
+
+# Room left for inserting items when making a structure to fill
+ROOM = 2
+
+# Arguments that follow the size for New buttons that take more than one
+NEW_ARGUMENTS = {'BloomFilter': (3, 0.05)}
+
+# Measures that must match the baseline exactly
+COUNTS = ('totalTclCalls', 'peakItems')
+MIN_TIME_CHANGE = 0.05   # Ignore elapsed time changes smaller than this
+
+def operationButtons(app):
+    '''Return the operation buttons of an app in the order to run them:
+    those that keep the items first, then those that delete items, and
+    last those that replace the data structure'''
+    withArgs, withoutArgs = app.getOperations()
+    return sorted([button for button in reversed(withArgs + withoutArgs)
+                   if isinstance(button, app.buttonTypes) and not isinstance(
+                           button, (app.backend.Checkbutton,
+                                    app.backend.Radiobutton)) and
+                   button['text'].strip() not in CONTROLS],
+                  key=operationOrder)
+
+def operationOrder(button):
+    text = button['text'].lower()
+    return (2 if text.startswith('new') or 'fill' in text or 'erase' in text
+            else 1 if any(word in text for word in ('delete', 'remove', 'pop'))
+            else 0)
+
+def arguments(app, button, size):
+    '''Choose the arguments for a button.  Buttons that make or fill a
+    structure get its size.  Graphs use the labels of existing vertices,
+    or a new label for making vertices.  Partitions use a value in the
+    array, as quicksort does.  Others get a random key.'''
+    text = button['text'].strip()
+    if text == 'New':
+        return [size, *NEW_ARGUMENTS.get(type(app).__name__, ())]
+    if 'fill' in text.lower() or 'random' in text.lower():
+        return [size]
+    if text == 'Partition' and app.list:
+        return [random.choice(app.list).val]
+    if getattr(app, 'vertices', None):
+        return ['Z' if text.startswith('New') else
+                random.choice(list(app.vertices))]
+    return [random.randrange(1, min(size * 10, 100))]
+
+def setArguments(app, button, values):
+    'Set the arguments that a button requires to the given values'
+    for i in range(getattr(button, 'required_args', 0)):
+        app.setArgument(str(values[min(i, len(values) - 1)]), i)
+
+def press(app, button):
+    '''Press a button and return the error it raised, if any.  Pressing a
+    disabled button is an error as nothing would run.'''
+    if widgetState(button) == DISABLED:
+        return 'Button {} is disabled'.format(button['text'].strip())
+    try:
+        button.invoke()
+    except Exception as error:
+        return '{}: {}'.format(type(error).__name__, error)
+
+def fill(app, buttons, size):
+    '''Make the data structure hold size items.  A new structure is made
+    with room for a few more than size items, if it has a New button that
+    takes arguments.  Then a fill button that takes the number of items is
+    used if there is one, or else size random values are inserted.  Graphs
+    get edges and selected vertices too.'''
+    error = None
+    for button in buttons:
+        if (button['text'].strip() == 'New' and
+            getattr(button, 'required_args', 0) > 0):
+            setArguments(app, button, arguments(app, button, size + ROOM))
+            error = press(app, button)
+            break
+    fillers = [button for button in buttons
+               if 'fill' in button['text'].lower() and
+               getattr(button, 'required_args', 0) == 1]
+    if fillers and not error:
+        setArguments(app, fillers[0], [size])
+        error = press(app, fillers[0])
+    elif not error:
+        inserters = [button for button in buttons
+                     if button['text'] in ('Insert', 'Push', 'Evaluate')]
+        for j in range(size if inserters else 0):
+            setArguments(app, inserters[0],
+                         arguments(app, inserters[0], size))
+            error = press(app, inserters[0])
+            if error:
+                break
+    if getattr(app, 'vertices', None) and hasattr(app, 'selectVertex'):
+        fillGraph(app, size)
+    return error
+
+def fillGraph(app, size):
+    '''Connect the vertices of a graph with directed edges, if it allows
+    them, that go from earlier to later labels so the graph can be sorted
+    topologically, and select the first vertices, which reach the rest'''
+    if getattr(app, 'bidirectionalEdgesButton', None):
+        app.bidirectionalEdges.set(0)
+    labels = sorted(app.vertices)
+    pairs = [(random.choice(labels[:j]), labels[j])
+             for j in range(1, len(labels))]
+    pairs += [tuple(sorted(random.sample(labels, 2))) for j in range(size // 2)]
+    for fromVert, toVert in dict.fromkeys(pairs):
+        app.createEdge(fromVert, toVert, random.randrange(1, 10))
+    for vID, label in enumerate(labels[:len(app.selectedVertices)]):
+        app.selectVertex(label, vID)
+    app.enableButtons()
+
+def benchmarkApp(appClass, size, seed=0, replay=False):
+    '''Run all the operations of an app class on a structure of the given
+    size.  Return a dictionary of the profiler report for each operation.
+    If replay is set, check the replay of each operation's timeline.'''
+    random.seed('{} {} {}'.format(appClass.__name__, size, seed))
+    app = appClass(backend=RecordingBackend(), profile=True, replay=replay)
+    buttons = operationButtons(app)
+    results = {}
+    error = fill(app, buttons, size)
+    if error:
+        results['fill'] = {'error': error}
+    for button in buttons:
+        name = button['text'].strip()
+        setArguments(app, button, arguments(app, button, size))
+        if replay:
+            app.cleanUp()
+            start = app.timeline.snapshot()
+        app.profiler.reports = []
+        error = press(app, button)
+        reports = app.profiler.reports
+        result = reports[-1] if reports else {}
+        for counts in ('tclCalls', 'batchedCommands'):
+            result.pop(counts, None)
+        if not (error or result.get('totalTclCalls')):
+            error = 'No operation ran' if not result else 'No canvas calls'
+        if replay and not error:
+            error = checkReplay(app.timeline, start)
+        if error:
+            result['error'] = error
+        results[name] = result
+    app.window.destroy()
+    return results
+
+def checkReplay(timeline, start):
+    '''Check that moving an operation's timeline to its start and end shows
+    the canvas as it was before and after the operation.  Return an error
+    for the first position that differs, if any.'''
+    if len(timeline) == 0:   # Operations run without the mutex are not
+        return None          # recorded
+    end = timeline.snapshot()
+    for position, expected in ((0, start), (len(timeline), end)):
+        if position == 0 and len(timeline) == timeline.maxFrames:
+            continue         # Full timelines have dropped their first frames
+        timeline.seek(position)
+        if timeline.snapshot() != expected:
+            return 'Replay to frame {} differs'.format(position)
+
+def runBenchmarks(appClasses, sizes, seed=0, verbose=False, replay=False):
+    'Return results for each app name, size, and operation'
+    results = {}
+    for appClass in appClasses:
+        name = appClass.__name__
+        results[name] = {}
+        for size in sizes:
+            if size > MAX_SIZES.get(name, size):
+                continue
+            start = time.perf_counter()
+            results[name][str(size)] = benchmarkApp(
+                appClass, size, seed, replay)
+            if verbose:
+                print('{} size {} took {:.2f} s'.format(
+                    name, size, time.perf_counter() - start), file=sys.stderr)
+    return results
+
+def compare(results, baseline, timeTolerance=None, apps=None, sizes=None):
+    '''Compare results with a baseline and return a list of differences as
+    (app, size, operation, measure, baseline value, new value) tuples.
+    Errors are always differences.  Counts differ if they change at all.
+    Elapsed time differs if it grows by more than the tolerance fraction,
+    when one is given.  Operations in the baseline for the apps and sizes
+    that were run, or all of them by default, are differences if they are
+    missing from the results.'''
+    differences = []
+    for app in baseline if apps is None else apps:
+        for size, operations in baseline.get(app, {}).items():
+            if sizes is None or size in sizes:
+                differences.extend(
+                    (app, size, operation, 'result', 'present', 'missing')
+                    for operation in operations
+                    if operation not in results.get(app, {}).get(size, {}))
+    for app, sizes in results.items():
+        for size, operations in sizes.items():
+            for operation, result in operations.items():
+                base = baseline.get(app, {}).get(size, {}).get(operation, {})
+                if 'error' in result:
+                    differences.append(
+                        (app, size, operation, 'error', base.get('error'),
+                         result['error']))
+                if not base:
+                    continue
+                for measure in COUNTS:
+                    old, new = base.get(measure), result.get(measure)
+                    if old != new:
+                        differences.append(
+                            (app, size, operation, measure, old, new))
+                old, new = base.get('elapsed'), result.get('elapsed')
+                if (timeTolerance is not None and None not in (old, new) and
+                    new > old * (1 + timeTolerance) and
+                    new - old >= MIN_TIME_CHANGE):
+                    differences.append(
+                        (app, size, operation, 'elapsed', old, new))
+    return differences
+
+def findAppClasses(names=()):
+    classes = sorted(findVisualizations(
+        [os.path.dirname(os.path.abspath(__file__))]),
+                     key=lambda appClass: appClass.__name__)
+    return [appClass for appClass in classes
+            if not names or appClass.__name__ in names or
+            appClass.__module__ in names]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'apps', nargs='*',
+        help='Names of visualization classes or modules to run.  '
+        'Runs all that are found, by default.')
+    parser.add_argument(
+        '-s', '--sizes', nargs='+', type=int, default=[5, 10, 20],
+        help='Numbers of items to put in each data structure')
+    parser.add_argument(
+        '-b', '--baseline', default=BASELINE,
+        help='JSON file of baseline results')
+    parser.add_argument(
+        '--save', action='store_true',
+        help='Save the results as the new baseline, merged with the '
+        'results of other apps in the baseline file')
+    parser.add_argument(
+        '-T', '--time-tolerance', type=float,
+        help='Fraction of increase in elapsed time to allow.  Elapsed times '
+        'depend on the machine and are not compared, by default.')
+    parser.add_argument(
+        '--seed', type=int, default=0, help='Random number seed')
+    parser.add_argument(
+        '-r', '--replay', action='store_true',
+        help='Check the replay of each operation instead of comparing the '
+        'results with the baseline')
+    parser.add_argument(
+        '-v', '--verbose', action='store_true',
+        help='Print progress and a table of the results')
+    args = parser.parse_args()
+    if args.replay and args.save:
+        parser.error('Results of replay checks cannot be saved')
+
+    results = runBenchmarks(findAppClasses(args.apps), args.sizes, args.seed,
+                            args.verbose, args.replay)
+    if args.verbose:
+        print('{:24s} {:>4s} {:28s} {:>8s} {:>7s} {:>6s}'.format(
+            'Visualization', 'Size', 'Operation', 'Time (s)', 'Tcl', 'Peak'))
+        for app, sizes in results.items():
+            for size, operations in sizes.items():
+                for operation, result in operations.items():
+                    print('{:24s} {:>4s} {:28s} {:8.3f} {:7d} {:6d}{}'.format(
+                        app, size, operation[:28], result.get('elapsed', 0),
+                        result.get('totalTclCalls', 0),
+                        result.get('peakItems', 0),
+                        '  ' + result['error'] if 'error' in result else ''))
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as baselineFile:
+            baseline = json.load(baselineFile)
+    differences = compare(
+        results, {} if args.save or args.replay else baseline,
+        args.time_tolerance, sorted(set(results).union(args.apps)) if args.apps
+        else None, [str(size) for size in args.sizes])
+    for difference in differences:
+        print('Difference in {} size {} {}: {} went from {} to {}'.format(
+            *difference))
+    if args.save and differences:
+        print('Not saving results with errors in', args.baseline)
+    elif args.save:
+        baseline.update(results)
+        with open(args.baseline, 'w') as baselineFile:
+            json.dump(baseline, baselineFile, indent=1, sort_keys=True)
+        print('Saved results in', args.baseline)
+    else:
+        print('{} difference{} found {}'.format(
+            len(differences), '' if len(differences) == 1 else 's',
+            'in replay checks' if args.replay else
+            'compared to ' + args.baseline))
+    sys.exit(1 if differences else 0)
@@ -3,18 +3,31 @@
 # operations on them.  The operations return tuples not vectors, but can
 # easily be converted by wrapping the result in vector() constructor, e.g.
 # vector(*result)
+# Constructing a vector of 2 coordinates makes a vector2d, which has fast
+# paths for 2-D arithmetic, and vector2dArray holds a batch of 2-D vectors.
 
 from itertools import *
 from operator import *
+from array import array
 import math
 
+try:                          # NumPy is optional.  When present, it is used
+    import numpy as _np       # to compute whole animation trajectories at once
+except ModuleNotFoundError:
+    _np = None
+
 class vector(object):
+    __slots__ = ('coords',)
+
     # Constructor accepts multiple coordinate parameters: vector(3, 4, 5) or
     # a sequence containing coordinates: vector([3, 4, 5])
-    def __init__(self, *coords):
-        self.coords = tuple(coords[0]) if (
-            len(coords) == 1 and isinstance(coords[0], (list, tuple, set))
-        ) else coords
+    def __new__(cls, *coords):
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple, set)):
+            coords = tuple(coords[0])
+        self = object.__new__(
+            vector2d if cls is vector and len(coords) == 2 else cls)
+        self.coords = coords
+        return self
 
     def __len__(self):
         return len(self.coords)
@@ -127,6 +140,144 @@ class vector(object):
         'Get normal vector of a 2-D vector'
         return - self.coords[1], self.coords[0]
 
+class vector2d(vector):
+    '''A vector of 2 coordinates.  The operations give the same results as
+    vector's, but handle pairs of coordinates directly rather than mapping
+    over tuples of any length.'''
+    __slots__ = ()
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, key):
+        if key.__class__ is int and 0 <= key < 2:
+            return self.coords[key]
+        return vector.__getitem__(self, key)
+
+    def __add__(self, other):
+        x, y = self.coords
+        if isinstance(other, vector2d):
+            ox, oy = other.coords
+        elif isinstance(other, (int, float)):
+            return (x + other, y + other)
+        elif isinstance(other, (list, tuple)) and len(other) == 2:
+            ox, oy = other
+        else:
+            return vector.__add__(self, other)
+        return (x + ox, y + oy)
+
+    def __sub__(self, other):
+        x, y = self.coords
+        if isinstance(other, vector2d):
+            ox, oy = other.coords
+        elif isinstance(other, (int, float)):
+            return (x - other, y - other)
+        elif isinstance(other, (list, tuple)) and len(other) == 2:
+            ox, oy = other
+        else:
+            return vector.__sub__(self, other)
+        return (x - ox, y - oy)
+
+    def __mul__(self, other):
+        x, y = self.coords
+        if isinstance(other, (int, float)):
+            return (x * other, y * other)
+        elif isinstance(other, vector2d):
+            ox, oy = other.coords
+        elif isinstance(other, (list, tuple)) and len(other) == 2:
+            ox, oy = other
+        else:
+            return vector.__mul__(self, other)
+        return (x * ox, y * oy)
+
+    def __truediv__(self, other):
+        x, y = self.coords
+        if isinstance(other, (int, float)):
+            return (x / other, y / other)
+        return vector.__truediv__(self, other)
+
+    def dot(self, other):
+        x, y = self.coords
+        if isinstance(other, vector2d):
+            ox, oy = other.coords
+        elif isinstance(other, (list, tuple)) and len(other) == 2:
+            ox, oy = other
+        else:
+            return vector.dot(self, other)
+        return 0 + x * ox + y * oy  # Start from 0 like sum()
+
+    def len2(self):
+        x, y = self.coords
+        return 0 + x * x + y * y
+
+    def rotate(self, angle, radians=False):
+        'Rotate a 2-D vector by an angle'
+        a = angle if radians else math.radians(angle)
+        s, c = math.sin(a), math.cos(a)
+        x, y = self.coords
+        return (0 + x * c + y * -s, 0 + x * s + y * c)
+
+class vector2dArray(object):
+    '''A batch of 2-D vectors stored as a flat array of doubles: x0, y0, x1,
+    y1, ...  Arithmetic applies to every vector in the batch and returns a
+    new batch.  The other operand can be a batch of the same size, a single
+    2-D vector or point, or a number.  Iterating over a batch yields its
+    vectors as tuples.'''
+    __slots__ = ('coords',)
+
+    def __init__(self, coords=()): # Flat sequence of coordinates
+        self.coords = coords if isinstance(coords, array) else array(
+            'd', coords)
+
+    def __len__(self):
+        return len(self.coords) // 2
+
+    def __iter__(self):
+        return iter(points(*self.coords))
+
+    def __getitem__(self, index):
+        j = range(len(self))[index] * 2
+        return tuple(self.coords[j:j + 2])
+
+    def tolist(self):
+        'Return the flat list of coordinates'
+        return self.coords.tolist()
+
+    def combine(self, op, other):
+        'Apply a binary operator to each coordinate and another operand'
+        if isinstance(other, vector2dArray):
+            return vector2dArray(array('d', map(op, self.coords, other.coords)))
+        if isinstance(other, (int, float)):
+            return vector2dArray(array('d', [op(c, other) for c in self.coords]))
+        ox, oy = other[0], other[1]
+        result = array('d', self.coords)
+        result[0::2] = array('d', [op(x, ox) for x in self.coords[0::2]])
+        result[1::2] = array('d', [op(y, oy) for y in self.coords[1::2]])
+        return vector2dArray(result)
+
+    def __add__(self, other): return self.combine(add, other)
+    def __sub__(self, other): return self.combine(sub, other)
+    def __mul__(self, other): return self.combine(mul, other)
+    def __truediv__(self, other): return self.combine(truediv, other)
+
+    def dot(self, other):
+        'Return an array of the dot products of each vector with other'
+        products = (self * other).coords
+        return array('d', map(add, products[0::2], products[1::2]))
+
+    def len2(self):
+        return self.dot(self)
+
+    def rotate(self, angle, radians=False):
+        'Rotate all the 2-D vectors by an angle'
+        a = angle if radians else math.radians(angle)
+        s, c = math.sin(a), math.cos(a)
+        xs, ys = self.coords[0::2], self.coords[1::2]
+        result = array('d', self.coords)
+        result[0::2] = array('d', [x * c + y * -s for x, y in zip(xs, ys)])
+        result[1::2] = array('d', [x * s + y * c for x, y in zip(xs, ys)])
+        return vector2dArray(result)
+
 def collinear(p1, p2, p3, threshold=1e-8):
     'Test if three points are collinear'
     d1, d2 = vector(vector(p2) - vector(p1)), vector(vector(p3) - vector(p1))
@@ -161,6 +312,62 @@ def bbox(*points): # Return the bounding box of a sequence of points/vectors
         tuple(min(*(p[i] for p in points)) for i in range(mindim)),
         tuple(max(*(p[i] for p in points)) for i in range(mindim)))
 
+# Trajectories for animating the movement of multiple canvas items.  These
+# generators yield one list per animation step with an entry for each
+# item.  With NumPy, the whole (steps x items x coordinates) trajectory is
+# computed at once and each step's entries are sliced from one array row.
+# Without it, each step is computed for all items with vector2dArray.
+def linearTrajectory(starts, deltas, steps):
+    '''Yield the coordinates of items at each step as they move linearly
+    from their starting coordinates by (steps * deltas)'''
+    lengths = [min(len(start), len(delta))
+               for start, delta in zip(starts, deltas)]
+    offsets = list(accumulate(lengths, initial=0))
+    start = flat(*(s[:n] for s, n in zip(starts, lengths)))
+    delta = flat(*(d[:n] for d, n in zip(deltas, lengths)))
+    if _np is None:
+        start, delta = vector2dArray(start), vector2dArray(delta)
+        trajectory = ((start + delta * step).tolist()
+                      for step in range(1, steps + 1))
+    else:
+        trajectory = (_np.array(start, dtype=float) +
+                      _np.arange(1, steps + 1)[:, None] *
+                      _np.array(delta, dtype=float)).tolist()
+    for row in trajectory:
+        yield [row[offsets[j]:offsets[j + 1]] for j in range(len(lengths))]
+
+def curveTrajectory(starts, ends, startAngle, steps):
+    '''Yield the 2-D movement vectors of items at each step as they move
+    from their start to end points along curves.  The curves start at
+    startAngle away from the direction to the end point and the angle
+    decreases linearly to 0 at the last step.'''
+    if _np is None:
+        position = vector2dArray(flat(*(p[:2] for p in starts)))
+        end = vector2dArray(flat(*(p[:2] for p in ends)))
+        for step in range(steps):
+            toGo = steps - 1 - step
+            ang = startAngle * toGo / steps
+            scale = 1 + abs(ang) / 180
+            moves = ((end - position) / ((toGo + 1) / scale)).rotate(ang)
+            position += moves
+            yield list(moves)
+        return
+    position = _np.array(starts, dtype=float).reshape(-1, 2)
+    end = _np.array(ends, dtype=float).reshape(-1, 2)
+    moves = _np.empty((steps, len(position), 2))
+    for step in range(steps):
+        toGo = steps - 1 - step
+        ang = startAngle * toGo / steps
+        scale = 1 + abs(ang) / 180
+        a = math.radians(ang)
+        s, c = math.sin(a), math.cos(a)
+        toEnd = (end - position) / ((toGo + 1) / scale)
+        moves[step, :, 0] = toEnd[:, 0] * c + toEnd[:, 1] * -s
+        moves[step, :, 1] = toEnd[:, 0] * s + toEnd[:, 1] * c
+        position += moves[step]
+    for row in moves.tolist():
+        yield row
+
 # Return the n vertices of regular polygon of nGon sides starting from
 # a particular angle and going clockwise
 def convexPolygon(center, radius, nGon, startAngle=90):
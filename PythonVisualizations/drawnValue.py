@@ -1,8 +1,7 @@
-import functools
-
-@functools.total_ordering
 class drawnValue(object):
     'A record describing a value drawn in a Tk canvas to represent a value'
+    __slots__ = ('val', 'items')  # No per-instance dictionary
+
     def __init__(            # Constructor
             self,            # The value is usually the key used in sorting
             val=None,        # values in a data structure
@@ -11,7 +10,6 @@ class drawnValue(object):
         self.items = items
 
     __fields = ('val', 'items')
-    __legacy_fields = ('display_shape', 'display_val')
 
     def __getitem__(self, key): # Implement positIonal access
         if isinstance(key, int):
@@ -28,9 +26,7 @@ class drawnValue(object):
             return getattr(self, key)
         raise ValueError
 
-    def __getattr__(self, name):
-        if name in self.__legacy_fields:
-            return self[self.__legacy_fields.index(name) + 1]
+    def __getattr__(self, name): # Only called when normal lookup fails
         raise AttributeError('drawnValue has no attribute {}'.format(
             repr(name)))
 
@@ -40,37 +36,50 @@ class drawnValue(object):
                 self.val = val
                 return self
             if 1 <= key and key < 1 + len(self.items):
-                self.items = tuple(
-                    val if i == key-1 else v for i, v in enumerate(self.items))
+                self.items = self.items[:key-1] + (val,) + self.items[key:]
                 return self
             raise IndexError
         elif isinstance(key, str):
             return setattr(self, key, val)
         raise ValueError
 
-    def __setattr__(self, name, val):
-        if name in self.__fields:
-            return object.__setattr__(self, name, val)
-        if name in self.__legacy_fields:
-            pos = self.__legacy_fields.index(name)
-            self.items = tuple(
-                val if i == pos else v for i, v in enumerate(self.items))
-            return 
-        raise AttributeError('drawnValue has no attribute {} to set'.format(
-            repr(name)))
+    def __setLegacyField(self, key, val): # Setting a legacy field beyond
+        if key <= len(self.items):         # the items is silently ignored
+            self.__setitem__(key, val)
+
+    # Legacy fields are the first two canvas items
+    display_shape = property(
+        lambda self: self[1],
+        lambda self, val: self.__setLegacyField(1, val))
+    display_val = property(
+        lambda self: self[2],
+        lambda self, val: self.__setLegacyField(2, val))
+
+    # Comparisons only test the value to preserve sort stability
+    def __eq__(self, other):
+        if isinstance(other, drawnValue):
+            return self.val == other.val
+        return NotImplemented
 
-    def __eq__(self, other):  # Equality test between drawnValues
-        if self._is_valid_operand(other): # Only test value to preserve
-            return self.val == other.val  # sort stability
+    def __lt__(self, other):
+        if isinstance(other, drawnValue):
+            return self.val < other.val
         return NotImplemented
 
-    def __lt__(self, other):  # Less than test between drawnValues
-        if self._is_valid_operand(other): # Only test value to preserve
-            return self.val < other.val   # sort stability
+    def __le__(self, other):
+        if isinstance(other, drawnValue):
+            return self.val < other.val or self.val == other.val
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, drawnValue):
+            return not self.val < other.val and self.val != other.val
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, drawnValue):
+            return not self.val < other.val
         return NotImplemented
-        
-    def _is_valid_operand(self, other): # Check that other is drawnValue
-        return isinstance(other, drawnValue)
 
     def __len__(self):
         return 1 + len(self.items)
@@ -81,7 +90,7 @@ class drawnValue(object):
             for attr in self.__fields))
         
     def copy(self):          # Retun a copy of this drawnValue
-        return drawnValue(*(attr for attr in self))
+        return drawnValue(self.val, *self.items)
 
     def color(self, canvas): # Get fill color of first canvas item
         mainItem = None      # Look for canvas item IDs among items and get
@@ -0,0 +1,195 @@
+__doc__ = """
+Benchmark of the drawnValue records used by arrays, heaps, hash tables,
+and graphs.  It measures the memory used per drawnValue and times
+workloads that follow what the visualizations do with them: sorting and
+swapping array cells as in SortingBase, sifting items down a heap as in
+Heap.siftDown, and inserting keys in an open addressing hash table.
+Each measurement is made for drawnValue and for the earlier version of
+the class, which had an instance dictionary, handled the legacy fields
+in __getattr__ and __setattr__, and derived comparisons with
+functools.total_ordering.
+"""
+
+import argparse, functools, random, timeit, tracemalloc
+
+try:
+    from drawnValue import *
+except ModuleNotFoundError:
+    from .drawnValue import *
+
+@functools.total_ordering
+class legacyDrawnValue(object):
+    'The earlier drawnValue class, kept to compare with the current one'
+    def __init__(self, val=None, *items):
+        self.val = val
+        self.items = items
+
+    __fields = ('val', 'items')
+    __legacy_fields = ('display_shape', 'display_val')
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            if 0 == key:
+                return self.val
+            if 1 <= key and key < 1 + len(self.items):
+                return self.items[key-1]
+            raise IndexError
+        elif isinstance(key, slice):
+            return [self[k] for k in range(key.start or 0,
+                                           key.stop or 1 + len(self.items),
+                                           key.step or 1)]
+        elif isinstance(key, str):
+            return getattr(self, key)
+        raise ValueError
+
+    def __getattr__(self, name):
+        if name in self.__legacy_fields:
+            return self[self.__legacy_fields.index(name) + 1]
+        raise AttributeError('drawnValue has no attribute {}'.format(
+            repr(name)))
+
+    def __setitem__(self, key, val):
+        if isinstance(key, int):
+            if 0 == key:
+                self.val = val
+                return self
+            if 1 <= key and key < 1 + len(self.items):
+                self.items = tuple(
+                    val if i == key-1 else v for i, v in enumerate(self.items))
+                return self
+            raise IndexError
+        elif isinstance(key, str):
+            return setattr(self, key, val)
+        raise ValueError
+
+    def __setattr__(self, name, val):
+        if name in self.__fields:
+            return object.__setattr__(self, name, val)
+        if name in self.__legacy_fields:
+            pos = self.__legacy_fields.index(name)
+            self.items = tuple(
+                val if i == pos else v for i, v in enumerate(self.items))
+            return
+        raise AttributeError('drawnValue has no attribute {} to set'.format(
+            repr(name)))
+
+    def __eq__(self, other):
+        if self._is_valid_operand(other):
+            return self.val == other.val
+        return NotImplemented
+
+    def __lt__(self, other):
+        if self._is_valid_operand(other):
+            return self.val < other.val
+        return NotImplemented
+
+    def _is_valid_operand(self, other):
+        return isinstance(other, legacyDrawnValue)
+
+    def __len__(self):
+        return 1 + len(self.items)
+
+    def copy(self):
+        return legacyDrawnValue(*(attr for attr in self))
+
+CLASSES = (drawnValue, legacyDrawnValue)
+
+def makeValues(N, nItems=2, cls=drawnValue):
+    'Make drawnValues with random keys and nItems fake canvas item IDs'
+    return [cls(random.randrange(N * 10),
+                *range(j * nItems + 1, (j + 1) * nItems + 1))
+            for j in range(N)]
+
+def memoryPerValue(N=10000, cls=drawnValue):
+    'Return the bytes allocated per drawnValue holding 2 canvas items'
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = makeValues(N, cls=cls)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(values)
+
+def sortValues(values):
+    'Sort the values and then compare neighbors with all the operators'
+    values = sorted(values)
+    for a, b in zip(values, values[1:]):
+        a < b, a <= b, a > b, a >= b, a == b
+
+def swapValues(values, passes=10):
+    'Swap cells the way SortingBase.swap does in passes of a bubble sort'
+    values = list(values)
+    for last in range(len(values) - 1, len(values) - 1 - passes, -1):
+        for j in range(last):
+            if values[j] > values[j + 1]:
+                A, B = values[j], values[j + 1]
+                A.items + (), B.items + ()
+                values[j], values[j + 1] = values[j + 1], values[j]
+
+def siftDown(values):
+    'Heapify the values by sifting items down the way Heap.siftDown does'
+    arr = [value.copy() for value in values]
+    N = len(arr)
+    firstleaf = N // 2
+    for i in range(firstleaf - 1, -1, -1):
+        downItem = arr[i].copy()
+        itemkey = downItem.val
+        while i < firstleaf:
+            left, right = i + i + 1, i + i + 2
+            maxi = left
+            if right < N and arr[left] < arr[right]:
+                maxi = right
+            if itemkey < arr[maxi].val:
+                arr[i].val, arr[i].items = arr[maxi].val, arr[maxi].items
+                i = maxi
+            else:
+                break
+        arr[i].val, arr[i].items = downItem.val, downItem.items
+
+def hashInserts(values):
+    'Insert keys in an open addressing table, then mark items as found'
+    size = len(values) * 2 + 1
+    table = [None] * size
+    for value in values:
+        i = value.val % size
+        while table[i] is not None and table[i].val != value.val:
+            i = (i + 1) % size
+        table[i] = type(value)(value.val, *value.items)
+        table[i][1] = table[i].display_val
+        table[i].display_shape = table[i][2]
+
+WORKLOADS = (sortValues, swapValues, siftDown, hashInserts)
+
+def benchmark(N=1000, repeat=5, number=5):
+    '''Return the best time of each workload on N random drawnValues of
+    each class'''
+    results = []
+    for workload in WORKLOADS:
+        times = []
+        for cls in CLASSES:
+            random.seed(N)
+            values = makeValues(N, cls=cls)
+            times.append(min(timeit.repeat(lambda: workload(values),
+                                           repeat=repeat, number=number)))
+        results.append((workload.__name__, *times))
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'sizes', nargs='*', type=int, default=[100, 1000],
+        help='Numbers of drawnValues to use in the workloads')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='Number of timings of each workload, keeping the best')
+    parser.add_argument(
+        '-n', '--number', type=int, default=5,
+        help='Number of runs of the workload per timing')
+    args = parser.parse_args()
+    print('Memory per drawnValue: {:.1f} bytes, legacy {:.1f} bytes'.format(
+        *(memoryPerValue(cls=cls) for cls in CLASSES)))
+    print('{:12s} {:>8s} {:>10s} {:>10s} {:>8s}'.format(
+        'Workload', 'Size', 'Time (s)', 'Legacy', 'Speedup'))
+    for N in args.sizes:
+        for name, time, legacy in benchmark(N, args.repeat, args.number):
+            print('{:12s} {:8d} {:10.4f} {:10.4f} {:7.2f}x'.format(
+                name, N, time, legacy, legacy / time))
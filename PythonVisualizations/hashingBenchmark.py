@@ -0,0 +1,190 @@
+__doc__ = """
+Benchmark of the Hashing module.  The setup section measures the time and
+memory used to import the module, which sets up the random bits that
+bitHash uses for each character, and compares them with filling a list
+with random bits for every Unicode character as the module did before it
+kept them in pages made when needed.  It also measures hashing characters
+beyond the Basic Multilingual Plane, which makes the pages up to their
+planes.  The hashing section compares the hash functions on sets
+of string and integer keys: throughput hashing one key at a time and in
+batches, avalanche as the fraction of the 64 low hash bits that change
+when one bit of a key changes, and uniformity as the chi-squared
+statistic of bucket counts over table sizes divided by its degrees of
+freedom, which is near 1 for uniformly distributed hashes.  The coverage
+section times computing the quadratic probe coverage for a range of
+table sizes.
+"""
+
+import argparse, os, random, subprocess, sys, timeit
+from collections import Counter
+
+try:
+    from Hashing import *
+except ModuleNotFoundError:
+    from .Hashing import *
+
+# Program run in a fresh interpreter to measure some setup code.  It
+# prints the seconds taken and the bytes allocated by the code.
+SETUP_PROGRAM = '''
+import sys, time, tracemalloc
+sys.path.insert(0, {directory!r})
+{imports}
+if {traceMemory}:
+    tracemalloc.start()
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start, tracemalloc.get_traced_memory()[0])
+'''
+
+SETUPS = (
+    ('List of all bits', 'import random',
+     'rand = random.Random("bitHash random numbers")\n'
+     'bits = [rand.getrandbits(64) for i in range(0x110000)]'),
+    ('Import Hashing', '', 'import Hashing'),
+    ('First astral hash', 'import Hashing', 'Hashing.bitHash(chr(0x10000))'),
+    ('Last astral hash', 'import Hashing', 'Hashing.bitHash(chr(0x10FFFF))'),
+)
+
+def measureSetup(imports, code, repeat=3):
+    '''Return the best time and the memory allocated for the setup code,
+    each measured in fresh interpreters'''
+    directory = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for traceMemory in (False, True):
+        program = SETUP_PROGRAM.format(
+            directory=directory, imports=imports, code=code,
+            traceMemory=traceMemory)
+        results.append(min(
+            [float(x) for x in subprocess.run(
+                [sys.executable, '-c', program], check=True,
+                capture_output=True, text=True).stdout.split()]
+            for j in range(repeat if not traceMemory else 1)))
+    return results[0][0], results[1][1]
+
+# Hash functions to compare: name, function, batch function, extra
+# arguments, and the types of keys they can hash
+HASH_FUNCTIONS = (
+    ('hashString1', hashString1, hashStrings1, (), (str,)),
+    ('hashString2', hashString2, hashStrings2, (), (str,)),
+    ('hashString3', hashString3, hashStrings3, (2 ** 31 - 1,), (str,)),
+    ('bitHash', bitHash, bitHashes, (), (str, int)),
+    ('multiplicativeHash', multiplicativeHash, multiplicativeHashes, (),
+     (str, int)),
+)
+
+def makeKeySets(N, seed=0):
+    '''Make N keys of each kind: random words of lowercase letters, ints
+    counting up from 0, and random 40-bit ints'''
+    rand = random.Random(seed)
+    words = set()
+    while len(words) < N:
+        words.add(''.join(chr(rand.randrange(ord('a'), ord('z') + 1))
+                          for j in range(rand.randrange(3, 12))))
+    return {'words': sorted(words), 'counting': list(range(N)),
+            'random ints': [rand.randrange(1 << 40) for j in range(N)]}
+
+def flipBit(key, rand):
+    'Return a copy of a key with one random bit changed'
+    if isinstance(key, int):
+        return key ^ (1 << rand.randrange(40))
+    j = rand.randrange(len(key))
+    return key[:j] + chr(ord(key[j]) ^ (1 << rand.randrange(7))) + key[j + 1:]
+
+def throughput(function, batch, args, keys, repeat=3):
+    'Return keys hashed per second one at a time and in a batch'
+    single = min(timeit.repeat(lambda: [function(key, *args) for key in keys],
+                               repeat=repeat, number=1))
+    batched = min(timeit.repeat(lambda: batch(keys, *args),
+                                repeat=repeat, number=1))
+    return len(keys) / single, len(keys) / batched
+
+def avalanche(batch, args, keys, seed=0):
+    '''Return the average fraction of the 64 low hash bits that change
+    when one bit of each key changes'''
+    rand = random.Random(seed)
+    flipped = [flipBit(key, rand) for key in keys]
+    mask = (1 << 64) - 1
+    changed = sum(bin((int(a) ^ int(b)) & mask).count('1')
+                  for a, b in zip(batch(keys, *args), batch(flipped, *args)))
+    return changed / (64 * len(keys))
+
+def uniformity(hashes, size):
+    '''Return the chi-squared statistic of the counts of hashes in each
+    bucket of a table divided by its degrees of freedom'''
+    counts = Counter(int(h) % size for h in hashes)
+    expected = len(hashes) / size
+    chiSquared = (sum((count - expected) ** 2 for count in counts.values()) +
+                  (size - len(counts)) * expected ** 2) / expected
+    return chiSquared / (size - 1)
+
+def compareHashes(N=10000, sizes=(97, 1000, 1024, 65536), repeat=3, seed=0):
+    '''Return the throughput, avalanche, and uniformity results for each
+    hash function and set of keys that it can hash'''
+    results = []
+    for keyName, keys in makeKeySets(N, seed).items():
+        for name, function, batch, args, keyTypes in HASH_FUNCTIONS:
+            if not isinstance(keys[0], keyTypes):
+                continue
+            hashes = batch(keys, *args)
+            results.append(
+                (name, keyName,
+                 *throughput(function, batch, args, keys, repeat),
+                 avalanche(batch, args, keys, seed),
+                 [uniformity(hashes, size) for size in sizes]))
+    return results
+
+def coverageTime(maxArraySize, repeat=3):
+    'Return the time to compute quadratic probe coverage up to a size'
+    return min(timeit.repeat(lambda: quadraticProbeCoverage(maxArraySize),
+                             repeat=repeat, number=1))
+
+SECTIONS = ('setup', 'hashing', 'coverage')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '-S', '--sections', nargs='+', choices=SECTIONS, default=SECTIONS,
+        help='Sections of the benchmark to run')
+    parser.add_argument(
+        '-n', '--keys', type=int, default=10000,
+        help='Number of keys of each kind to hash')
+    parser.add_argument(
+        '-s', '--sizes', nargs='+', type=int, default=[97, 1000, 1024, 65536],
+        help='Table sizes for measuring the uniformity of the hashes')
+    parser.add_argument(
+        '-c', '--coverage', nargs='+', type=int, default=[10 ** 4, 10 ** 6],
+        help='Largest table sizes for timing quadratic probe coverage')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=3,
+        help='Number of timings of each measurement, keeping the best')
+    parser.add_argument(
+        '--seed', type=int, default=0, help='Random number seed')
+    args = parser.parse_args()
+    if 'setup' in args.sections:
+        print('{:18s} {:>10s} {:>12s}'.format(
+            'Setup', 'Time (s)', 'Memory (MB)'))
+        for name, imports, code in SETUPS:
+            seconds, memory = measureSetup(imports, code, args.repeat)
+            print('{:18s} {:10.4f} {:12.2f}'.format(
+                name, seconds, memory / 2 ** 20))
+    if 'hashing' in args.sections:
+        if 'setup' in args.sections:
+            print()
+        print('{:18s} {:11s} {:>10s} {:>10s} {:>9s} {}'.format(
+            'Hash function', 'Keys', 'Keys/s', 'Batch/s', 'Avalanche',
+            ' '.join('{:>8s}'.format('X2/' + str(size))
+                     for size in args.sizes)))
+        for (name, keys, single, batched, avalanched,
+             uniform) in compareHashes(args.keys, args.sizes, args.repeat,
+                                       args.seed):
+            print('{:18s} {:11s} {:10.0f} {:10.0f} {:9.3f} {}'.format(
+                name, keys, single, batched, avalanched,
+                ' '.join('{:8.2f}'.format(u) for u in uniform)))
+    if 'coverage' in args.sections:
+        if set(args.sections) - set(['coverage']):
+            print()
+        print('{:18s} {:>10s}'.format('Coverage sizes', 'Time (s)'))
+        for size in args.coverage:
+            print('{:18d} {:10.4f}'.format(size, coverageTime(size, args.repeat)))
@@ -0,0 +1,162 @@
+__doc__ = """
+Opt-in profiler for visualization operations.
+While an operation runs, the profiler wraps the canvas methods that send
+Tcl commands, the visualization's wait and sleep methods, and the
+window's update method.  Each operation produces a report with the
+number of Tcl calls by command, the canvas items created and deleted,
+the peak item count, and how the elapsed time divides between
+computation, canvas calls, sleeping, and window updates.  A batch of
+canvas commands is one eval call, and the commands in batches are
+counted separately, so the total of Tcl calls is the round trips made
+to Tcl.  The reports
+can be saved as JSON to track performance across releases.
+"""
+
+import time, json
+
+class Profiler(object):
+    # Canvas methods that send Tcl commands
+    CANVAS_METHODS = (
+        '_create', 'coords', 'move', 'scale', 'itemconfigure', 'itemconfig',
+        'itemcget', 'delete', 'tag_raise', 'lift', 'tkraise', 'tag_lower',
+        'lower', 'addtag', 'dtag', 'gettags', 'type', 'bbox', 'find_all',
+        'find_withtag', 'find_above', 'find_below', 'find_closest',
+        'find_enclosed', 'find_overlapping', 'tag_bind', 'canvasx',
+        'canvasy', 'xview', 'yview', 'applyCommands')
+
+    # Tcl command names for canvas methods that differ from them
+    TCL_COMMANDS = {
+        '_create': 'create', 'itemconfig': 'itemconfigure',
+        'tag_raise': 'raise', 'lift': 'raise', 'tkraise': 'raise',
+        'tag_lower': 'lower', 'tag_bind': 'bind', 'find_all': 'find',
+        'find_withtag': 'find', 'find_above': 'find', 'find_below': 'find',
+        'find_closest': 'find', 'find_enclosed': 'find',
+        'find_overlapping': 'find'}
+
+    def __init__(
+            self, visualization,
+            clock=time.perf_counter): # Function returning time in seconds
+        self.visualization = visualization
+        self.clock = clock
+        self.reports = []     # Reports of completed operations
+        self.current = None   # Report for operation being profiled
+        self.wrapped = []     # (object, name, instanceAttribute?, original)
+        self.inside = None    # Category of the timed call in progress
+
+    def start(self, operation):
+        'Start profiling an operation with the given name'
+        if self.current:
+            self.stop()
+        vis = self.visualization
+        self.items = len(vis.canvas.find_all())
+        self.current = {
+            'operation': operation, 'elapsed': 0, 'compute': 0, 'canvas': 0,
+            'sleep': 0, 'update': 0, 'waits': 0, 'waitTime': 0,
+            'tclCalls': {}, 'batches': 0, 'batchedCommands': {},
+            'itemsCreated': 0,
+            'itemsDeleted': 0, 'startItems': self.items,
+            'peakItems': self.items, 'endItems': self.items}
+        for name in self.CANVAS_METHODS:
+            if hasattr(vis.canvas, name):
+                self.wrap(vis.canvas, name, self.canvasCall)
+        for obj, name, category in ((vis, 'sleep', 'sleep'),
+                                    (vis, 'waitForStateChange', 'sleep'),
+                                    (vis.window, 'update', 'update')):
+            self.wrap(obj, name, self.timedCall(category))
+        self.wrap(vis, 'wait', self.waitCall)
+        self.startTime = self.clock()
+
+    def stop(self):
+        '''Stop profiling the current operation, add its report to the
+        list of reports, and return it'''
+        if self.current is None:
+            return None
+        report, self.current = self.current, None
+        report['elapsed'] = self.clock() - self.startTime
+        report['compute'] = report['elapsed'] - sum(
+            report[category] for category in ('canvas', 'sleep', 'update'))
+        report['endItems'] = self.items
+        for counts in ('tclCalls', 'batchedCommands'):
+            report[counts] = dict(sorted(report[counts].items()))
+        report['totalTclCalls'] = sum(report['tclCalls'].values())
+        for obj, name, instanceAttribute, original in reversed(self.wrapped):
+            if instanceAttribute:
+                setattr(obj, name, original)
+            else:
+                delattr(obj, name)
+        self.wrapped = []
+        self.reports.append(report)
+        return report
+
+    def wrap(self, obj, name, makeWrapper):
+        original = getattr(obj, name)
+        self.wrapped.append((obj, name, name in obj.__dict__, original))
+        setattr(obj, name, makeWrapper(name, original))
+
+    def timedCall(self, category):
+        '''Make a wrapper maker that adds the time spent in calls to a
+        category.  Calls made within other timed calls are not counted.'''
+        def makeWrapper(name, original):
+            def call(*args, **kw):
+                if self.inside:
+                    return original(*args, **kw)
+                self.inside, start = category, self.clock()
+                try:
+                    return original(*args, **kw)
+                finally:
+                    self.current[category] += self.clock() - start
+                    self.inside = None
+            return call
+        return makeWrapper
+
+    def canvasCall(self, name, original):
+        '''Make a wrapper that counts Tcl calls and items for a canvas
+        method.  A non-empty batch of commands is sent in one eval call.
+        Calls made within other calls, such as the queries a timeline makes
+        while recording changes, are counted but not timed separately.'''
+        timed = self.timedCall('canvas')(name, original)
+        command = self.TCL_COMMANDS.get(name, name)
+        canvas = self.visualization.canvas
+        def call(*args, **kw):
+            calls = self.current['tclCalls']
+            if name == 'applyCommands':
+                if args[0]:
+                    self.current['batches'] += 1
+                    calls['eval'] = calls.get('eval', 0) + 1
+                batched = self.current['batchedCommands']
+                for batchCommand, batchArgs, batchKw in args[0]:
+                    batched[batchCommand] = batched.get(batchCommand, 0) + 1
+            else:
+                calls[command] = calls.get(command, 0) + 1
+            if name == 'delete':  # Count items with the class method to
+                deleted = len(set( # skip the wrappers on the canvas
+                    ID for tagOrId in args
+                    for ID in type(canvas).find_withtag(canvas, tagOrId)))
+                self.items -= deleted
+                self.current['itemsDeleted'] += deleted
+            result = timed(*args, **kw)
+            if name == '_create':
+                self.items += 1
+                self.current['itemsCreated'] += 1
+                self.current['peakItems'] = max(
+                    self.current['peakItems'], self.items)
+            return result
+        return call
+
+    def waitCall(self, name, original):
+        'Make a wrapper that counts waits and the time spent in them'
+        def call(*args, **kw):
+            self.current['waits'] += 1
+            start = self.clock()
+            try:
+                return original(*args, **kw)
+            finally:
+                self.current['waitTime'] += self.clock() - start
+        return call
+
+    def saveReport(self, filename):
+        'Write the reports of all profiled operations to a JSON file'
+        with open(filename, 'w') as reportFile:
+            json.dump({'visualization': type(self.visualization).__name__,
+                       'operations': self.reports},
+                      reportFile, indent=2)
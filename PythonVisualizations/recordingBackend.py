@@ -0,0 +1,1237 @@
+__doc__ = """
+Display backend for running visualizations without a Tk display.
+The RecordingScrim implements the Scrim canvas API with items kept in
+memory.  Instead of drawing, it logs the canvas changes made between
+window updates as frames.  The other widgets are lightweight stand-ins
+for the Tk widgets used in the control panel and code display.  Waits
+advance a virtual clock rather than sleeping so that animated
+operations run as fast as the computation allows.
+
+To run a visualization headless, pass a RecordingBackend, e.g.
+
+  array = Array(backend=RecordingBackend())
+  array.insert(17)
+  print(array.canvas.frameCount, 'frames in', array.backend.clock, 'seconds')
+"""
+
+import re, math, heapq
+from collections import *
+from tkinter import *
+from tkinter import ttk, _flatten, _join
+
+try:
+    from coordinates import *
+    from tkUtilities import *
+except ModuleNotFoundError:
+    from .coordinates import *
+    from .tkUtilities import *
+
+V = vector
+
+def tkString(value):
+    'Convert an option value to the string form that Tk reports for it'
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return _join(value)      # Quote elements as Tcl lists do
+    return str(value)
+
+class HeadlessWidget(object):
+    '''Mixin that replaces the Tk implementation of a widget with one that
+    keeps the widget's configuration, bindings, and geometry management in
+    memory.  Combine it with a tkinter widget class so that isinstance tests
+    work as they do with Tk widgets.
+    '''
+    defaults = {'width': 0, 'height': 0}
+
+    def __init__(self, master=None, cnf={}, **kw):
+        self.master = master
+        self.children = {}
+        self.tk = master.tk if master else None
+        self.options = dict(self.defaults)
+        self.options.update(
+            (k.rstrip('_'), v) for k, v in dict(cnf, **kw).items()
+            if v is not None)
+        self.bindings = defaultdict(list)
+        self.manager, self.gridOptions = None, {}
+        self.packed, self.gridded = [], []
+        self.destroyed = False
+        if master:
+            name = self.options.pop('name', None)
+            if name is None:
+                className = '!' + self.widgetName()
+                count = master._last_child_ids.get(className, 0) + 1
+                master._last_child_ids[className] = count
+                name = className + (str(count) if count > 1 else '')
+            self._name = name
+            self._w = (master._w if master._w != '.' else '') + '.' + name
+            master.children[name] = self
+            self._root().widgets[self._w] = self
+        self._last_child_ids = {}
+
+    def widgetName(self):
+        for cls in type(self).__mro__:
+            if (cls.__module__ in ('tkinter', 'tkinter.ttk') and
+                cls.__name__ not in ('Widget', 'BaseWidget', 'Misc')):
+                return cls.__name__.lower()
+        return type(self).__name__.lower()
+
+    # Configuration
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, str) and not kw:
+            return (cnf, cnf, cnf.capitalize(), self.defaults.get(cnf, ''),
+                    self.options.get(cnf, ''))
+        if cnf is None and not kw:
+            return dict(
+                (k, (k, k, k.capitalize(), self.defaults.get(k, ''), v))
+                for k, v in self.options.items())
+        self.options.update(
+            (k.rstrip('_'), v) for k, v in dict(cnf or {}, **kw).items()
+            if v is not None)
+    config = configure
+
+    def cget(self, key):
+        return self.options.get(key, '')
+    __getitem__ = cget
+
+    def __setitem__(self, key, value):
+        self.configure({key: value})
+
+    def keys(self):
+        return list(self.options.keys())
+
+    # Geometry management
+    def pack(self, cnf={}, **kw):
+        if self.manager != 'pack':
+            self._unmanage()
+            self.manager = 'pack'
+            self.master.packed.append(self)
+    pack_configure = pack
+
+    def place(self, cnf={}, **kw):
+        self._unmanage()
+        self.manager = 'place'
+    place_configure = place
+
+    def pack_forget(self):
+        if self.manager == 'pack':
+            self._unmanage()
+    place_forget = pack_forget
+
+    def pack_slaves(self):
+        return list(self.packed)
+    slaves = pack_slaves
+
+    def _unmanage(self):
+        if self.manager == 'pack':
+            self.master.packed.remove(self)
+        elif self.manager == 'grid':
+            self.master.gridded.remove(self)
+        self.manager = None
+
+    def grid(self, cnf={}, **kw):
+        options = dict(cnf, **kw)
+        options.pop('in_', None)
+        if self.manager != 'grid':
+            self._unmanage()
+            self.manager = 'grid'
+            self.master.gridded.append(self)
+        self.gridOptions.update(options)
+    grid_configure = grid
+
+    def grid_remove(self):
+        if self.manager == 'grid':
+            self._unmanage()
+
+    def grid_forget(self):
+        self.grid_remove()
+        self.gridOptions = {}
+
+    def grid_info(self):
+        if self.manager != 'grid':
+            return {}
+        info = {'row': 0, 'column': 0, 'rowspan': 1, 'columnspan': 1,
+                'sticky': ''}
+        info.update(self.gridOptions)
+        info['in'] = self.master
+        return info
+
+    def grid_slaves(self, row=None, column=None):
+        return [w for w in reversed(self.gridded)
+                if (row is None or w.grid_info()['row'] == row) and
+                (column is None or w.grid_info()['column'] == column)]
+
+    def grid_size(self):
+        infos = [w.grid_info() for w in self.gridded]
+        return (max([int(i['column']) + int(i['columnspan']) for i in infos],
+                    default=0),
+                max([int(i['row']) + int(i['rowspan']) for i in infos],
+                    default=0))
+
+    def grid_columnconfigure(self, index, cnf={}, **kw):
+        pass
+    grid_rowconfigure = columnconfigure = rowconfigure = grid_columnconfigure
+
+    def tkraise(self, aboveThis=None):
+        pass
+    lift = tkraise
+
+    def lower(self, belowThis=None):
+        pass
+
+    # Window information
+    def winfo_width(self):
+        width = self.options.get('width', 0)
+        return width if isinstance(width, int) and width > 1 else 1
+    winfo_reqwidth = winfo_width
+
+    def winfo_height(self):
+        height = self.options.get('height', 0)
+        return height if isinstance(height, int) and height > 1 else 1
+    winfo_reqheight = winfo_height
+
+    def winfo_geometry(self):
+        return '{}x{}+0+0'.format(self.winfo_width(), self.winfo_height())
+
+    def winfo_ismapped(self):
+        return not self.destroyed and (
+            self.master is None or
+            self.manager is not None and self.master.winfo_ismapped())
+    winfo_viewable = winfo_ismapped
+
+    def winfo_exists(self):
+        return not self.destroyed
+
+    def winfo_rootx(self):
+        return 0
+    winfo_rooty = winfo_x = winfo_y = winfo_pointerx = winfo_pointery = (
+        winfo_rootx)
+
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+    unitsPerInch = {'c': 2.54, 'i': 1, 'm': 25.4, 'p': 72}
+
+    def winfo_fpixels(self, number):
+        number = str(number)
+        return float(number[:-1]) * 96 / self.unitsPerInch[number[-1]] if (
+            number[-1:] in self.unitsPerInch) else float(number)
+
+    def winfo_pixels(self, number):
+        return int(self.winfo_fpixels(number))
+
+    def winfo_children(self):
+        return list(self.children.values())
+
+    def winfo_toplevel(self):
+        widget = self
+        while widget.master is not None and not isinstance(
+                widget, (Toplevel, Tk)):
+            widget = widget.master
+        return widget
+
+    def nametowidget(self, name):
+        widget = self._root().widgets.get(str(name))
+        if widget is None:
+            raise KeyError(name)
+        return widget
+
+    # Event handling
+    def bind(self, sequence=None, func=None, add=None):
+        if sequence is None:
+            return tuple(self.bindings.keys())
+        if func is None:
+            return self.bindings.get(sequence, ())
+        if not add:
+            self.bindings[sequence] = []
+        self.bindings[sequence].append(func)
+        return '{}-{}'.format(id(func), sequence)
+
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop(sequence, None)
+
+    def after(self, ms, func=None, *args):
+        return self._root().schedule(ms, func, args)
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, id):
+        self._root().cancel(id)
+
+    def register(self, func, subst=None, needcleanup=1):
+        name = '{}{}'.format(id(func), getattr(func, '__name__', ''))
+        self._root().commands[name] = func
+        return name
+    _register = register
+
+    def focus_set(self):
+        self._root().focusWidget = self
+    focus = focus_force = focus_set
+
+    def focus_get(self):
+        return self._root().focusWidget
+
+    def update(self):
+        self._root().update()
+
+    def update_idletasks(self):
+        pass
+
+    def wait_visibility(self, window=None):
+        pass
+
+    def invoke(self):
+        command = self.options.get('command')
+        if callable(command) and self.options.get('state') != DISABLED:
+            return command()
+
+    def destroy(self):
+        for child in list(self.children.values()):
+            child.destroy()
+        self._unmanage()
+        self.destroyed = True
+        if self.master is not None:
+            self.master.children.pop(self._name, None)
+            self._root().widgets.pop(self._w, None)
+        event = Event()
+        event.widget, event.type = self, EventType.Destroy
+        for handler in self.bindings.get('<Destroy>', ()):
+            handler(event)
+
+class HeadlessWm(object):
+    'Mixin for window manager methods of headless top level windows'
+    def title(self, string=None):
+        if string is None:
+            return self.options.get('title', '')
+        self.options['title'] = string
+    wm_title = title
+
+    def geometry(self, newGeometry=None):
+        if newGeometry is None:
+            return self.winfo_geometry()
+        self.options['geometry'] = newGeometry
+    wm_geometry = geometry
+
+    def state(self, newstate=None):
+        if newstate is None:
+            return self.options.get('wmstate', NORMAL)
+        self.options['wmstate'] = newstate
+    wm_state = state
+
+    def withdraw(self):
+        self.state('withdrawn')
+
+    def deiconify(self):
+        self.state(NORMAL)
+
+    def transient(self, master=None):
+        pass
+
+    def overrideredirect(self, boolean=None):
+        pass
+
+    def protocol(self, name=None, func=None):
+        pass
+
+    def resizable(self, width=None, height=None):
+        pass
+
+class HeadlessWindow(HeadlessWm, HeadlessWidget, Tk):
+    '''Top level window for headless visualizations.  It has a Tcl
+    interpreter without Tk, so that tkinter variables work, and schedules
+    timed callbacks on the backend's virtual clock.  Each update runs the
+    callbacks that are due and records a frame on its canvases.
+    '''
+    def __init__(self, backend=None, title=None):
+        self.widgets = {}
+        HeadlessWidget.__init__(self)
+        self.tk = Tcl().tk
+        self._w = '.'
+        self.widgets['.'] = self
+        self.backend = backend
+        self.scrims = []
+        self.commands = {}
+        self.focusWidget = None
+        self.scheduled, self.cancelled, self.callbackCount = [], set(), 0
+        if title:
+            self.title(title)
+
+    def now(self):
+        return self.backend.clock if self.backend else 0
+
+    def schedule(self, ms, func, args=()):
+        self.callbackCount += 1
+        ID = 'after#{}'.format(self.callbackCount)
+        if func is None:
+            self.backend and self.backend.sleep(ms / 1000)
+        else:
+            heapq.heappush(self.scheduled, (
+                self.now() + ms / 1000, self.callbackCount, ID, func, args))
+        return ID
+
+    def cancel(self, ID):
+        self.cancelled.add(ID)
+
+    def update(self):
+        'Run callbacks that are due and record a frame on each canvas'
+        while self.scheduled and self.scheduled[0][0] <= self.now():
+            due, count, ID, func, args = heapq.heappop(self.scheduled)
+            if ID in self.cancelled:
+                self.cancelled.discard(ID)
+            else:
+                func(*args)
+        for scrim in self.scrims:
+            scrim.recordFrame(self.now())
+
+    def mainloop(self, n=0):
+        self.update()
+
+    def quit(self):
+        pass
+
+class HeadlessToplevel(HeadlessWm, HeadlessWidget, Toplevel):
+    pass
+
+class HeadlessFrame(HeadlessWidget, Frame):
+    pass
+
+class HeadlessLabelFrame(HeadlessWidget, LabelFrame):
+    pass
+
+class HeadlessLabel(HeadlessWidget, Label):
+    pass
+
+class HeadlessButton(HeadlessWidget, Button):
+    defaults = dict(HeadlessWidget.defaults, padx='3m', pady='1m')
+
+class HeadlessCheckbutton(HeadlessWidget, Checkbutton):
+    defaults = dict(HeadlessWidget.defaults, onvalue=1, offvalue=0)
+
+    def invoke(self):
+        variable = self.options.get('variable')
+        if variable is not None:
+            variable.set(self.options['offvalue'] if str(variable.get()) ==
+                         str(self.options['onvalue']) else
+                         self.options['onvalue'])
+        return super().invoke()
+
+class HeadlessRadiobutton(HeadlessWidget, Radiobutton):
+    def invoke(self):
+        variable = self.options.get('variable')
+        if variable is not None:
+            variable.set(self.options.get('value', ''))
+        return super().invoke()
+
+class HeadlessScale(HeadlessWidget, Scale):
+    def get(self):
+        return self.options.get('value', self.options.get('from', 0))
+
+    def set(self, value):
+        self.options['value'] = value
+
+class HeadlessScrollbar(HeadlessWidget, Scrollbar):
+    def get(self):
+        return self.options.get('fractions', (0.0, 1.0))
+
+    def set(self, first, last):
+        self.options['fractions'] = (float(first), float(last))
+
+class HeadlessEntry(HeadlessWidget, Entry):
+    def __init__(self, master=None, cnf={}, **kw):
+        super().__init__(master, cnf, **kw)
+        self.text = ''
+
+    def index(self, index):
+        if isinstance(index, int):
+            return max(0, min(index, len(self.text)))
+        return len(self.text) if index in (END, INSERT) else int(index)
+
+    def get(self):
+        return self.text
+
+    def insert(self, index, string):
+        index = self.index(index)
+        self.text = self.text[:index] + str(string) + self.text[index:]
+
+    def delete(self, first, last=None):
+        first = self.index(first)
+        last = first + 1 if last is None else self.index(last)
+        self.text = self.text[:first] + self.text[last:]
+
+    def select_range(self, start, end):
+        pass
+    selection_range = select_range
+
+    def icursor(self, index):
+        pass
+
+class HeadlessText(HeadlessWidget, Text):
+    '''Text widget stand-in that keeps the text, marks, and tag ranges
+    as character offsets.  Like Tk, the text always ends with a newline.
+    Marks have right gravity, and inserted text does not extend tag ranges
+    that start or end at the insertion point.'''
+
+    indexPattern = re.compile(r'^(\d+)\.(\d+|end)$')
+
+    def __init__(self, master=None, cnf={}, **kw):
+        super().__init__(master, cnf, **kw)
+        self.text = '\n'
+        self.marks = {INSERT: 0, CURRENT: 0}
+        self.tags = {SEL: []}
+        self.tagOptions = {SEL: {}}
+
+    def _lineStarts(self):
+        starts, start = [0], self.text.find('\n')
+        while start >= 0:
+            starts.append(start + 1)
+            start = self.text.find('\n', start + 1)
+        return starts
+
+    def _offset(self, index):
+        'Convert a Tk text index to a character offset'
+        index = str(index)
+        if index == END:
+            return len(self.text)
+        if index in self.marks:
+            return self.marks[index]
+        if index.endswith(('.first', '.last')):
+            tag, which = index.rsplit('.', 1)
+            if not self.tags.get(tag):
+                raise TclError(
+                    'text doesn\'t contain any characters tagged with "{}"'
+                    .format(tag))
+            return self.tags[tag][0][0] if which == 'first' else (
+                self.tags[tag][-1][1])
+        match = self.indexPattern.match(index)
+        if not match:
+            raise TclError('bad text index "{}"'.format(index))
+        starts = self._lineStarts()
+        line = int(match.group(1)) - 1
+        if line >= len(starts) - 1:
+            return len(self.text)
+        lineEnd = starts[line + 1] - 1
+        return lineEnd if match.group(2) == 'end' else min(
+            lineEnd, starts[max(0, line)] + int(match.group(2)))
+
+    def index(self, index):
+        return self._index(self._offset(index))
+
+    def _index(self, offset):
+        'Convert a character offset to a Tk text index'
+        starts = self._lineStarts()
+        line = max(i for i, start in enumerate(starts) if start <= offset)
+        return '{}.{}'.format(line + 1, offset - starts[line])
+
+    def get(self, index1, index2=None):
+        start = self._offset(index1)
+        end = start + 1 if index2 is None else self._offset(index2)
+        return self.text[start:end]
+
+    def insert(self, index, chars, *args):
+        if self.options.get('state') == DISABLED:
+            return
+        pos = min(self._offset(index), len(self.text) - 1)
+        n = len(chars)
+        self.text = self.text[:pos] + chars + self.text[pos:]
+        for mark in self.marks:
+            if self.marks[mark] >= pos:
+                self.marks[mark] += n
+        for ranges in self.tags.values():
+            for span in ranges:
+                if span[0] >= pos:
+                    span[0] += n
+                if span[1] > pos:
+                    span[1] += n
+        for tag in (args[0] if args and isinstance(args[0], tuple) else
+                    args[:1]):
+            self._addRange(tag, pos, pos + n)
+
+    def delete(self, index1, index2=None):
+        if self.options.get('state') == DISABLED:
+            return
+        start = self._offset(index1)
+        end = min(start + 1 if index2 is None else self._offset(index2),
+                  len(self.text) - 1)
+        if end <= start:
+            return
+        n = end - start
+        self.text = self.text[:start] + self.text[end:]
+        move = lambda p: p if p <= start else start if p <= end else p - n
+        for mark in self.marks:
+            self.marks[mark] = move(self.marks[mark])
+        for tag in self.tags:
+            self.tags[tag] = [[move(s), move(e)] for s, e in self.tags[tag]
+                              if move(s) < move(e)]
+
+    def mark_set(self, markName, index):
+        self.marks[markName] = self._offset(index)
+
+    def mark_unset(self, *markNames):
+        for mark in markNames:
+            self.marks.pop(mark, None)
+
+    def mark_names(self):
+        return tuple(self.marks.keys())
+
+    def _addRange(self, tag, start, end):
+        self.tagOptions.setdefault(tag, {})
+        ranges = self.tags.setdefault(tag, [])
+        if start < end:
+            merged = []
+            for span in sorted(ranges + [[start, end]]):
+                if merged and span[0] <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], span[1])
+                else:
+                    merged.append(list(span))
+            self.tags[tag] = merged
+
+    def tag_add(self, tagName, index1, *args):
+        indices = (index1,) + args
+        for j in range(0, len(indices), 2):
+            start = self._offset(indices[j])
+            end = (self._offset(indices[j + 1]) if j + 1 < len(indices)
+                   else start + 1)
+            self._addRange(tagName, start, end)
+
+    def tag_remove(self, tagName, index1, index2=None):
+        start = self._offset(index1)
+        end = start + 1 if index2 is None else self._offset(index2)
+        kept = []
+        for s, e in self.tags.get(tagName, []):
+            kept.extend(span for span in ([s, min(e, start)], [max(s, end), e])
+                        if span[0] < span[1])
+        if tagName in self.tags:
+            self.tags[tagName] = kept
+
+    def tag_delete(self, *tagNames):
+        for tag in tagNames:
+            self.tags.pop(tag, None)
+            self.tagOptions.pop(tag, None)
+
+    def tag_configure(self, tagName, cnf=None, **kw):
+        options = self.tagOptions.setdefault(tagName, {})
+        self.tags.setdefault(tagName, [])
+        if isinstance(cnf, str) and not kw:
+            return (cnf, '', '', '', tkString(options.get(cnf, '')))
+        options.update(cnf or {}, **kw)
+    tag_config = tag_configure
+
+    def tag_cget(self, tagName, option):
+        return tkString(self.tagOptions.get(tagName, {}).get(option, ''))
+
+    def tag_names(self, index=None):
+        if index is None:
+            return tuple(self.tags.keys())
+        offset = self._offset(index)
+        return tuple(tag for tag, ranges in self.tags.items()
+                     if any(s <= offset < e for s, e in ranges))
+
+    def tag_ranges(self, tagName):
+        return tuple(self._index(offset) for span in self.tags.get(tagName, [])
+                     for offset in span)
+
+    def tag_raise(self, tagName, aboveThis=None):
+        pass
+    tag_lower = tag_raise
+
+    def see(self, index):
+        pass
+
+    def xview(self, *args):
+        return (0.0, 1.0) if not args else None
+    yview = xview
+
+class HeadlessTtkButton(HeadlessWidget, ttk.Button):
+    def __init__(self, master=None, **kw):
+        self.stateFlags = set()
+        super().__init__(master, **kw)
+
+    def state(self, statespec=None):
+        if statespec is not None:
+            for flag in statespec:
+                if flag.startswith('!'):
+                    self.stateFlags.discard(flag[1:])
+                else:
+                    self.stateFlags.add(flag)
+        return tuple(self.stateFlags)
+
+    def instate(self, statespec, callback=None, *args, **kw):
+        return all((flag[1:] not in self.stateFlags) if flag.startswith('!')
+                   else flag in self.stateFlags for flag in statespec)
+
+    def invoke(self):
+        command = self.options.get('command')
+        if callable(command) and DISABLED not in self.stateFlags:
+            return command()
+
+class HeadlessStyle(object):
+    'Stand-in for ttk.Style that only records style settings'
+    settings = defaultdict(dict)
+
+    def __init__(self, master=None):
+        pass
+
+    def configure(self, style, query_opt=None, **kw):
+        if query_opt:
+            return self.settings[style].get(query_opt)
+        self.settings[style].update(kw)
+
+    def map(self, style, query_opt=None, **kw):
+        pass
+
+    def theme_use(self, themename=None):
+        return 'headless'
+
+    def theme_names(self):
+        return ('headless',)
+
+# Canvas item options and their default values (as reported by Tk 8.6)
+_shapeOptions = dict(
+    activedash='', activefill='', activeoutline='', activeoutlinestipple='',
+    activestipple='', activewidth='0.0', dash='', dashoffset='0',
+    disableddash='', disabledfill='', disabledoutline='',
+    disabledoutlinestipple='', disabledstipple='', disabledwidth='0.0',
+    fill='', offset='0,0', outline='black', outlineoffset='0,0',
+    outlinestipple='', state='', stipple='', tags='', width='1.0')
+_smoothOptions = dict(joinstyle='round', smooth='0', splinesteps='12')
+
+ITEM_DEFAULTS = {
+    'arc': dict(_shapeOptions, extent='90.0', start='0.0', style='pieslice'),
+    'bitmap': dict(
+        activebackground='', activebitmap='', activeforeground='',
+        anchor='center', background='', bitmap='', disabledbackground='',
+        disabledbitmap='', disabledforeground='', foreground='black',
+        state='', tags=''),
+    'image': dict(activeimage='', anchor='center', disabledimage='', image='',
+                  state='', tags=''),
+    'line': dict(
+        activedash='', activefill='', activestipple='', activewidth='0.0',
+        arrow='none', arrowshape='8 10 3', capstyle='butt', dash='',
+        dashoffset='0', disableddash='', disabledfill='', disabledstipple='',
+        disabledwidth='0.0', fill='black', offset='0,0', state='',
+        stipple='', tags='', width='1.0', **_smoothOptions),
+    'oval': dict(_shapeOptions),
+    'polygon': dict(_shapeOptions, fill='black', outline='',
+                    **_smoothOptions),
+    'rectangle': dict(_shapeOptions),
+    'text': dict(
+        activefill='', activestipple='', anchor='center', angle='0.0',
+        disabledfill='', disabledstipple='', fill='black',
+        font='Helvetica -12', justify='left', offset='0,0', state='',
+        stipple='', tags='', text='', underline='-1', width='0'),
+    'window': dict(anchor='center', height='0', state='', tags='', width='0',
+                   window=''),
+}
+
+MIN_COORDS = {'arc': 4, 'bitmap': 2, 'image': 2, 'line': 4, 'oval': 4,
+              'polygon': 4, 'rectangle': 4, 'text': 2, 'window': 2}
+
+class RecordedItem(object):
+    'A canvas item held in memory by a RecordingScrim'
+    __slots__ = ('type', 'coords', 'options', 'tags')
+
+    def __init__(self, itemType, coords, options, tags):
+        self.type, self.coords = itemType, coords
+        self.options, self.tags = options, tags
+
+class RecordingScrim(HeadlessWidget, Scrim):
+    '''Scrim that keeps its canvas items in memory and, instead of drawing
+    them, logs every change made to the canvas.  The changes made between
+    window updates are recorded as a frame of (time, changes) in the frames
+    deque, which keeps the most recent maxFrames frames.  Each change is a
+    tuple of the canvas command name followed by its arguments.
+    '''
+    def __init__(self, master=None, cnf={}, maxFrames=None, **kw):
+        super().__init__(master, cnf, **kw)
+        root = self._root()
+        backend = getattr(root, 'backend', None)
+        if maxFrames is None:
+            maxFrames = getattr(backend, 'maxFrames', 1000)
+        self.items = {}             # Canvas items by ID
+        self.order = []             # Item IDs from bottom to top of display
+        self.tagged = defaultdict(set) # Item IDs for each tag
+        self.tagBindings = defaultdict(dict)
+        self.lastID = 0
+        self.origin = [0, 0]        # Canvas coordinates of upper left corner
+        self.changes = []
+        self.frames = deque(maxlen=maxFrames)
+        self.frameCount = 0
+        self.fonts = {}
+        self.initItemPool()
+        self.initColorCache()
+        if hasattr(root, 'scrims'):
+            root.scrims.append(self)
+
+    def _record(self, *change):
+        self.changes.append(change)
+
+    def recordFrame(self, time=None):
+        'Log the changes since the last frame, if any, as a new frame'
+        if self.changes:
+            self.frames.append((time, tuple(self.changes)))
+            self.frameCount += 1
+            self.changes = []
+
+    # Widget configuration and scrolling
+    def configure(self, cnf=None, **kw):
+        result = super().configure(cnf, **kw)
+        if result is None:
+            self._confineView()
+        return result
+    config = configure
+
+    def scrollRegion(self):
+        region = self.options.get('scrollregion')
+        if not region:
+            return (0, 0, self.winfo_width(), self.winfo_height())
+        return tuple(float(x) for x in (
+            region.split() if isinstance(region, str) else region))
+
+    def _confineView(self):
+        region = self.scrollRegion()
+        dims = (self.winfo_width(), self.winfo_height())
+        for XorY in (0, 1):
+            self.origin[XorY] = max(region[XorY], min(
+                self.origin[XorY], region[XorY + 2] - dims[XorY]))
+        for XorY, command in enumerate(
+                ('xscrollcommand', 'yscrollcommand')):
+            if callable(self.options.get(command)):
+                self.options[command](*self._view(XorY))
+
+    def _view(self, XorY):
+        region = self.scrollRegion()
+        size = region[XorY + 2] - region[XorY]
+        if size <= 0:
+            return (0.0, 1.0)
+        dim = (self.winfo_width(), self.winfo_height())[XorY]
+        first = (self.origin[XorY] - region[XorY]) / size
+        return (max(0.0, first), min(1.0, first + dim / size))
+
+    def _moveto(self, XorY, fraction):
+        region = self.scrollRegion()
+        self.origin[XorY] = region[XorY] + float(fraction) * (
+            region[XorY + 2] - region[XorY])
+        self._record(('xview', 'yview')[XorY], 'moveto', fraction)
+        self._confineView()
+
+    def _scroll(self, XorY, *args):
+        if not args:
+            return self._view(XorY)
+        if args[0] == MOVETO:
+            self._moveto(XorY, args[1])
+        elif args[0] == SCROLL:
+            dim = (self.winfo_width(), self.winfo_height())[XorY]
+            step = dim * 0.9 if args[2] == PAGES else dim / 10
+            region = self.scrollRegion()
+            self._moveto(XorY, (self.origin[XorY] - region[XorY] +
+                                int(args[1]) * step) /
+                         max(1, region[XorY + 2] - region[XorY]))
+
+    def xview(self, *args):
+        return self._scroll(0, *args)
+
+    def yview(self, *args):
+        return self._scroll(1, *args)
+
+    def xview_moveto(self, fraction):
+        self._moveto(0, fraction)
+
+    def yview_moveto(self, fraction):
+        self._moveto(1, fraction)
+
+    def xview_scroll(self, number, what):
+        self._scroll(0, SCROLL, number, what)
+
+    def yview_scroll(self, number, what):
+        self._scroll(1, SCROLL, number, what)
+
+    def canvasx(self, screenx, gridspacing=None):
+        return self.origin[0] + float(screenx)
+
+    def canvasy(self, screeny, gridspacing=None):
+        return self.origin[1] + float(screeny)
+
+    # Methods for Tk canvas commands that are applied in batches
+    batchMethods = {'raise': 'tag_raise', 'lower': 'tag_lower'}
+
+    def applyCommands(self, commands):
+        '''Run the commands with the class's methods, skipping wrappers set
+        on the canvas, as Tk runs a batch in one Tcl evaluation'''
+        for command, args, kw in commands:
+            getattr(type(self), self.batchMethods.get(command, command))(
+                self, *args, **kw)
+
+    def addtag(self, newtag, searchCommand, *args):
+        if searchCommand == 'withtag':
+            self.addtag_withtag(newtag, *args)
+        elif searchCommand == 'all':
+            self.addtag_all(newtag)
+        else:
+            raise TclError('unsupported addtag search "{}"'.format(
+                searchCommand))
+
+    # Canvas items
+    def _find(self, tagOrId):
+        'Get list of item IDs that match a tag or ID in display list order'
+        if isinstance(tagOrId, int) or (
+                isinstance(tagOrId, str) and tagOrId.isdigit()):
+            return [int(tagOrId)] if int(tagOrId) in self.items else []
+        if tagOrId == ALL:
+            return list(self.order)
+        IDs = self.tagged.get(tagOrId)
+        if not IDs:
+            return []
+        if len(IDs) == 1:
+            return list(IDs)
+        return [i for i in self.order if i in IDs]
+
+    def _tagTuple(self, tags):
+        'Get the tags from a Tcl list string or a (nested) sequence of tags'
+        return self.tk.splitlist(tags) if isinstance(tags, str) else tuple(
+            str(t) for t in _flatten(tags))
+
+    def _setTags(self, ID, item, tags):
+        for tag in item.tags:
+            self.tagged[tag].discard(ID)
+        item.tags = tuple(dict.fromkeys(tags))
+        for tag in item.tags:
+            self.tagged[tag].add(ID)
+
+    def _checkOptions(self, itemType, options):
+        'Check option names, expanding unique abbreviations as Tk does'
+        known = ITEM_DEFAULTS[itemType]
+        for key in list(options):
+            if key not in known:
+                matches = [name for name in known if name.startswith(key)]
+                if len(matches) != 1:
+                    raise TclError('{} option "-{}"'.format(
+                        'ambiguous' if matches else 'unknown', key))
+                options[matches[0]] = options.pop(key)
+        return options
+
+    def _checkCoords(self, itemType, coords):
+        n = MIN_COORDS[itemType]
+        if len(coords) < n or len(coords) % 2 == 1 or (
+                n in (2,) and len(coords) != n) or (
+                itemType in ('rectangle', 'oval', 'arc') and len(coords) != 4):
+            raise TclError('wrong # coordinates: expected {}{}, got {}'.format(
+                'at least ' if itemType in ('line', 'polygon') else '',
+                n, len(coords)))
+
+    def _create(self, itemType, args, kw):
+        args = _flatten(args)
+        cnf = args[-1] if args and isinstance(args[-1], dict) else {}
+        if cnf:
+            args = args[:-1]
+        options = self._checkOptions(itemType, dict(
+            (k, v) for k, v in dict(cnf, **kw).items() if v is not None))
+        coords = [float(c) for c in args]
+        self._checkCoords(itemType, coords)
+        tags = self._tagTuple(options.pop('tags', ()))
+        self.lastID += 1
+        ID = self.lastID
+        item = RecordedItem(itemType, coords, options, ())
+        self.items[ID] = item
+        self.order.append(ID)
+        self._setTags(ID, item, tags)
+        self._record('create', itemType, ID, tuple(coords), options)
+        return ID
+
+    def type(self, tagOrId):
+        IDs = self._find(tagOrId)
+        return self.items[IDs[0]].type if IDs else None
+
+    def coords(self, tagOrId, *args):
+        IDs = self._find(tagOrId)
+        if args:
+            if IDs:
+                item = self.items[IDs[0]]
+                coords = [float(c) for c in _flatten(args)]
+                self._checkCoords(item.type, coords)
+                item.coords = coords
+                self._record('coords', IDs[0], tuple(coords))
+            return []
+        return tuple(self.items[IDs[0]].coords) if IDs else []
+
+    def move(self, tagOrId, xAmount, yAmount):
+        dx, dy = float(xAmount), float(yAmount)
+        for ID in self._find(tagOrId):
+            coords = self.items[ID].coords
+            for j in range(0, len(coords), 2):
+                coords[j] += dx
+                coords[j + 1] += dy
+        self._record('move', tagOrId, dx, dy)
+
+    def scale(self, tagOrId, xOrigin, yOrigin, xScale, yScale):
+        x0, y0, sx, sy = map(float, (xOrigin, yOrigin, xScale, yScale))
+        for ID in self._find(tagOrId):
+            coords = self.items[ID].coords
+            for j in range(0, len(coords), 2):
+                coords[j] = x0 + (coords[j] - x0) * sx
+                coords[j + 1] = y0 + (coords[j + 1] - y0) * sy
+        self._record('scale', tagOrId, x0, y0, sx, sy)
+
+    def delete(self, *args):
+        self.forgetPooled(*args)
+        self.forgetColors(*args)
+        for tagOrId in args:
+            IDs = self._find(tagOrId)
+            for ID in IDs:
+                item = self.items.pop(ID)
+                for tag in item.tags:
+                    self.tagged[tag].discard(ID)
+                self.tagBindings.pop(ID, None)
+            if IDs:
+                deleted = set(IDs)
+                self.order = [i for i in self.order if i not in deleted]
+                self._record('delete', tagOrId)
+
+    def itemconfigure(self, tagOrId, cnf=None, **kw):
+        IDs = self._find(tagOrId)
+        if isinstance(cnf, str) and not kw:
+            if not IDs:
+                return ()
+            item = self.items[IDs[0]]
+            return (cnf, '', '', ITEM_DEFAULTS[item.type].get(cnf, ''),
+                    self._itemOption(item, cnf))
+        if cnf is None and not kw:
+            if not IDs:
+                return {}
+            item = self.items[IDs[0]]
+            return dict((key, (key, '', '', default,
+                               self._itemOption(item, key)))
+                        for key, default in ITEM_DEFAULTS[item.type].items())
+        options = dict((k, v) for k, v in dict(cnf or {}, **kw).items()
+                       if v is not None)
+        for ID in IDs:
+            item = self.items[ID]
+            options = self._checkOptions(item.type, options)
+            item.options.update(options)
+            if 'tags' in options:
+                del item.options['tags']
+                self._setTags(ID, item, self._tagTuple(options['tags']))
+        self.cacheColors(tagOrId, cnf, kw)
+        self.trackPooledOptions(tagOrId, cnf, kw)
+        if IDs:
+            self._record('itemconfigure', tagOrId, options)
+    itemconfig = itemconfigure
+
+    def _itemOption(self, item, key):
+        if key == 'tags':
+            return tkString(item.tags)
+        return tkString(item.options[key]) if key in item.options else (
+            ITEM_DEFAULTS[item.type].get(key, ''))
+
+    def itemcget(self, tagOrId, option):
+        IDs = self._find(tagOrId)
+        return self._itemOption(self.items[IDs[0]], option) if IDs else ''
+
+    def gettags(self, tagOrId):
+        IDs = self._find(tagOrId)
+        return self.items[IDs[0]].tags if IDs else ()
+
+    def addtag_withtag(self, newtag, tagOrId):
+        for ID in self._find(tagOrId):
+            item = self.items[ID]
+            self._setTags(ID, item, item.tags + (newtag,))
+        self._record('addtag', newtag, 'withtag', tagOrId)
+
+    def addtag_all(self, newtag):
+        self.addtag_withtag(newtag, ALL)
+
+    def dtag(self, tagOrId, tagToDelete=None):
+        if tagToDelete is None:
+            tagToDelete = tagOrId
+        for ID in self._find(tagOrId):
+            item = self.items[ID]
+            self._setTags(ID, item, (t for t in item.tags if t != tagToDelete))
+        self._record('dtag', tagOrId, tagToDelete)
+
+    def tag_raise(self, tagOrId, aboveThis=None):
+        IDs = self._find(tagOrId)
+        if not IDs:
+            return
+        moving = set(IDs)
+        rest = [i for i in self.order if i not in moving]
+        above = self._find(aboveThis) if aboveThis is not None else []
+        at = rest.index(above[-1]) + 1 if above and above[-1] in rest else (
+            len(rest))
+        self.order = rest[:at] + IDs + rest[at:]
+        self._record('raise', tagOrId, aboveThis)
+    lift = tkraise = tag_raise
+
+    def tag_lower(self, tagOrId, belowThis=None):
+        IDs = self._find(tagOrId)
+        if not IDs:
+            return
+        moving = set(IDs)
+        rest = [i for i in self.order if i not in moving]
+        below = self._find(belowThis) if belowThis is not None else []
+        at = rest.index(below[0]) if below and below[0] in rest else 0
+        self.order = rest[:at] + IDs + rest[at:]
+        self._record('lower', tagOrId, belowThis)
+    lower = tag_lower
+
+    def tag_bind(self, tagOrId, sequence=None, func=None, add=None):
+        bindings = self.tagBindings[tagOrId]
+        if sequence is None:
+            return tuple(bindings.keys())
+        if func is None:
+            return bindings.get(sequence, '')
+        bindings[sequence] = func
+        return '{}-{}'.format(id(func), sequence)
+
+    def tag_unbind(self, tagOrId, sequence, funcid=None):
+        self.tagBindings[tagOrId].pop(sequence, None)
+
+    # Item geometry
+    def _font(self, spec):
+        if spec not in self.fonts:
+            self.fonts[spec] = tkFontFromSpec(
+                self.tk.splitlist(spec) if isinstance(spec, str) else spec)
+        return self.fonts[spec]
+
+    def _itemBBox(self, item):
+        coords, options = item.coords, item.options
+        if item.type == 'text':
+            font = self._font(options.get('font', ITEM_DEFAULTS['text']['font']))
+            lines = str(options.get('text', '')).split('\n')
+            width = max(font.measure(line) for line in lines)
+            wrap = float(options.get('width', 0) or 0)
+            if 0 < wrap < width:
+                lines += [''] * (math.ceil(width / wrap) - 1)
+                width = wrap
+            height = font.metrics('linespace') * len(lines)
+            return self._anchoredBBox(coords, width, height, options)
+        if item.type in ('window', 'image', 'bitmap'):
+            return self._anchoredBBox(
+                coords, float(options.get('width', 0) or 0),
+                float(options.get('height', 0) or 0), options)
+        outline = item.type == 'line' or options.get(
+            'outline', ITEM_DEFAULTS[item.type]['outline']) != ''
+        pad = (float(options.get('width', 1)) / 2 if outline else 0) + 0.5
+        if item.type == 'line' and options.get('arrow', NONE) != NONE:
+            pad += max(float(x) for x in tkString(
+                options.get('arrowshape', (8, 10, 3))).split()) / 2
+        return BBoxEnclosing(*coords) if not coords else (
+            min(coords[0::2]) - pad, min(coords[1::2]) - pad,
+            max(coords[0::2]) + pad, max(coords[1::2]) + pad)
+
+    def _anchoredBBox(self, coords, width, height, options):
+        ax, ay = self.anchorVectors.get(options.get('anchor', CENTER), (0, 0))
+        x0 = coords[0] - width * (1 + ax) / 2
+        y0 = coords[1] - height * (1 + ay) / 2
+        return (x0, y0, x0 + width, y0 + height)
+
+    def bbox(self, *args):
+        boxes = [self._itemBBox(self.items[ID])
+                 for tagOrId in args for ID in self._find(tagOrId)
+                 if self.items[ID].options.get('state') != HIDDEN]
+        if not boxes:
+            return None
+        box = BBoxUnion(*boxes)
+        return (math.floor(box[0]), math.floor(box[1]),
+                math.ceil(box[2]), math.ceil(box[3]))
+
+    def find_all(self):
+        return tuple(self.order)
+
+    def find_withtag(self, tagOrId):
+        return tuple(self._find(tagOrId))
+
+    def find_overlapping(self, x1, y1, x2, y2):
+        return tuple(
+            ID for ID in self.order
+            if self.items[ID].options.get('state') != HIDDEN and
+            BBoxesOverlap((x1, y1, x2, y2), self._itemBBox(self.items[ID])))
+
+    def find_enclosed(self, x1, y1, x2, y2):
+        return tuple(
+            ID for ID in self.order
+            if self.items[ID].options.get('state') != HIDDEN and
+            BBoxContains((x1, y1, x2, y2), self._itemBBox(self.items[ID])))
+
+    def find_closest(self, x, y, halo=None, start=None):
+        visible = [ID for ID in self.order
+                   if self.items[ID].options.get('state') != HIDDEN]
+        return (min(reversed(visible), key=lambda ID: distance2(
+            (x, y), BBoxCenter(self._itemBBox(self.items[ID])))),
+                ) if visible else ()
+
+    def find_above(self, tagOrId):
+        IDs = self._find(tagOrId)
+        at = self.order.index(IDs[-1]) + 1 if IDs else len(self.order)
+        return tuple(self.order[at:at + 1])
+
+    def find_below(self, tagOrId):
+        IDs = self._find(tagOrId)
+        at = self.order.index(IDs[0]) if IDs else 0
+        return tuple(self.order[at - 1:at]) if at > 0 else ()
+
+class RecordingBackend(TkBackend):
+    '''Backend that runs visualizations without a display.  Canvases are
+    RecordingScrims and the other widgets are headless stand-ins.  The
+    sleep method advances a virtual clock instead of sleeping.
+    '''
+    headless = True
+    Frame, LabelFrame, Label = HeadlessFrame, HeadlessLabelFrame, HeadlessLabel
+    Button, Checkbutton, Radiobutton = (
+        HeadlessButton, HeadlessCheckbutton, HeadlessRadiobutton)
+    Scale, Entry, Text = HeadlessScale, HeadlessEntry, HeadlessText
+    Scrollbar, Toplevel, Scrim = (
+        HeadlessScrollbar, HeadlessToplevel, RecordingScrim)
+    ttkButton, ttkStyle = HeadlessTtkButton, HeadlessStyle
+
+    def __init__(self, maxFrames=1000):
+        self.clock = 0.0          # Virtual time in seconds
+        self.maxFrames = maxFrames # Frames kept by each RecordingScrim
+
+    def makeWindow(self, title=None):
+        return HeadlessWindow(self, title)
+
+    def photoImage(self, filename, size):
+        return '{}@{}x{}'.format(filename, *size)
+
+    def now(self):
+        return self.clock
+
+    def sleep(self, seconds):
+        self.clock += seconds
+
+    def waitForVariable(self, window, variable, seconds=None):
+        '''Advance the clock by seconds, or, if not given, to the next
+        scheduled callback, and then update the window.'''
+        root = window._root()
+        if seconds:
+            self.sleep(seconds)
+        elif root.scheduled:
+            self.clock = max(self.clock, root.scheduled[0][0])
+        else:
+            raise RuntimeError(
+                'Waiting for an event in a headless window with no callbacks '
+                'scheduled')
+        root.update()
+
+if __name__ == '__main__':
+    import time, random
+    try:
+        from Array import *
+    except ModuleNotFoundError:
+        from .Array import *
+
+    random.seed(3.14159)
+    array = Array(backend=RecordingBackend())
+    start = time.time()
+    for val in (17, 42, 8):
+        array.insert(val)
+    array.search(42)
+    array.deleteLast()
+    print('Ran {} frames with {} canvas changes covering {:.1f} seconds of '
+          'animation in {:.3f} seconds'.format(
+              array.canvas.frameCount,
+              sum(len(changes) for t, changes in array.canvas.frames),
+              array.backend.clock, time.time() - start))
@@ -2,10 +2,10 @@ __doc__ = """
 Program to show data structure visualizations in a tabbed Tk notebook
 presentation form.  This program loads all the visualization modules
 in the current directory that contain subclasses of VisualizationApp.
-It and instantiates each one in a separate tab.  When the user clicks
-on a tab, it calls the class's runVisualization method.  A preferred
-order for the modules (by class name) controls the order of the
-recognized modules.  The rest are added in alphabetical order. 
+It makes a separate tab for each one and instantiates the class the
+first time the user clicks on its tab, or while idle when pre-warming.
+A preferred order for the modules (by class name) controls the order
+of the recognized modules.  The rest are added in alphabetical order. 
 """
 
 import argparse, sys, os, random
@@ -55,7 +55,7 @@ and use the soft keyboard to enter values.
 def showVisualizations(   # Display a set of VisualizationApps in a ttk.Notebook
         classes, start=None, title="Datastructure Visualizations", 
         adjustForTrinket=False, seed='3.14159', verbose=0, debug=False,
-        theme='alt', introBG='white'):
+        theme='alt', introBG='white', prewarm=False, replay=False):
     if len(classes) == 0:
         print('No matching classes to visualize', file=sys.stderr)
         return
@@ -115,7 +115,7 @@ def showVisualizations(   # Display a set of VisualizationApps in a ttk.Notebook
         folders['Other'] = otherApps
     ordered_classes += otherApps
 
-    appNumber = 1
+    appClasses, appMakers = [], []
     for folder in folders:
         if folders[folder]:
             if verbose > 0:
@@ -124,32 +124,20 @@ def showVisualizations(   # Display a set of VisualizationApps in a ttk.Notebook
             notebook.add(group, text=folder)
         for app in folders[folder]:
             if verbose > 0:
-                print('Found app {} and instantiating in {}'.format(
+                print('Found app {} and adding its tab in {}'.format(
                     app.__name__, folder),
                       file=sys.stderr)
             pane = ttk.Frame(group)
-            loading['text'] = '\nLoading module {} of {} modules...'.format(
-                appNumber, len(classes))
-            appNumber += 1
-            try:
-                vizApp = app(window=pane)
-                vizApp.DEBUG = debug
-                name = getattr(vizApp, 'title', app.__name__)
-                pane.bind('<Map>', oneTimeShowHintHandler(vizApp), '+')
-
-            except Exception as e:
-                name = app.__name__
-                msg = 'Error instantiating {}:\n{}'.format(name, e)
-                label = Label(pane, text=msg, fg='red')
-                label.pack()
-                print(msg, file=sys.stderr)
-                
+            appClasses.append(app)
+            appMakers.append(lazyAppMaker(
+                app, pane, debug, verbose, seed=seed, replay=replay))
+            name = appTitle(app)
             group.add(pane, text=name)
             if start and start.lower() in (app.__name__.lower(), name.lower()):
                 notebook.select(group)
                 group.select(pane)
-    loading.destroy()
     resizeIntro(intro, padBy)
+    preloadApps(top, appClasses, appMakers, loading, prewarm)
     top.mainloop()
 
 def mapHandler(introCenter, padding, debug=False):
@@ -197,6 +185,12 @@ if __name__ == '__main__':
         '--seed', default='3.14159',
         help='Random number generator seed.  Set to empty string to skip '
         'seeding.')
+    parser.add_argument(
+        '-p', '--prewarm', default=False, action='store_true',
+        help='Instantiate visualizations while idle, before they are shown.')
+    parser.add_argument(
+        '-r', '--replay', default=False, action='store_true',
+        help='Record operations so they can be replayed with a slider.')
     parser.add_argument(
         '-d', '--debug', default=False, action='store_true',
         help='Show debugging information.')
@@ -219,7 +213,8 @@ if __name__ == '__main__':
             print('No files provided.  Unique directories to search:', dirs,
                   'with search order:', list(dirs))
         args.files = list(dirs)
-    showVisualizations(findVisualizations(args.files, args.verbose),
+    showVisualizations(findVisualizations(args.files, args.verbose,
+                                          MANIFEST),
                        start=args.start, title=args.title, verbose=args.verbose,
                        adjustForTrinket=args.warn_for_trinket, debug=args.debug,
-                       seed=args.seed)
+                       seed=args.seed, prewarm=args.prewarm, replay=args.replay)
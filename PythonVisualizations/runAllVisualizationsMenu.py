@@ -2,10 +2,11 @@ __doc__ = """
 Program to show algorithm visualizations one at at time with a
 dropdown menu to select one.  This program loads all the visualization
 modules in the current directory that contain subclasses of
-VisualizationApp.  It instantiates each one in a separate Frame, and
-builds a menu to choose one.  When the user selects a visualization,
-the frame is shown (by using grid to manage its geometry) and all the
-others are hidden.  A preferred order for the modules (by class or
+VisualizationApp.  It makes a separate Frame for each one and builds a
+menu to choose one.  Each class is instantiated in its frame when first
+chosen, or while idle when pre-warming.  When the user selects a
+visualization, the frame is shown (by using grid to manage its geometry)
+and all the others are hidden.  A preferred order for the modules (by class or
 name) controls the order of the recognized modules and groups them
 with a prefix 'folder' name.  The rest are added in alphabetical
 order in a folder called 'Other'.
@@ -127,7 +128,7 @@ def resizeHandler(event):
 def showVisualizations(   # Display a set of VisualizationApps in pulldown menu
         classes, start=None, title="Datastructure Visualizations", version=None,
         adjustForTrinket=False, seed='3.14159', verbose=0, debug=False,
-        theme='alt', introBG='white'):
+        theme='alt', introBG='white', prewarm=False, replay=False):
     global DEBUG
     DEBUG = debug
     if len(classes) == 0:
@@ -199,36 +200,27 @@ def showVisualizations(   # Display a set of VisualizationApps in pulldown menu
     ordered_classes += otherApps
 
     startAppWindow = None
+    appClasses, appMakers = [], []
     for folder in folders:
         if folders[folder]:
             if verbose > 0:
                 print('Constructing folder {}'.format(folder), file=sys.stderr)
         for app in folders[folder]:
             if verbose > 0:
-                print('Found app {} and instantiating in {}'.format(
+                print('Found app {} and adding its menu entry in {}'.format(
                     app.__name__, folder),
                       file=sys.stderr)
             pane = ttk.Frame(top)
-            loading['text'] = '\nLoading module {} of {} modules...'.format(
-                len(appWindows), len(classes))
-            try:
-                vizApp = app(window=pane)
-                vizApp.DEBUG = debug
-                appTitle = getattr(vizApp, 'title', app.__name__)
-                name = folder + ': ' + appTitle
-                setattr(pane, 'appTitle', appTitle)
-                appWindows.append(pane)
-                pane.bind('<Map>', oneTimeShowHintHandler(vizApp), '+')
-            except Exception as e:
-                name = app.__name__ + ' *'
-                msg = 'Error instantiating {}:\n{}'.format(app.__name__, e)
-                label = Label(pane, text=msg, fg='red')
-                label.grid()
-                print(msg, file=sys.stderr)
+            appClasses.append(app)
+            appMakers.append(lazyAppMaker(
+                app, pane, debug, verbose, 'grid', seed, replay))
+            paneTitle = appTitle(app)
+            name = folder + ': ' + paneTitle
+            setattr(pane, 'appTitle', paneTitle)
+            appWindows.append(pane)
 
             if start and start.lower() in (
-                    getattr(vizApp, 'title', app.__name__).lower(),
-                    app.__name__.lower()) and pane == appWindows[-1]:
+                    paneTitle.lower(), app.__name__.lower()):
                startAppWindow = pane
                
                pane.grid(row=1, column=0, sticky=(N, E, W, S))
@@ -267,13 +259,13 @@ def showVisualizations(   # Display a set of VisualizationApps in pulldown menu
             raise ValueError('Version must be string or tuple/list, not {}'
                              .format(type(version)))
             
-    loading['text'] = ''
     if verbose > 1:
         print('Top geometry:', top.winfo_geometry(),
               'Menubutton geometry:', menubutton.winfo_geometry(),
               'RestoreMenu geometry:', restoreMenu.winfo_geometry(),
               'RestoreMenu height:', restoreMenu['height'],
               file=sys.stderr)
+    preloadApps(top, appClasses, appMakers, loading, prewarm)
     top.mainloop()
 
 if __name__ == '__main__':
@@ -302,6 +294,12 @@ if __name__ == '__main__':
         '--seed', default='3.14159',
         help='Random number generator seed.  Set to empty string to skip '
         'seeding.')
+    parser.add_argument(
+        '-p', '--prewarm', default=False, action='store_true',
+        help='Instantiate visualizations while idle, before they are shown.')
+    parser.add_argument(
+        '-r', '--replay', default=False, action='store_true',
+        help='Record operations so they can be replayed with a slider.')
     parser.add_argument(
         '-d', '--debug', default=False, action='store_true',
         help='Show debugging information.')
@@ -328,7 +326,9 @@ if __name__ == '__main__':
     if (args.version and args.version.startswith('(') and
         args.version.endswith(')')):
         args.version = eval(args.version)
-    showVisualizations(findVisualizations(args.files, args.verbose),
+    showVisualizations(findVisualizations(args.files, args.verbose,
+                                          MANIFEST),
                        start=args.start, title=args.title, verbose=args.verbose,
                        adjustForTrinket=args.warn_for_trinket, debug=args.debug,
-                       seed=args.seed, version=args.version)
+                       seed=args.seed, version=args.version,
+                       prewarm=args.prewarm, replay=args.replay)
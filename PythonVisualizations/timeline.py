@@ -0,0 +1,356 @@
+__doc__ = """
+Timeline of the changes made to a canvas during an operation.
+The changes are recorded by intercepting the canvas's mutating methods.
+Each change is stored with what is needed to undo it, and the changes
+between waits are grouped as frames.  After recording, the canvas can be
+moved to the state at the end of any frame by reverting or reapplying
+frames without re-running the operation that made them.
+
+Items created during the operation are hidden, not deleted, when the
+timeline is moved before their creation, so that the IDs held by the
+visualization remain valid.  Items the operation deleted are recreated
+with new IDs when moving back before their deletion, and hidden when
+moving forward again.  Resetting the timeline moves to the end and
+deletes those recreated items.
+"""
+
+from collections import *
+from tkinter import *
+from tkinter import _flatten
+
+try:
+    from tkUtilities import *
+except ModuleNotFoundError:
+    from .tkUtilities import *
+
+class Timeline(object):
+    # Canvas methods that change items, and the names of the Timeline
+    # methods that record them
+    RECORDERS = {
+        '_create': 'recordCreate', 'coords': 'recordCoords',
+        'move': 'recordMove', 'scale': 'recordScale',
+        'itemconfigure': 'recordConfigure', 'itemconfig': 'recordConfigure',
+        'delete': 'recordDelete', 'tag_raise': 'recordRestack',
+        'lift': 'recordRestack', 'tkraise': 'recordRestack',
+        'tag_lower': 'recordRestack', 'lower': 'recordRestack',
+        'addtag_withtag': 'recordAddtag', 'dtag': 'recordDtag',
+        'applyCommands': 'recordCommands'}
+
+    # Canvas commands sent in batches and the recorders for them
+    BATCH_RECORDERS = {
+        'move': 'recordMove', 'coords': 'recordCoords',
+        'itemconfigure': 'recordConfigure'}
+
+    def __init__(
+            self, canvas,
+            maxFrames=5000,     # Maximum number of frames to keep
+            onInvalidate=None): # Function to call when canvas changes outside
+        self.canvas = canvas    # of recording and seeking
+        self.maxFrames = maxFrames
+        self.onInvalidate = onInvalidate
+        self.originals = {}     # Canvas methods replaced by recorders
+        self.frames = deque(maxlen=maxFrames)
+        self.changes = []       # Changes in the frame being recorded
+        self.position = 0       # Number of frames applied to canvas
+        self.ids = {}           # Current IDs of items recreated on canvas
+        self.ghosts = set()     # Recorded IDs of deleted items now hidden
+        self.recording = False
+        self.busy = False       # Flag to pass canvas calls straight through
+
+    def __len__(self):
+        return len(self.frames)
+
+    # Recording
+    def attach(self):
+        'Intercept the canvas methods that change items'
+        for name, recorder in self.RECORDERS.items():
+            if name not in self.originals:
+                self.originals[name] = getattr(self.canvas, name)
+                setattr(self.canvas, name,
+                        self.interceptor(self.originals[name],
+                                         getattr(self, recorder)))
+
+    def detach(self):
+        for name in self.originals:
+            delattr(self.canvas, name)
+        self.originals = {}
+
+    def interceptor(self, original, recorder):
+        def intercept(*args, **kw):
+            if self.busy:
+                return original(*args, **kw)
+            if not self.recording:  # Changes outside of an operation make
+                if self.changesCanvas(recorder, args, kw): # the timeline
+                    self.invalidate()                      # unusable
+                return original(*args, **kw)
+            self.busy = True
+            try:
+                return recorder(original, *args, **kw)
+            finally:
+                self.busy = False
+        return intercept
+
+    def start(self):
+        'Start recording a new timeline'
+        self.reset()
+        self.attach()
+        self.recording = True
+
+    def stop(self):
+        'Stop recording, leaving the canvas at the end of the timeline'
+        self.endFrame()
+        self.recording = False
+
+    def endFrame(self):
+        'End the current frame of changes, if any'
+        if self.changes:
+            self.frames.append(tuple(self.changes))
+            self.changes = []
+            self.position = len(self.frames)
+
+    def reset(self):
+        '''Move the canvas to the end of the timeline, delete items that
+        were recreated to show earlier frames, and clear the timeline'''
+        self.seek(len(self.frames))
+        self.busy = True
+        try:
+            for ID in self.ghosts:
+                self.canvas.delete(self.ids.get(ID, ID))
+        finally:
+            self.busy = False
+        self.detach()
+        self.frames.clear()
+        self.changes, self.position, self.ids, self.ghosts = [], 0, {}, set()
+        self.recording = False
+
+    def changesCanvas(self, recorder, args, kw):
+        'Determine if a call to an intercepted method changes the canvas'
+        if recorder == self.recordCoords:
+            return len(args) > 1
+        if recorder == self.recordConfigure:
+            return bool(kw) or (len(args) > 1 and isinstance(args[1], dict))
+        return True
+
+    def invalidate(self):
+        'Restore the canvas to the end of the timeline and clear it'
+        self.reset()
+        if self.onInvalidate:
+            self.onInvalidate()
+
+    def find(self, tagOrId):
+        return ((tagOrId,) if isinstance(tagOrId, int) else
+                self.canvas.find_withtag(tagOrId))
+
+    def recordCreate(self, original, itemType, args, kw):
+        ID = original(itemType, args, kw)
+        self.changes.append(('create', ID, self.canvas.itemcget(ID, 'state')))
+        return ID
+
+    def recordCoords(self, original, tagOrId, *args):
+        if not args:
+            return original(tagOrId)
+        for ID in self.find(tagOrId)[:1]:
+            self.changes.append(('coords', ID, tuple(self.canvas.coords(ID)),
+                                 tuple(_flatten(args))))
+        return original(tagOrId, *args)
+
+    def recordMove(self, original, tagOrId, xAmount, yAmount):
+        self.changes.append(
+            ('move', self.find(tagOrId), float(xAmount), float(yAmount)))
+        return original(tagOrId, xAmount, yAmount)
+
+    def recordScale(self, original, tagOrId, *args):
+        IDs = self.find(tagOrId)
+        before = [tuple(self.canvas.coords(ID)) for ID in IDs]
+        result = original(tagOrId, *args)
+        for ID, coords in zip(IDs, before):
+            self.changes.append(
+                ('coords', ID, coords, tuple(self.canvas.coords(ID))))
+        return result
+
+    def recordConfigure(self, original, tagOrId, cnf=None, **kw):
+        if isinstance(cnf, str) or (cnf is None and not kw): # Queries pass
+            return original(tagOrId, cnf, **kw)              # through
+        options = dict(cnf or {}, **kw)
+        for ID in self.find(tagOrId):
+            self.changes.append(
+                ('configure', ID, self.currentOptions(ID, options), options))
+        return original(tagOrId, cnf, **kw)
+
+    def currentOptions(self, ID, options):
+        'Get an item\'s options, taking colors from the canvas color cache'
+        colors = (self.canvas.getItemColors(ID)
+                  if self.canvas.COLOR_ATTRIBUTES.intersection(options)
+                  else {})
+        return dict((key, colors[key] if key in colors else
+                     self.canvas.itemcget(ID, key)) for key in options)
+
+    def recordDelete(self, original, *args):
+        '''Record the items of a delete call as one change, listed with the
+        item below each one, from the bottom of the stacking order up'''
+        order = self.stackingOrder()
+        IDs = sorted(set(ID for tagOrId in args for ID in self.find(tagOrId)
+                         if ID in order), key=order.get)
+        if IDs:
+            self.changes.append(('delete', tuple(
+                (ID, self.canvas.type(ID), tuple(self.canvas.coords(ID)),
+                 self.canvas.itemConfig(ID), under)
+                for ID, under in zip(IDs, self.below(IDs)))))
+        return original(*args)
+
+    def stackingOrder(self):
+        'Map each item on the canvas to its position in the stacking order'
+        return dict((ID, i) for i, ID in enumerate(self.canvas.find_all()))
+
+    def recordRestack(self, original, *args):
+        IDs = self.find(args[0]) if args else ()
+        before = self.below(IDs)
+        result = original(*args)
+        self.changes.append(('restack', IDs, before, self.below(IDs)))
+        return result
+
+    def below(self, IDs):
+        'Get the item below each of a group of items, or None at the bottom'
+        return tuple((self.canvas.find_below(ID) or (None,))[0] for ID in IDs)
+
+    def recordAddtag(self, original, newtag, tagOrId):
+        self.changes.append(('addtag', newtag, tuple(
+            ID for ID in self.find(tagOrId)
+            if newtag not in self.canvas.gettags(ID))))
+        return original(newtag, tagOrId)
+
+    def recordDtag(self, original, tagOrId, tagToDelete=None):
+        tag = tagOrId if tagToDelete is None else tagToDelete
+        self.changes.append(('dtag', tag, tuple(
+            ID for ID in self.find(tagOrId) if tag in self.canvas.gettags(ID))))
+        return original(tagOrId, tagToDelete)
+
+    def recordCommands(self, original, commands):
+        'Record a batch of commands before the batch changes the canvas'
+        noop = lambda *args, **kw: None
+        for command, args, kw in commands:
+            getattr(self, self.BATCH_RECORDERS[command])(noop, *args, **kw)
+        return original(commands)
+
+    def snapshot(self):
+        '''Describe the visible items on the canvas in stacking order by
+        their type, coordinates, and tags, so canvas states can be compared'''
+        return [(self.canvas.type(ID),
+                 tuple(round(float(c), 2) for c in self.canvas.coords(ID)),
+                 self.canvas.gettags(ID))
+                for ID in self.canvas.find_all()
+                if self.canvas.itemcget(ID, 'state') != HIDDEN]
+
+    # Replaying
+    def seek(self, position):
+        '''Move the canvas to the state at the end of a frame by reverting
+        or reapplying frames.  Position 0 is the state before the first
+        frame.  Returns the new position.'''
+        position = max(0, min(len(self.frames), position))
+        self.busy = True
+        try:
+            while self.position > position:
+                self.position -= 1
+                self.revert(self.frames[self.position])
+            while self.position < position:
+                self.apply(self.frames[self.position])
+                self.position += 1
+        finally:
+            self.busy = False
+        return self.position
+
+    def apply(self, frame):
+        commands = []
+        for change in frame:
+            kind = change[0]
+            if kind == 'create':
+                ID = self.id(change[1])
+                commands += [('itemconfigure', (ID,), {'state': change[2]}),
+                             ('raise', (ID,), {})]
+            elif kind == 'delete':
+                for item in change[1]:
+                    commands.append(('itemconfigure', (self.id(item[0]),),
+                                     {'state': HIDDEN}))
+                    self.ghosts.add(item[0])
+            else:
+                commands += self.forward(change)
+        self.canvas.applyCommands(commands)
+
+    def revert(self, frame):
+        commands = []
+        for change in reversed(frame):
+            kind = change[0]
+            if kind == 'create':
+                commands.append(
+                    ('itemconfigure', (self.id(change[1]),), {'state': HIDDEN}))
+            elif kind == 'delete':    # Restore deleted items after prior
+                self.canvas.applyCommands(commands) # commands
+                commands = []
+                self.restore(change[1])
+            else:
+                commands += self.backward(change)
+        self.canvas.applyCommands(commands)
+
+    def id(self, ID):
+        return self.ids.get(ID, ID)
+
+    def forward(self, change):
+        kind = change[0]
+        if kind == 'coords':
+            return [('coords', (self.id(change[1]), change[3]), {})]
+        if kind == 'move':
+            return [('move', (self.id(ID), change[2], change[3]), {})
+                    for ID in change[1]]
+        if kind == 'configure':
+            return [('itemconfigure', (self.id(change[1]),), change[3])]
+        if kind == 'restack':
+            return self.restack(change[1], change[3])
+        if kind in ('addtag', 'dtag'):
+            return self.retag(kind, change[1], change[2])
+        return []
+
+    def backward(self, change):
+        kind = change[0]
+        if kind == 'coords':
+            return [('coords', (self.id(change[1]), change[2]), {})]
+        if kind == 'move':
+            return [('move', (self.id(ID), -change[2], -change[3]), {})
+                    for ID in change[1]]
+        if kind == 'configure':
+            return [('itemconfigure', (self.id(change[1]),), change[2])]
+        if kind == 'restack':
+            return self.restack(change[1], change[2])
+        if kind in ('addtag', 'dtag'):
+            return self.retag('dtag' if kind == 'addtag' else 'addtag',
+                              change[1], change[2])
+        return []
+
+    def restack(self, IDs, below):
+        '''Put items back above the items that were below them, going up
+        the stacking order so each item below is already in place'''
+        return [('raise', (self.id(ID), self.id(under)), {}) if under else
+                ('lower', (self.id(ID),), {}) for ID, under in zip(IDs, below)]
+
+    def retag(self, kind, tag, IDs):
+        return [('addtag', (tag, 'withtag', self.id(ID)), {}) if kind == 'addtag'
+                else ('dtag', (self.id(ID), tag), {}) for ID in IDs]
+
+    def restore(self, items):
+        '''Show the hidden items of a delete or recreate those no longer on
+        the canvas, going up the stacking order so each item below is
+        already in place'''
+        for item in items:
+            if item[0] in self.ghosts:
+                self.canvas.itemconfigure(
+                    self.id(item[0]), state=item[3].get('state', ''))
+                self.ghosts.discard(item[0])
+            else:
+                self.recreate(*item)
+
+    def recreate(self, ID, itemType, coords, options, below):
+        newID = self.canvas._create(itemType, coords, options)
+        self.ids[ID] = newID
+        if below is None:
+            self.canvas.tag_lower(newID)
+        elif self.canvas.type(self.id(below)):
+            self.canvas.tag_raise(newID, self.id(below))
@@ -1,11 +1,13 @@
 __doc__ = """
 Utilty methods and classes for Tk, and in particular, a specialized
-version of canvas called 'Scrim', and a cache of Tk images.
+version of canvas called 'Scrim', a cache of Tk images, and the Tk
+display backend that supplies widgets to visualizations.
 """
 
-import re, sys, math, os
+import re, sys, math, os, time, functools
+import tkinter
 from tkinter import *
-from tkinter import ttk
+from tkinter import ttk, _join, _flatten
 import tkinter.font as tkfont
 from enum import Enum
 
@@ -156,26 +158,118 @@ def widgetState(widget, state=None): # Get or set widget state
 
 sizePattern = re.compile(r'-?\d+')
 
+FONT_CACHE_SIZE = 1024   # Maximum number of fonts and text measurements kept
+
 def textWidth(font, text=' '):
-    return tkFontFromSpec(font).measure(text)
+    try:
+        return measureText(fontKey(font), text)
+    except TypeError:        # Font spec with unhashable parts
+        return makeFont(font).measure(text)
         
 def textHeight(font, text=' '):
     lines = text.split('\n')
     nLines = len(lines) if lines and len(lines[-1]) > 0 else len(lines) - 1
-    return tkFontFromSpec(font).metrics()['linespace'] * nLines
+    try:
+        linespace = fontMetrics(fontKey(font))[1]
+    except TypeError:
+        linespace = makeFont(font).metrics()['linespace']
+    return linespace * nLines
 
 def tkFontFromSpec(spec):
+    '''Get a font for a font spec tuple.  Fonts are cached, so the result
+    should not be reconfigured.'''
+    try:
+        return fontMetrics(fontKey(spec))[0]
+    except TypeError:
+        return makeFont(spec)
+
+fontRoots = set()         # IDs of Tk roots whose fonts are in the caches
+
+def fontKey(spec):
+    '''Make the key for caching fonts and measurements: the ID of the Tk
+    root that fonts are made in, if any, and the font spec as a tuple.
+    The ID is used so the caches don't keep destroyed roots alive, and the
+    caches are cleared when a root is destroyed.'''
+    root = tkinter._default_root
+    if root is not None and id(root) not in fontRoots:
+        fontRoots.add(id(root))
+        root.bind('<Destroy>', clearFontCaches(root), '+')
+    return (id(root), tuple(spec))
+
+def clearFontCaches(root):
+    def clearHandler(event):
+        if event.widget is root:
+            fontRoots.discard(id(root))
+            fontMetrics.cache_clear()
+            measureText.cache_clear()
+    return clearHandler
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def fontMetrics(key):
+    '''Return the font for a font key along with its line spacing and, for
+    fixed pitch Tk fonts, the width of each character'''
+    font = makeFont(key[1])
+    charWidth = (font.measure('0') if isinstance(font, tkfont.Font) and
+                 font.metrics('fixed') else None)
+    return font, font.metrics('linespace'), charWidth
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def measureText(key, text):
+    font, linespace, charWidth = fontMetrics(key)
+    if (charWidth and isinstance(text, str) and text.isascii() and
+        text.isprintable()):    # Fixed pitch characters all have same width
+        return charWidth * len(text)
+    return font.measure(text)
+
+def makeFont(spec):
     family = spec[0]
     size = spec[1] if (len(spec) > 1 and 
                        (isinstance(spec[1], int) or
                         (isinstance(spec[1], str) and 
                          sizePattern.match(spec[1])))) else 0
-    return tkfont.Font(
+    options = dict(
         family=family, size=size,
         weight=lookFor(('bold', 'light'), spec, 'normal'),
         slant=lookFor(('italic', 'oblique'), spec, 'roman'),
         underline=1 if lookFor(('underline',), spec, 0) else 0,
         overstrike=1 if lookFor(('overstrike',), spec, 0) else 0)
+    try:
+        return tkfont.Font(**options)
+    except RuntimeError:   # No Tk root window exists, e.g. when running
+        return EstimatedFont(**options) # without a display
+
+class EstimatedFont(object):
+    '''Stand in for tkinter.font.Font when there is no Tk display to measure
+    text.  Measurements are estimated from the font size using average
+    character widths for fixed and proportional pitch fonts.'''
+    FIXED_FAMILIES = set(('courier', 'courier new', 'consolas', 'monaco',
+                          'menlo', 'monospace', 'tkfixedfont'))
+    DEFAULT_SIZE = -12
+
+    def __init__(self, family='Helvetica', size=0, weight='normal',
+                 slant='roman', underline=0, overstrike=0):
+        size = int(sizePattern.match(str(size)).group()) if size else 0
+        self.options = dict(
+            family=family, size=size or self.DEFAULT_SIZE, weight=weight,
+            slant=slant, underline=underline, overstrike=overstrike)
+        self.pixels = abs(self.options['size']) * (
+            1 if self.options['size'] < 0 else 4 / 3) # Points to pixels
+        self.fixed = family.lower() in self.FIXED_FAMILIES
+        self.charWidth = self.pixels * (
+            0.6 if self.fixed or weight == 'bold' else 0.55)
+
+    def measure(self, text, displayof=None):
+        return round(len(text) * self.charWidth)
+
+    def metrics(self, *options, **kw):
+        ascent = math.ceil(self.pixels * 0.9)
+        descent = math.ceil(self.pixels * 0.25)
+        metrics = {'ascent': ascent, 'descent': descent,
+                   'linespace': ascent + descent, 'fixed': int(self.fixed)}
+        return metrics[options[0]] if len(options) == 1 else metrics
+
+    def actual(self, option=None, displayof=None):
+        return self.options[option] if option else dict(self.options)
         
 def lookFor(keys, spec, default):  # Find keyword in font spec
     strings = [x.lower() for x in spec if isinstance(x, str)]
@@ -226,6 +320,22 @@ def genericEventHandler(
 class Scrim(Canvas):
     '''Enhanced Tk Canvas widget with more convenience methods.
     '''
+    POOL_LIMIT = 100    # Maximum number of released items kept for each type
+
+    def __init__(self, master=None, cnf={}, **kw):
+        super().__init__(master, cnf, **kw)
+        self.initItemPool()
+        self.initColorCache()
+
+    def initItemPool(self):
+        self.itemPool = {}        # Released items for reuse by item type
+        self.pooledItems = {}     # Type and option names of pooled items
+        self.itemDefaults = {}    # Default option values by item type
+        self.taggedOptions = set() # Options set by tag, maybe on pooled items
+
+    def initColorCache(self):
+        self.itemColors = {}      # Color attributes of items by item ID
+
     # CANVAS ITEM METHODS
     def itemConfig(self, canvasitem, *key, **kwargs):
         '''Do what the tk canvas itemconfigure command does, but return only
@@ -285,6 +395,108 @@ class Scrim(Canvas):
             return tuple(result)
         return result
 
+    def itemconfigure(self, tagOrId, cnf=None, **kw):
+        result = super().itemconfigure(tagOrId, cnf, **kw)
+        self.cacheColors(tagOrId, cnf, kw)
+        self.trackPooledOptions(tagOrId, cnf, kw)
+        return result
+    itemconfig = itemconfigure
+
+    # ITEM POOL
+    def create_pooled(self, itemType, *coords, **options):
+        '''Create a canvas item of a given type, reusing an item of that
+        type released to the pool, if any.  Options the reused item had
+        that are not given are restored to their defaults, and the item
+        is raised to the top, like a newly created item.'''
+        options = dict((k, v) for k, v in options.items() if v is not None)
+        pool = self.itemPool.get(itemType)
+        if pool:
+            item = pool.pop()
+            defaults = self.itemDefaults[itemType]
+            settings = dict((key, defaults[key])
+                            for key in self.pooledItems[item][1] |
+                            self.taggedOptions
+                            if key not in options and key in defaults)
+            settings.update(options)
+            self.coords(item, *coords)
+            self.itemconfigure(item, **settings)
+            self.tag_raise(item)
+        else:
+            item = getattr(self, 'create_' + itemType)(*coords, **options)
+            if itemType not in self.itemDefaults:
+                self.itemDefaults[itemType] = dict(
+                    (key, spec[3])
+                    for key, spec in self.itemconfigure(item).items())
+        self.pooledItems[item] = (itemType, set(options))
+        return item
+
+    def trackPooledOptions(self, tagOrId, cnf, kw):
+        '''Note the options configured on pooled items so they are reset
+        when the items are reused.  Options set by tag are noted for all
+        pooled items.'''
+        if not self.pooledItems or isinstance(cnf, str):
+            return
+        if isinstance(tagOrId, int):
+            if tagOrId in self.pooledItems:
+                self.pooledItems[tagOrId][1].update(cnf or (), kw)
+        else:
+            self.taggedOptions.update(cnf or (), kw)
+
+    def release(self, *items):
+        '''Remove items from view.  Items made by create_pooled are hidden
+        and kept for reuse up to POOL_LIMIT per type.  Others are deleted.'''
+        for item in items:
+            itemType, options = self.pooledItems.get(
+                item, (None, None)) if isinstance(item, int) else (None, None)
+            if itemType is None:
+                self.delete(item)
+                continue
+            pool = self.itemPool.setdefault(itemType, [])
+            if item in pool:     # Already released
+                continue
+            if len(pool) >= self.POOL_LIMIT or not self.type(item):
+                self.delete(item)
+                continue
+            for sequence in self.tag_bind(item):
+                self.tag_unbind(item, sequence)
+            self.itemconfigure(item, state=HIDDEN, tags=())
+            options |= set(('state', 'tags'))
+            pool.append(item)
+
+    def delete(self, *args):
+        self.forgetPooled(*args)
+        self.forgetColors(*args)
+        super().delete(*args)
+
+    def forgetPooled(self, *args):
+        'Remove items being deleted from the pool'
+        if 'all' in args:
+            self.itemPool, self.pooledItems = {}, {}
+            self.taggedOptions = set()
+            return
+        for item in args:
+            if isinstance(item, int) and item in self.pooledItems:
+                itemType = self.pooledItems.pop(item)[0]
+                if item in self.itemPool.get(itemType, ()):
+                    self.itemPool[itemType].remove(item)
+
+    # BATCHED CHANGES
+    def batch(self):
+        '''Make a CanvasBatch to collect changes to canvas items and apply
+        them in a single Tcl evaluation'''
+        return CanvasBatch(self)
+
+    def applyCommands(self, commands):
+        'Run a list of (command, args, kwargs) canvas commands in one call'
+        if commands:
+            self.tk.eval('\n'.join(
+                _join((self._w, command) + _flatten(args) + self._options(kw))
+                for command, args, kw in commands))
+            for command, args, kw in commands:
+                if command == 'itemconfigure':
+                    self.cacheColors(args[0], None, kw)
+                    self.trackPooledOptions(args[0], None, kw)
+
     FADED_COLORS = {
         'fill': 'bisque', 'outline': 'bisque',
         'activefill': 'bisque', 'activeoutline': 'bisque',
@@ -312,6 +524,7 @@ class Scrim(Canvas):
         'window': set(),
         None: set()
     }
+    COLOR_ATTRIBUTES = set().union(*TYPE_COLORS.values())
     
     def fadeItems(self, items, colors=(FADED_FILL,)):
         '''Set colors of canvas items to faded colors while creating a list of
@@ -355,19 +568,54 @@ class Scrim(Canvas):
         nColors = len(colors)
         itemColors = []
         for i, item in enumerate(items):
-            itemColors.append(self.getItemColors(item))
+            oldColors = self.getItemColors(item)
+            itemColors.append(oldColors)
             if nColors > 0:
-                newColors = colors[min(i, nColors - 1)].copy()
-                oldColors = itemColors[-1]
-                for attribute in set(newColors.keys()) - set(oldColors.keys()):
-                    del newColors[attribute]
-                self.itemconfigure(item, **newColors)
+                newColors = dict(
+                    (key, value)
+                    for key, value in colors[min(i, nColors - 1)].items()
+                    if key in oldColors and oldColors[key] != value)
+                if newColors:  # Only configure colors that change
+                    self.itemconfigure(item, **newColors)
         return itemColors
 
     def getItemColors(self, item):
-        config = self.itemConfig(item)
-        return dict([(key, config[key])
-                     for key in self.TYPE_COLORS[self.type(item)]])
+        '''Get a dictionary of an item's color attributes.  The colors of
+        items referenced by ID are cached and updated when the items are
+        configured, so only the first request reads them from Tk.'''
+        colors = self.itemColors.get(item) if isinstance(item, int) else None
+        if colors is None:
+            config = self.itemConfig(item)
+            colors = dict([(key, config[key])
+                           for key in self.TYPE_COLORS[self.type(item)]])
+            if isinstance(item, int) and config:
+                self.itemColors[item] = colors
+        return colors.copy()
+
+    def cacheColors(self, tagOrId, cnf, kw):
+        '''Write color attributes being configured for an item through to
+        the color cache.  Setting colors by tag clears the cache.'''
+        if not self.itemColors or isinstance(cnf, str):
+            return
+        options = dict(cnf or {}, **kw)
+        colors = self.itemColors.get(tagOrId) if isinstance(
+            tagOrId, int) else None
+        if colors is not None:
+            for key, value in options.items():
+                if key in colors and value is not None:
+                    colors[key] = value
+        elif not isinstance(tagOrId, int) and any(
+                key in self.COLOR_ATTRIBUTES for key in options):
+            self.itemColors = {}
+
+    def forgetColors(self, *args):
+        'Remove items being deleted from the color cache'
+        if 'all' in args:
+            self.itemColors = {}
+            return
+        for item in args:
+            if isinstance(item, int):
+                self.itemColors.pop(item, None)
 
     def getItemFont(self, item):
         return parseTkFont(self.itemConfig(item, 'font'))
@@ -427,6 +675,38 @@ class Scrim(Canvas):
 # Tk image utilities
 __tk_image_cache__ = {'Img': {}, 'PhotoImage': {}, 'debug': False}
 
+class CanvasBatch(object):
+    '''Collect move, coords, and itemconfigure changes to canvas items so
+    they can be sent to Tk together rather than one Tcl call per change.
+    Use it as a context manager or call apply() to make the changes.'''
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.commands = []
+
+    def __len__(self):
+        return len(self.commands)
+
+    def move(self, tagOrId, xAmount, yAmount):
+        self.commands.append(('move', (tagOrId, xAmount, yAmount), {}))
+
+    def coords(self, tagOrId, *coords):
+        self.commands.append(('coords', (tagOrId, coords), {}))
+
+    def itemconfigure(self, tagOrId, **kw):
+        self.commands.append(('itemconfigure', (tagOrId,), kw))
+    itemconfig = itemconfigure
+
+    def apply(self):
+        commands, self.commands = self.commands, []
+        self.canvas.applyCommands(commands)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is None:
+            self.apply()
+
 def getImage(filename, cache=True, path=None):
     if not cache or filename not in __tk_image_cache__['Img']:
         if path is None: path = sys.path
@@ -452,6 +732,58 @@ def getPhotoImage(filename, size, cache=True, path=None):
         if __tk_image_cache__['debug']:
             print('as', __tk_image_cache__['PhotoImage'][id(image), size])
     return __tk_image_cache__['PhotoImage'][id(image), size]
+
+class TkBackend(object):
+    '''Supplier of the windows, widgets, images, and timing used to display
+    a visualization.  This backend uses a Tk display.  Other backends
+    substitute their own classes for the tkinter widget classes listed in
+    widgetNames, e.g. to run visualizations without a display.
+    '''
+    headless = False
+    widgetNames = ('Frame', 'LabelFrame', 'Label', 'Button', 'Checkbutton',
+                   'Radiobutton', 'Scale', 'Entry', 'Text', 'Scrollbar',
+                   'Toplevel', 'Scrim', 'ttkButton', 'ttkStyle')
+    Frame, LabelFrame, Label, Button = Frame, LabelFrame, Label, Button
+    Checkbutton, Radiobutton, Scale, Entry = (
+        Checkbutton, Radiobutton, Scale, Entry)
+    Text, Scrollbar, Toplevel, Scrim = Text, Scrollbar, Toplevel, Scrim
+    ttkButton, ttkStyle = ttk.Button, ttk.Style
+
+    def widgetClass(self, tkClass):
+        'Get the class this backend uses in place of a tkinter widget class'
+        for name in self.widgetNames:
+            if getattr(TkBackend, name) is tkClass:
+                return getattr(self, name)
+        return tkClass
+
+    def makeWindow(self, title=None):
+        'Make a top level window for a visualization'
+        window = Tk()
+        if title:
+            window.title(title)
+        return window
+
+    def photoImage(self, filename, size):
+        return getPhotoImage(filename, size)
+
+    def now(self):
+        return time.perf_counter()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def waitForVariable(self, window, variable, seconds=None):
+        '''Run the Tk event loop until a Tk variable is set or, if seconds
+        is given, until that much time has passed.  Unlike sleeping, the
+        window stays responsive and no CPU is used while waiting.'''
+        timer = window.after(max(1, round(seconds * 1000)), variable.set,
+                             variable.get()) if seconds else None
+        try:
+            window.wait_variable(variable)
+        except TclError:       # Tk commands are gone once the main window
+            return             # is destroyed
+        if timer:
+            window.after_cancel(timer)
     
 if __name__ == '__main__':
     import random, glob, os, argparse
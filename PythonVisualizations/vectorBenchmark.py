@@ -0,0 +1,115 @@
+__doc__ = """
+Micro-benchmark of the coordinate arithmetic in common visualization
+workloads.  Each workload is timed with the 2-D fast paths of vector
+and with the general vector operations that map over coordinate tuples
+of any length.  The workloads repeat the calculations of
+BinaryTreeBase.nodeCenter and nodeShapeCoordinates, GraphBase.edgeCoords,
+and the per-step moves of the Visualization.moveItems* methods, including
+the trajectories computed without NumPy.
+"""
+
+import argparse, timeit
+
+try:
+    import coordinates
+    from coordinates import *
+except ModuleNotFoundError:
+    from . import coordinates
+    from .coordinates import *
+
+class generalVector(vector):
+    'A vector that always uses the general operations, even for 2-D'
+    __slots__ = ()
+
+def nodeCenters(V, nodes=255, treeWidth=800, levelGap=65, radius=18):
+    'Compute centers and shape coordinates of nodes in a binary tree'
+    treeObjectBox = (10, 10, 50, 40)
+    for node in range(-1, nodes):
+        if node < 0:
+            center = V(V(treeObjectBox[:2]) + V(treeObjectBox[2:])) / 2
+        else:
+            x, y, i = 0, 0, node
+            while 0 < i:
+                x = x / 2 + treeWidth / (4 if i % 2 == 0 else -4)
+                y += levelGap
+                i = (i - 1) // 2
+            center = (400 + x, 40 + y)
+        offset = V(radius, radius)
+        (V(center) - offset) + (V(center) + offset)
+
+def edgeCoords(V, edges=200, removeRadius=18):
+    'Compute the curved edge coordinates between pairs of vertices'
+    for j in range(edges):
+        base, tip = (j * 7 % 500, j * 13 % 300), (j * 11 % 500, j * 3 % 300 + 1)
+        midPoint = V(V(base) + V(tip)) / 2
+        delta = V(tip) - V(base)
+        offset = V(V(V(delta).rotate(-90)).unit()) * removeRadius
+        inflection = V(midPoint) + V(offset)
+        V(inflection) + V(offset)
+        V(base) + V(V(V(V(inflection) - V(base)).unit()) * removeRadius)
+        V(tip) + V(V(V(V(inflection) - V(tip)).unit()) * removeRadius)
+
+def moveItems(V, items=100, steps=20):
+    'Compute the moves of items going to new positions in steps'
+    fromPositions = [(j * 5, j * 3) for j in range(items)]
+    toPositions = [(j * 3 + 100, 400 - j) for j in range(items)]
+    moveBy = [V(V(toPos) - V(fromPos)) / steps
+              for fromPos, toPos in zip(fromPositions, toPositions)]
+    for step in range(steps):
+        [V(delta).len2() >= 1 for delta in moveBy]
+        fromPositions = [V(pos) + V(delta)
+                         for pos, delta in zip(fromPositions, moveBy)]
+
+def trajectories(V, items=100, steps=20):
+    'Compute linear and curved trajectories for items without NumPy'
+    starts = [(j * 5, j * 3, j * 5 + 20, j * 3 + 20) for j in range(items)]
+    deltas = [(j % 7, -(j % 5), j % 7, -(j % 5)) for j in range(items)]
+    ends = [(j * 3 + 100, 400 - j) for j in range(items)]
+    numpy, coordinates._np = coordinates._np, None
+    try:
+        if V is vector:
+            list(linearTrajectory(starts, deltas, steps))
+            list(curveTrajectory([s[:2] for s in starts], ends, 45, steps))
+        else:           # The per-item calculations made before batches
+            for step in range(1, steps + 1):
+                [V(start) + V(V(delta) * step)
+                 for start, delta in zip(starts, deltas)]
+            positions = [s[:2] for s in starts]
+            for step in range(steps):
+                toGo = steps - 1 - step
+                ang = 45 * toGo / steps
+                scale = 1 + abs(ang) / 180
+                moves = [V(V(V(end) - V(position)) /
+                           ((toGo + 1) / scale)).rotate(ang)
+                         for position, end in zip(positions, ends)]
+                positions = [V(position) + V(move)
+                             for position, move in zip(positions, moves)]
+    finally:
+        coordinates._np = numpy
+
+WORKLOADS = (nodeCenters, edgeCoords, moveItems, trajectories)
+
+def benchmark(repeat=5, number=20):
+    'Return the best times of each workload with fast and general vectors'
+    results = []
+    for workload in WORKLOADS:
+        times = [min(timeit.repeat(lambda: workload(V), repeat=repeat,
+                                   number=number))
+                 for V in (vector, generalVector)]
+        results.append((workload.__name__, *times))
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='Number of timings of each workload, keeping the best')
+    parser.add_argument(
+        '-n', '--number', type=int, default=20,
+        help='Number of runs of the workload per timing')
+    args = parser.parse_args()
+    print('{:14s} {:>10s} {:>10s} {:>8s}'.format(
+        'Workload', 'Fast (s)', 'General', 'Speedup'))
+    for name, fast, general in benchmark(args.repeat, args.number):
+        print('{:14s} {:10.4f} {:10.4f} {:7.2f}x'.format(
+            name, fast, general, general / fast))